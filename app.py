@@ -1,167 +1,121 @@
 import streamlit as st  # Framework utama untuk membangun web app interaktif
-import numpy as np  # Komputasi numerik & operasi matematika (untuk perhitungan optimasi)
-import matplotlib.pyplot as plt  # Visualisasi data (grafik solusi optimal)
-from io import BytesIO  # Menangani data biner (konversi gambar/PDF ke byte)
-from PIL import Image, ImageDraw, ImageFont  # Manipulasi gambar (buat logo/header)
-import base64  # Encode/decode gambar ke teks (untuk tampilkan di HTML)
-from streamlit.components.v1 import html  # Embed HTML custom di Streamlit
-from reportlab.pdfgen import canvas  # Generate PDF level rendah
-from reportlab.lib.pagesizes import letter  # Ukuran halaman standar PDF
-from reportlab.lib import colors  # Warna untuk PDF
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage  # Generate PDF level tinggi
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle  # Style teks PDF
-from reportlab.lib.units import inch  # Konversi satuan inci untuk layout PDF
-import tempfile  # Membuat file sementara (untuk penyimpanan plot sementara)
+import math  # Memeriksa batas sensitivitas yang tak hingga
+import time  # Mengukur durasi solve batch
+import os  # Konfigurasi port endpoint metrik
+from assets import header_base64, logo_base64  # Logo/header siap pakai dari folder assets/
+from metrics import REGISTRY, start_trace, timed  # Instrumentasi waktu per tahap (pustaka standar saja)
+# numpy, pandas, solver, matplotlib dan reportlab diimpor saat pertama kali dibutuhkan
+# (halaman Optimasi / ekspor PDF) agar proses baru cepat siap melayani
 
 # =============== FUNGSI UTILITAS ===============
-def mermaid(code: str, height=300) -> None:
-    """Render diagram Mermaid menggunakan komponen HTML"""
-    html(rf"""
-    <div class="mermaid" style="text-align: center;">
-        {code}
-    </div>
-    <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
-    <script>mermaid.initialize({{startOnLoad:true}});</script>
-    """, height=height)
-
-@st.cache_data
-def create_logo():
-    """Membuat logo aplikasi dengan caching"""
+def mermaid(code: str) -> None:
+    """Render diagram Mermaid sebagai SVG yang dirender di server (tanpa skrip di browser)"""
+    from diagrams import UnsupportedDiagram, mermaid_svg
     try:
-        img = Image.new('RGBA', (200, 80), (0,0,0,0))
-        draw = ImageDraw.Draw(img)
-        
-        # Background gradient
-        for i in range(80):
-            draw.line([(0,i), (200,i)], fill=(0, 100+i, 200))
-        
-        # Text
-        try:
-            font = ImageFont.truetype("arial.ttf", 24)
-        except:
-            font = ImageFont.load_default()
-        draw.text((50, 25), "LINEAR PROGRAMMING", fill=(255,255,255), font=font, stroke_width=2, stroke_fill=(0,0,0))
-        
-        buffered = BytesIO()
-        img.save(buffered, format="PNG")
-        return base64.b64encode(buffered.getvalue()).decode()
-    except Exception as e:
-        st.error(f"Error creating logo: {e}")
-        return ""
+        svg = mermaid_svg(code)
+    except UnsupportedDiagram as e:
+        # Tidak ada renderer di browser (jaringan tanpa internet): tampilkan sumbernya dengan jelas
+        st.error(f"Diagram tidak dapat dirender: {e}")
+        st.code(code.strip(), language="mermaid")
+        return
+    st.markdown(f'<div class="mermaid">{svg}</div>', unsafe_allow_html=True)
 
-@st.cache_data
-def create_header():
-    """Membuat header aplikasi dengan caching"""
-    try:
-        img = Image.new('RGB', (1000, 200), (70, 130, 180))
-        draw = ImageDraw.Draw(img)
-        
-        # Diagonal pattern
-        for i in range(-200, 1000, 30):
-            draw.line([(i,0), (i+200,200)], fill=(100,150,200), width=2)
-        
-        # Main title
-        try:
-            font = ImageFont.truetype("arial.ttf", 50)
-        except:
-            font = ImageFont.load_default()
-        draw.text((100, 60), "APLIKASI MODEL LINEAR PROGRAMMING", fill=(255,255,0), font=font)
-        
-        # Add logo (jika logo berhasil dibuat)
-        if LOGO_BASE64:
-            try:
-                logo_img = Image.open(BytesIO(base64.b64decode(LOGO_BASE64)))
-                logo_img = logo_img.resize((150,60))
-                img.paste(logo_img, (800, 20), logo_img)
-            except:
-                pass
-        
-        buffered = BytesIO()
-        img.save(buffered, format="JPEG")
-        return base64.b64encode(buffered.getvalue()).decode()
-    except Exception as e:
-        st.error(f"Error creating header: {e}")
-        return ""
+def spooled_download(write, max_size=16 * 1024 * 1024) -> bytes:
+    """Menulis isi unduhan dengan ``write(fileobj)`` ke file sementara lalu mengembalikan bytes-nya
 
-@st.cache_data
-def create_pdf_report(optimal_point, optimal_value, parameters, plot_bytes):
-    """Membuat laporan PDF dari hasil optimasi"""
-    try:
-        # Buat file PDF sementara
-        pdf_buffer = BytesIO()
-        doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
-        
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = styles['Title']
-        heading_style = styles['Heading2']
-        body_style = styles['BodyText']
-        
-        # Konten PDF
-        content = []
-        
-        # Judul
-        content.append(Paragraph("Laporan Optimasi Produksi", title_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Informasi Parameter
-        content.append(Paragraph("Parameter Produksi:", heading_style))
-        param_text = f"""
-        <b>Produk 1:</b><br/>
-        - Keuntungan/unit: Rp{parameters['p1']:,}<br/>
-        - Waktu produksi: {parameters['t1']} jam<br/>
-        - Maksimal permintaan: {parameters['max1']} unit<br/><br/>
-        
-        <b>Produk 2:</b><br/>
-        - Keuntungan/unit: Rp{parameters['p2']:,}<br/>
-        - Waktu produksi: {parameters['t2']} jam<br/>
-        - Maksimal permintaan: {parameters['max2']} unit<br/><br/>
-        
-        <b>Total waktu tersedia:</b> {parameters['total_time']} jam
-        """
-        content.append(Paragraph(param_text, body_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Hasil Optimasi
-        content.append(Paragraph("Hasil Optimasi:", heading_style))
-        result_text = f"""
-        <b>Solusi Optimal:</b><br/>
-        - Produk 1 (x₁): {optimal_point[0]:.0f} unit<br/>
-        - Produk 2 (x₂): {optimal_point[1]:.0f} unit<br/>
-        - Keuntungan Maksimum: Rp{optimal_value:,.0f}
-        """
-        content.append(Paragraph(result_text, body_style))
-        content.append(Spacer(1, 0.25*inch))
-        
-        # Tambahkan plot ke PDF
-        if plot_bytes:
-            try:
-                temp_img = tempfile.NamedTemporaryFile(suffix='.png', delete=False)
-                temp_img.write(plot_bytes.getvalue())
-                temp_img.close()
-                
-                img = RLImage(temp_img.name, width=5*inch, height=3*inch)
-                content.append(Paragraph("Visualisasi Solusi:", heading_style))
-                content.append(img)
-            except Exception as e:
-                st.error(f"Error adding plot to PDF: {e}")
-        
-        # Build PDF
-        doc.build(content)
-        
-        return pdf_buffer.getvalue()
-    except Exception as e:
-        st.error(f"Error generating PDF: {e}")
+    File spooled pindah ke disk setelah ``max_size`` byte sehingga proses
+    pembuatan (PDF/ZIP/CSV batch) tidak menumpuk salinan di memori; file
+    dihapus begitu ditutup. Streamlit sendiri tetap membutuhkan bytes utuh.
+    """
+    import tempfile
+    with tempfile.SpooledTemporaryFile(max_size=max_size) as f:
+        write(f)
+        f.seek(0)
+        return f.read()
+
+@st.cache_resource
+def get_solve_cache():
+    """Cache LRU hasil solve yang dipakai bersama oleh semua sesi"""
+    from cache import LRUCache
+    cache = LRUCache(maxsize=256)
+    REGISTRY.gauge("solve_cache", lambda: {(("stat", k),): v for k, v in cache.stats().items()})
+    return cache
+
+@st.cache_resource
+def get_figure_pool():
+    """Pool Figure matplotlib (OO API, canvas Agg) yang dipakai bersama oleh semua sesi
+
+    Ukuran diatur dengan FIGURE_POOL_SIZE (default 4); RENDER_PROCESSES > 0
+    mengalihkan render PNG ke process pool.
+    """
+    from plotting import FigurePool
+    pool = FigurePool(size=int(os.environ.get("FIGURE_POOL_SIZE", "4")),
+                      processes=int(os.environ.get("RENDER_PROCESSES", "0")))
+    REGISTRY.gauge("figure_pool", lambda: {(("stat", k),): v for k, v in pool.stats().items()})
+    return pool
+
+@st.cache_resource
+def get_scenario_store():
+    """Riwayat skenario SQLite yang dipakai bersama oleh semua sesi"""
+    from store import ScenarioStore
+    return ScenarioStore()
+
+def load_scenario(scenario_id):
+    """Callback riwayat: isi ulang parameter dan tampilkan hasil tersimpan"""
+    stored = get_scenario_store().load(scenario_id)
+    if stored is None:
+        return
+    for name, key in PARAMETER_WIDGET_KEYS.items():
+        value = stored.parameters[name]
+        st.session_state[key] = int(value) if float(value).is_integer() else value
+    st.session_state.integer_mode = stored.integer_mode
+    st.session_state.active_scenario = ({name: st.session_state[key] for name, key in PARAMETER_WIDGET_KEYS.items()}, stored.integer_mode)
+    st.session_state.current_page = "Optimasi"
+
+@st.cache_data(max_entries=4, show_spinner="Membaca model...")
+def load_model_file(data: bytes, filename: str):
+    """Model MPS/LP yang diunggah beserta lama parse (di-cache per isi file)"""
+    from modelfile import detect_format, parse_model
+    start = time.perf_counter()
+    imported = parse_model(data, detect_format(filename))
+    imported.name = imported.name or os.path.splitext(filename)[0]
+    return imported, time.perf_counter() - start
+
+@st.cache_resource
+def start_metrics_endpoint():
+    """Endpoint /metrics (Prometheus) dan /metrics.json, sekali per proses server
+
+    Port diatur dengan variabel lingkungan METRICS_PORT (default 9464, 0 = nonaktif).
+    """
+    from metrics import start_http_server
+    port = int(os.environ.get("METRICS_PORT", "9464"))
+    if port <= 0:
         return None
+    try:
+        return start_http_server(port, os.environ.get("METRICS_HOST", "127.0.0.1"))
+    except OSError:
+        return None  # Port sudah dipakai (misal replika lain); metrik tetap ada di panel debug
 
 # =============== KONFIGURASI APLIKASI ===============
-# Pindahkan inisialisasi LOGO_BASE64 dan HEADER_BASE64 setelah definisi fungsi
+MAX_BATCH_REPORTS = 500  # Batas jumlah laporan PDF pada ekspor batch
+MAX_RESULT_SETS = 8  # Jumlah result set batch (file .npy) yang disimpan di disk
+INTEGER_TIME_LIMIT = 10.0  # Batas waktu branch-and-bound (detik) di halaman Optimasi
+# Nama parameter -> key widget number_input di form Parameter Produksi
+PARAMETER_WIDGET_KEYS = {'p1': 'p1', 't1': 't1', 'max1': 'max1', 'p2': 'p2', 't2': 't2', 'max2': 'max2', 'total_time': 'total'}
+# Cara simplex menyelesaikan model (LPResult.method) untuk ditampilkan
+SOLVE_METHOD_LABELS = {
+    'cold': "dua fase dari awal",
+    'warm_dual': "dual simplex dari basis sebelumnya",
+    'warm_primal': "primal simplex dari basis sebelumnya",
+    'warm_dual_primal': "dual lalu primal simplex dari basis sebelumnya",
+    'interior': "interior-point (titik interior, tanpa crossover)",
+    'interior_crossover': "interior-point lalu crossover ke titik pojok",
+}
 try:
-    LOGO_BASE64 = create_logo()
-    HEADER_BASE64 = create_header()
-except:
+    LOGO_BASE64 = logo_base64()
+except Exception as e:
+    st.error(f"Error creating logo: {e}")
     LOGO_BASE64 = ""
-    HEADER_BASE64 = ""
 
 st.set_page_config(
     layout="wide", 
@@ -172,6 +126,8 @@ st.set_page_config(
 if 'current_page' not in st.session_state:
     st.session_state.current_page = "Beranda"
 
+metrics_server = start_metrics_endpoint()
+
 def change_page(page_name):
     st.session_state.current_page = page_name
 
@@ -185,6 +141,7 @@ with st.sidebar:
     st.button("📊 Optimasi Produksi", on_click=change_page, args=("Optimasi",), use_container_width=True)
     
     st.markdown("---")
+    st.checkbox("🛠️ Panel debug performa", key="debug_panel")
     st.info("""
     **Versi 2.2.1**  
     Dikembangkan oleh:  
@@ -196,7 +153,10 @@ with st.sidebar:
 # =============== HALAMAN BERANDA ===============
 if st.session_state.current_page == "Beranda":
     st.title("Selamat Datang di Aplikasi Optimasi Produksi")
-    st.image(f"data:image/jpeg;base64,{HEADER_BASE64}", use_container_width=True)
+    try:
+        st.image(f"data:image/jpeg;base64,{header_base64()}", use_container_width=True)
+    except Exception as e:
+        st.error(f"Error creating header: {e}")
     
     st.markdown("""
     ## 📋 Panduan Penggunaan
@@ -298,6 +258,17 @@ elif st.session_state.current_page == "Pengertian":
 
 # =============== HALAMAN OPTIMASI ===============
 elif st.session_state.current_page == "Optimasi":
+    import numpy as np
+    import pandas as pd
+    from batch import PARAMETER_NAMES, solve_two_product_batch
+    from cache import normalize_parameters
+    from production import profit_frontier, solve_production
+    from solver import LPResult, resolve_lp
+    from interior import choose_solver, solve as solve_model
+    from geometry import model_region
+    from plotting import EXPORT_DPI, render_export, render_preview
+    from solver import two_product_model
+    
     st.title("📈 OPTIMASI PRODUKSI")
     
     with st.expander("📚 Contoh Kasus", expanded=True):
@@ -339,7 +310,10 @@ elif st.session_state.current_page == "Optimasi":
                     - Keuntungan maksimum: Rp4.800.000/minggu
                     """)
                 
-                fig, ax = plt.subplots(figsize=(10,6))
+                from plotting import new_figure
+                
+                fig = new_figure()
+                ax = fig.add_subplot()
                 x = np.linspace(0, 40, 100)
                 y1 = (120 - 3*x)/2
                 ax.plot(x, y1, 'b-', label='3x₁ + 2x₂ ≤ 120')
@@ -353,204 +327,628 @@ elif st.session_state.current_page == "Optimasi":
                 ax.grid(True)
                 st.pyplot(fig)
 
-        with st.expander("🔧 PARAMETER PRODUKSI", expanded=True):
-            col1, col2 = st.columns(2)
-            with col1:
-                st.subheader("Produk 1")
-                p1 = st.number_input("Keuntungan/unit (Rp)", min_value=0, key="p1")
-                t1 = st.number_input("Waktu produksi (jam)", min_value=0, key="t1")
-                max1 = st.number_input("Maksimal permintaan", min_value=0, key="max1")
-            with col2:
-                st.subheader("Produk 2")
-                p2 = st.number_input("Keuntungan/unit (Rp)", min_value=0, key="p2")
-                t2 = st.number_input("Waktu produksi (jam)", min_value=0, key="t2")
-                max2 = st.number_input("Maksimal permintaan", min_value=0, key="max2")
-            
-            total_time = st.number_input("Total waktu tersedia (jam)", min_value=0, key="total")
+        @st.fragment
+        @timed("optimasi.fragment")
+        def optimasi_solver():
+            """Form parameter dan hasil; submit hanya menjalankan ulang fragment ini"""
+            # Form: mengetik di input tidak memicu rerun, semua nilai dikirim sekaligus saat HITUNG
+            with st.expander("🔧 PARAMETER PRODUKSI", expanded=True), st.form("parameter_form", border=False):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.subheader("Produk 1")
+                    p1 = st.number_input("Keuntungan/unit (Rp)", min_value=0, key="p1")
+                    t1 = st.number_input("Waktu produksi (jam)", min_value=0, key="t1")
+                    max1 = st.number_input("Maksimal permintaan", min_value=0, key="max1")
+                with col2:
+                    st.subheader("Produk 2")
+                    p2 = st.number_input("Keuntungan/unit (Rp)", min_value=0, key="p2")
+                    t2 = st.number_input("Waktu produksi (jam)", min_value=0, key="t2")
+                    max2 = st.number_input("Maksimal permintaan", min_value=0, key="max2")
+                
+                total_time = st.number_input("Total waktu tersedia (jam)", min_value=0, key="total")
+                integer_mode = st.checkbox(
+                    "🔢 Produksi dalam unit utuh (solusi bilangan bulat)",
+                    key="integer_mode",
+                    help="Mencari rencana produksi bulat dengan branch-and-bound, bukan membulatkan solusi LP"
+                )
+                submitted = st.form_submit_button("🧮 HITUNG SOLUSI DETAIL", type="primary", use_container_width=True)
 
-        if st.button("🧮 HITUNG SOLUSI DETAIL", type="primary", use_container_width=True):
-            with st.spinner('Menghitung solusi optimal...'):
+            if submitted:
                 # Validasi input
                 if p1 == 0 and p2 == 0:
                     st.error("Keuntungan produk tidak boleh 0 semua")
-                    st.stop()
-                if t1 == 0 and t2 == 0:
+                elif t1 == 0 and t2 == 0:
                     st.error("Waktu produksi tidak boleh 0 semua")
-                    st.stop()
-                if total_time == 0:
+                elif total_time == 0:
                     st.error("Total waktu tersedia tidak boleh 0")
-                    st.stop()
-                
-                # Langkah 1: Hitung titik pojok
-                st.markdown("---")
-                st.subheader("🔍 Proses Perhitungan")
-                
-                with st.expander("Langkah 1: Identifikasi Titik Pojok", expanded=True):
+                else:
+                    # Skenario aktif bertahan di session_state sehingga hasil tetap tampil saat widget lain berubah
+                    parameters = {name: st.session_state[key] for name, key in PARAMETER_WIDGET_KEYS.items()}
+                    st.session_state.active_scenario = (parameters, integer_mode)
+
+            if st.session_state.get("active_scenario") is not None:
+                with st.spinner('Menghitung solusi optimal...'):
+                    trace = start_trace("hitung")
+                    parameters, solve_integer = st.session_state.active_scenario
+                    REGISTRY.inc("hitung_requests_total", mode="bulat" if solve_integer else "lp")
+                    p1, t1, max1, p2, t2, max2, total_time = (parameters[name] for name in PARAMETER_NAMES)
+                    trace.lap("validasi")
+                    
+                    # Ambil hasil dari cache LRU, lalu dari riwayat SQLite, baru hitung ulang jika belum ada
+                    solve_cache = get_solve_cache()
+                    scenario_store = get_scenario_store()
+
+                    solve_key = normalize_parameters(parameters) + (solve_integer,)
+
+                    def load_or_solve(parameters=parameters, solve_integer=solve_integer):
+                        stored = scenario_store.get(parameters, solve_integer)
+                        if stored is not None:
+                            # Pratinjau tersimpan berupa SVG (riwayat versi lama: PNG)
+                            preview = stored.preview_png
+                            if preview is not None and preview.startswith(b"<svg"):
+                                preview = preview.decode()
+                            return {'solution': stored.solution, 'preview': preview, 'preview_seconds': None}
+                        # Basis optimal solve terakhir di sesi ini: perubahan ruas kanan/keuntungan saja
+                        # diselesaikan ulang dengan dual/primal simplex, bukan dari awal
+                        solution = solve_production(parameters, integer=solve_integer, time_limit=INTEGER_TIME_LIMIT,
+                                                    warm_start=st.session_state.get("lp_warm_start"))
+                        # Cara solve bergantung pada basis sesi ini, jadi dicatat per sesi; entri cache
+                        # dipakai bersama dan sesi lain tidak menampilkannya
+                        st.session_state.solve_method = (solve_key, solution['iterations'], solution.get('method', 'cold'))
+                        return {'solution': solution}
+
+                    cache_entry = solve_cache.get_or_compute(solve_key, load_or_solve)
+                    solution = cache_entry['solution']
+                    if solution['status'] != 'optimal':
+                        st.error(f"Solver gagal menemukan solusi optimal: {solution['message']}")
+                        st.stop()
+                    if solution.get('basis') is not None:
+                        st.session_state.lp_warm_start = (parameters, solution['basis'])
+                    
+                    trace.lap("solve")
+                    
+                    optimal_point = solution['optimal_point']
+                    optimal_value = solution['optimal_value']
+                    # Titik pojok daerah feasible yang sebenarnya (poligon eksak), beserta kendala aktifnya
+                    region = model_region(two_product_model(*normalize_parameters(parameters)))
+                    vertex_names = region.vertex_names()
+                    vertex_values = [p1 * x1 + p2 * x2 for x1, x2 in region.vertices]
+
+                    # Langkah 1: Tampilkan titik pojok
+                    st.markdown("---")
+                    st.subheader("🔍 Proses Perhitungan")
+                    
+                    with st.expander("Langkah 1: Identifikasi Titik Pojok", expanded=True):
+                        if region.empty:
+                            st.write("Daerah feasible kosong.")
+                        cols = st.columns(2)
+                        for k, ((x1, x2), names) in enumerate(zip(region.vertices, vertex_names)):
+                            with cols[k % 2]:
+                                st.markdown(f"**Titik {k + 1}** ({names}):")
+                                st.latex(fr"x_1 = {x1:.1f}, x_2 = {x2:.1f}")
+
+                    # Langkah 2: Hitung nilai Z
+                    with st.expander("Langkah 2: Hitung Nilai Fungsi Tujuan", expanded=True):
+                        rows = [fr"Z_{{{k + 1}}} &= {p1} \times {x1:.1f} + {p2} \times {x2:.1f} = \text{{Rp}}{z:,.0f}"
+                                for k, ((x1, x2), z) in enumerate(zip(region.vertices, vertex_values))]
+                        cols = st.columns(2)
+                        half = -(-len(rows) // 2)
+                        for col, part in zip(cols, (rows[:half], rows[half:])):
+                            if part:
+                                col.latex(r"\begin{aligned}" + r" \\ ".join(part) + r"\end{aligned}")
+
+                    # Langkah 3: Tentukan solusi optimal (hasil mesin LP revised simplex)
+                    with st.expander("Langkah 3: Tentukan Solusi Optimal", expanded=True):
+                        solve_method = st.session_state.get("solve_method")
+                        if solve_method is not None and solve_method[0] == solve_key:
+                            iterations_text = f"{solve_method[1]} ({SOLVE_METHOD_LABELS[solve_method[2]]})"
+                        else:
+                            iterations_text = "tidak dihitung ulang (hasil dari cache bersama/riwayat)"
+                        optimal_vertex = next((f"Titik {k + 1}" for k, vertex in enumerate(region.vertices)
+                                               if np.allclose(vertex, optimal_point)), "bukan titik pojok")
+                        st.markdown(f"""
+                        **Titik Optimal**: {optimal_vertex} ({optimal_point[0]:.1f}, {optimal_point[1]:.1f})  
+                        **Alasan**: Memberikan nilai Z tertinggi (Rp{optimal_value:,.0f})  
+                        **Iterasi simplex**: {iterations_text}
+                        """)
+                        integer_info = solution['integer']
+                        if integer_info is not None:
+                            relaxation_point = solution['relaxation_point']
+                            st.markdown(f"""
+                            **Solusi bilangan bulat (branch-and-bound):**  
+                            - Relaksasi LP: ({relaxation_point[0]:.2f}, {relaxation_point[1]:.2f}) = Rp{solution['relaxation_value']:,.0f}
+                            - Node dieksplorasi: {integer_info['nodes']} ({integer_info['pruned']} dipangkas)
+                            - Gap optimalitas: {integer_info['gap']:.4%}
+                            - Waktu: {integer_info['seconds']*1000:,.1f} ms
+                            """)
+                            if integer_info['status'] != 'optimal':
+                                st.warning(integer_info['message'])
+
+                    trace.lap("latex")
+
+                    # Tampilkan hasil akhir
+                    st.markdown("---")
+                    st.header("📝 HASIL PERHITUNGAN")
+                    
                     cols = st.columns(2)
                     with cols[0]:
-                        st.markdown("""
-                        **Titik A (Origin):**
+                        st.subheader("Solusi Optimal")
+                        st.markdown(f"""
+                        - **Produk 1 (x₁):** {optimal_point[0]:.0f} unit
+                        - **Produk 2 (x₂):** {optimal_point[1]:.0f} unit
+                        - **Keuntungan Maksimum:** Rp{optimal_value:,.0f}
                         """)
-                        st.latex(r"x_1 = 0, x_2 = 0")
                         
-                        st.markdown("""
-                        **Titik B (Maks Produk 1):**
-                        """)
-                        st.latex(fr"x_1 = {max1}, x_2 = 0")
-                        
-                        st.markdown("""
-                        **Titik C (Interseksi Kendala):**
-                        """)
-                        st.latex(fr"{t1}x_1 + {t2}x_2 = {total_time}")
-                        st.latex(fr"x_1 = {max1}")
-                        st.latex(fr"x_2 = \frac{{{total_time} - {t1} \times {max1}}}{{{t2}}} = {(total_time - t1*max1)/t2:.1f}")
+                        st.subheader("Detail Titik Pojok")
+                        for (x1, x2), names, z in zip(region.vertices, vertex_names, vertex_values):
+                            mark = " ⭐" if np.allclose((x1, x2), optimal_point) else ""
+                            st.write(f"({x1:.1f}, {x2:.1f}) = Rp{z:,.0f}{mark}  \n*{names}*")
+                        if region.empty:
+                            st.write("Daerah feasible kosong.")
                     
                     with cols[1]:
-                        st.markdown("""
-                        **Titik D (Interseksi Kendala):**
-                        """)
-                        st.latex(fr"{t1}x_1 + {t2}x_2 = {total_time}")
-                        st.latex(fr"x_2 = {max2}")
-                        st.latex(fr"x_1 = \frac{{{total_time} - {t2} \times {max2}}}{{{t1}}} = {(total_time - t2*max2)/t1:.1f}")
+                        st.subheader("Visualisasi Grafik")
+                        # Pratinjau SVG dari poligon eksak untuk layar; PNG 300 dpi baru dibuat saat PDF diminta
+                        if cache_entry.get('preview') is None:
+                            cache_entry['preview'], cache_entry['preview_seconds'] = render_preview(parameters, optimal_point)
+                            # Simpan ke riwayat setelah solusi dan pratinjau lengkap
+                            scenario_store.save(parameters, solve_integer, solution, cache_entry['preview'].encode())
+                        st.image(cache_entry['preview'], use_container_width=True)
                         
                         st.markdown("""
-                        **Titik E (Maks Produk 2):**
+                        **Keterangan Grafik:**
+                        - **Area biru**: Kombinasi produksi yang memungkinkan
+                        - **Titik hitam**: Titik pojok daerah feasible
+                        - **Titik merah**: Solusi optimal
+                        - **Garis putus-putus**: Batas permintaan pasar
                         """)
-                        st.latex(fr"x_1 = 0, x_2 = \min\left(\frac{{{total_time}}}{{{t2}}}, {max2}\right) = {min(total_time/t2, max2):.1f}")
-
-                # Langkah 2: Hitung nilai Z
-                titik_A = (0, 0)
-                titik_B = (max1, 0)
-                titik_C = (max1, min((total_time - t1*max1)/t2, max2))
-                titik_D = (min((total_time - t2*max2)/t1, max1), max2)
-                titik_E = (0, min(total_time/t2, max2))
-                
-                nilai_Z = [
-                    p1*titik_A[0] + p2*titik_A[1],
-                    p1*titik_B[0] + p2*titik_B[1],
-                    p1*titik_C[0] + p2*titik_C[1],
-                    p1*titik_D[0] + p2*titik_D[1],
-                    p1*titik_E[0] + p2*titik_E[1]
-                ]
-                
-                with st.expander("Langkah 2: Hitung Nilai Fungsi Tujuan", expanded=True):
-                    cols = st.columns(2)
-                    with cols[0]:
-                        st.latex(fr"""
-                        \begin{{aligned}}
-                        Z_A &= {p1} \times 0 + {p2} \times 0 = \text{{Rp}}0 \\
-                        Z_B &= {p1} \times {max1} + {p2} \times 0 = \text{{Rp}}{p1*max1:,} \\
-                        Z_C &= {p1} \times {titik_C[0]:.1f} + {p2} \times {titik_C[1]:.1f} = \text{{Rp}}{nilai_Z[2]:,.0f}
-                        \end{{aligned}}
+
+                    trace.lap("hasil_grafik")
+
+                    sensitivity = solution['sensitivity']
+                    with st.expander("📐 Analisis Sensitivitas", expanded=False):
+                        st.markdown("""
+                        **Harga bayangan** menunjukkan tambahan keuntungan untuk setiap tambahan 1 unit
+                        ruas kanan kendala. Selama nilai berada di dalam rentang batas bawah–batas atas,
+                        titik optimal (basis) tidak berubah sehingga tidak perlu menghitung ulang.
                         """)
-                    with cols[1]:
-                        st.latex(fr"""
-                        \begin{{aligned}}
-                        Z_D &= {p1} \times {titik_D[0]:.1f} + {p2} \times {max2} = \text{{Rp}}{nilai_Z[3]:,.0f} \\
-                        Z_E &= {p1} \times 0 + {p2} \times {titik_E[1]:.1f} = \text{{Rp}}{nilai_Z[4]:,.0f}
-                        \end{{aligned}}
+                        if solution['integer'] is not None:
+                            st.caption("Dihitung dari relaksasi LP; harga bayangan tidak berlaku langsung untuk solusi bilangan bulat.")
+                        st.markdown("**Kendala (ruas kanan)**")
+                        st.dataframe(pd.DataFrame(sensitivity.constraint_table()), hide_index=True, use_container_width=True)
+                        st.markdown("**Koefisien fungsi tujuan (keuntungan/unit)**")
+                        st.dataframe(pd.DataFrame(sensitivity.variable_table()), hide_index=True, use_container_width=True)
+
+                    with st.expander("📈 Frontier Rasio Keuntungan", expanded=False):
+                        st.markdown("""
+                        Rencana optimal untuk **setiap** keuntungan/unit produk 1 (p2 tetap), dihitung
+                        dalam satu kali jalan parametric simplex: di setiap titik patah rencana berpindah
+                        ke titik pojok tetangga.
                         """)
+                        # Solusi dari riwayat/cache lama belum memiliki frontier
+                        if cache_entry.get('frontier') is None:
+                            start = time.perf_counter()
+                            rows, frontier = profit_frontier(parameters)
+                            cache_entry['frontier'] = (rows, frontier.status, frontier.pivots, time.perf_counter() - start)
+                        rows, frontier_status, pivots, frontier_seconds = cache_entry['frontier']
+                        if solution['integer'] is not None:
+                            st.caption("Dihitung dari relaksasi LP (tanpa syarat bilangan bulat).")
+                        if rows:
+                            def ratio_text(value):
+                                return "-" if value is None else ("∞" if math.isinf(value) else f"{value:,.3f}")
+                            st.dataframe(pd.DataFrame({
+                                "Rasio p1/p2 dari": [ratio_text(row['ratio_from']) for row in rows],
+                                "sampai": [ratio_text(row['ratio_to']) for row in rows],
+                                "p1 dari (Rp)": [f"{row['p1_from']:,.0f}" for row in rows],
+                                "p1 sampai (Rp)": ["∞" if math.isinf(row['p1_to']) else f"{row['p1_to']:,.0f}" for row in rows],
+                                "x₁": [round(row['x1'], 2) for row in rows],
+                                "x₂": [round(row['x2'], 2) for row in rows],
+                                "Keuntungan di awal rentang": [f"Rp{row['profit_from']:,.0f}" for row in rows],
+                                "Parameter saat ini": ["✅" if row['current'] else "" for row in rows],
+                            }), hide_index=True, use_container_width=True)
 
-                # Langkah 3: Tentukan solusi optimal
-                optimal_idx = np.argmax(nilai_Z)
-                optimal_point = [titik_A, titik_B, titik_C, titik_D, titik_E][optimal_idx]
-                optimal_value = nilai_Z[optimal_idx]
-                
-                with st.expander("Langkah 3: Tentukan Solusi Optimal", expanded=True):
-                    st.markdown(f"""
-                    **Titik Optimal**: Pekerjaan {['A','B','C','D','E'][optimal_idx]}  
-                    **Alasan**: Memberikan nilai Z tertinggi (Rp{optimal_value:,.0f})
-                    """)
+                            # Keuntungan optimal linear sepotong-sepotong: cukup titik patah dan satu titik di ujung
+                            last = rows[-1]
+                            end = max(2 * last['p1_from'], 1.5 * p1, 1.0) if math.isinf(last['p1_to']) else last['p1_to']
+                            p1_points = [row['p1_from'] for row in rows] + [end]
+                            profits = [row['profit_from'] for row in rows] + [last['profit_from'] + (end - last['p1_from']) * last['x1']]
+                            st.line_chart(pd.DataFrame({"Keuntungan/unit produk 1 (Rp)": p1_points,
+                                                        "Keuntungan optimal (Rp)": profits}),
+                                          x="Keuntungan/unit produk 1 (Rp)", y="Keuntungan optimal (Rp)")
+                        if frontier_status != 'optimal':
+                            st.warning(f"Frontier berhenti: status {frontier_status}")
+                        st.caption(f"{max(len(rows) - 1, 0)} titik patah · {pivots} pivot · {frontier_seconds*1000:,.1f} ms")
 
-                # Tampilkan hasil akhir
-                st.markdown("---")
-                st.header("📝 HASIL PERHITUNGAN")
-                
-                cols = st.columns(2)
-                with cols[0]:
-                    st.subheader("Solusi Optimal")
-                    st.markdown(f"""
-                    - **Produk 1 (x₁):** {optimal_point[0]:.0f} unit
-                    - **Produk 2 (x₂):** {optimal_point[1]:.0f} unit
-                    - **Keuntungan Maksimum:** Rp{optimal_value:,.0f}
-                    """)
-                    
-                    st.subheader("Detail Titik Pojok")
-                    st.write(f"A(0,0) = Rp{nilai_Z[0]:,.0f}")
-                    st.write(f"B({max1},0) = Rp{nilai_Z[1]:,.0f}")
-                    st.write(f"C({titik_C[0]:.1f},{titik_C[1]:.1f}) = Rp{nilai_Z[2]:,.0f}")
-                    st.write(f"D({titik_D[0]:.1f},{max2}) = Rp{nilai_Z[3]:,.0f}")
-                    st.write(f"E(0,{titik_E[1]:.1f}) = Rp{nilai_Z[4]:,.0f}")
-                
-                with cols[1]:
-                    st.subheader("Visualisasi Grafik")
-                    fig, ax = plt.subplots(figsize=(10,6))
-                    
-                    # Plot feasible region
-                    x = np.linspace(0, max1*1.2 if max1 > 0 else 40, 100)
-                    y = (total_time - t1*x)/t2 if t2 != 0 else np.zeros_like(x)
-                    ax.plot(x, y, 'b-', linewidth=2, label=f'{t1}x₁ + {t2}x₂ ≤ {total_time}')
-                    ax.fill_between(x, 0, np.minimum(y, max2 if max2 > 0 else np.inf), where=(x<=max1 if max1 > 0 else True), color='lightblue', alpha=0.3)
-                    
-                    # Plot constraints
-                    if max1 > 0:
-                        ax.axvline(max1, color='red', linestyle='--', label=f'x₁ ≤ {max1}')
-                    if max2 > 0:
-                        ax.axhline(max2, color='green', linestyle='--', label=f'x₂ ≤ {max2}')
-                    
-                    # Plot optimal point
-                    ax.plot(optimal_point[0], optimal_point[1], 'ro', markersize=10, label='Solusi Optimal')
-                    ax.annotate(f'Optimal\n({optimal_point[0]:.0f}, {optimal_point[1]:.0f})', 
-                                xy=optimal_point, 
-                                xytext=(optimal_point[0]+5, optimal_point[1]+5),
-                                arrowprops=dict(facecolor='black', arrowstyle='->'))
+                    trace.lap("sensitivitas")
+
+                    # Buat dan tampilkan tombol download PDF
+                    st.markdown("---")
+                    st.subheader("📤 Ekspor Hasil")
                     
-                    ax.set_xlabel('Produk 1 (x₁)', fontsize=12)
-                    ax.set_ylabel('Produk 2 (x₂)', fontsize=12)
-                    ax.legend()
-                    ax.grid(True, linestyle='--', alpha=0.6)
+                    def build_pdf(entry=cache_entry, parameters=parameters):
+                        """Membuat PDF (dan PNG 300 dpi) hanya saat tombol unduh diklik"""
+                        from report import create_pdf_report
+                        if entry.get('export_png') is None:
+                            entry['export_png'], entry['export_seconds'] = render_export(parameters, entry['solution']['optimal_point'], get_figure_pool())
+                        if entry.get('pdf') is None:
+                            solution = entry['solution']
+                            entry['pdf'] = create_pdf_report(solution['optimal_point'], solution['optimal_value'], parameters, entry['export_png'], solution['sensitivity'])
+                        return entry['pdf']
                     
-                    # Simpan plot ke buffer untuk PDF
-                    plot_buffer = BytesIO()
-                    plt.savefig(plot_buffer, format='png', bbox_inches='tight', dpi=300)
-                    plt.close()
-                    st.pyplot(fig)
+                    cache_stats = solve_cache.stats()
+                    st.caption(f"Cache solusi: {cache_stats['hits']} hit, {cache_stats['misses']} miss, {cache_stats['size']}/{cache_stats['maxsize']} entri")
                     
-                    st.markdown("""
-                    **Keterangan Grafik:**
-                    - **Area biru**: Kombinasi produksi yang memungkinkan
-                    - **Titik merah**: Solusi optimal
-                    - **Garis putus-putus**: Batas permintaan pasar
-                    """)
-
-                # Buat dan tampilkan tombol download PDF
-                st.markdown("---")
-                st.subheader("📤 Ekspor Hasil")
-                
-                # Siapkan data untuk PDF
-                parameters = {
-                    'p1': p1,
-                    'p2': p2,
-                    't1': t1,
-                    't2': t2,
-                    'max1': max1,
-                    'max2': max2,
-                    'total_time': total_time
-                }
-                
-                # Generate PDF
-                pdf_bytes = create_pdf_report(optimal_point, optimal_value, parameters, plot_buffer)
-                
-                if pdf_bytes:
                     st.download_button(
                         label="📥 Download PDF Report",
-                        data=pdf_bytes,
+                        data=build_pdf,
                         file_name="optimasi_produksi.pdf",
                         mime="application/pdf",
                         help="Klik untuk mengunduh laporan lengkap dalam format PDF",
                         use_container_width=True
                     )
-                    st.success("PDF siap diunduh! Klik tombol di atas untuk mengunduh laporan lengkap.")
+                    
+                    if cache_entry['preview_seconds'] is None:
+                        render_info = "Solusi dan pratinjau dimuat dari riwayat (tanpa menghitung ulang)"
+                    else:
+                        render_info = f"Render pratinjau (SVG): {cache_entry['preview_seconds']*1000:,.1f} ms"
+                    if cache_entry.get('export_seconds') is not None:
+                        render_info += f" · Render ekspor ({EXPORT_DPI} dpi): {cache_entry['export_seconds']*1000:,.1f} ms"
+                    else:
+                        render_info += f" · Render ekspor ({EXPORT_DPI} dpi) dibuat saat PDF diunduh"
+                    st.caption(render_info)
+                    trace.lap("ekspor")
+                    REGISTRY.observe("stage_seconds", trace.total, stage="hitung.total")
+                    st.session_state.last_trace = trace.rows() + [{"tahap": "hitung.total", "ms": trace.total * 1000}]
+
+        optimasi_solver()
+
+    @st.fragment
+    def batch_analysis():
+        with st.expander("📂 ANALISIS BATCH (CSV)", expanded=False):
+            st.markdown(f"""
+            Unggah file CSV berisi banyak skenario sekaligus. Kolom yang dibutuhkan:
+            `{', '.join(PARAMETER_NAMES)}` (satu baris = satu skenario).
+            """)
+            uploaded_csv = st.file_uploader("File skenario (.csv)", type=["csv"], key="batch_csv")
+
+            if uploaded_csv is not None:
+                from batch import CORNER_LABELS
+                from resultstore import CHUNK_ROWS, ResultFilter, ResultStore, prune, results_root
+                # Hasil disimpan kolumnar (.npy, memory-map) per file unggahan; rerun fragment
+                # (paging/filter) membuka hasil yang sama tanpa menghitung ulang
+                results_dir = results_root() / uploaded_csv.file_id
+
+                def open_results():
+                    """Membuka result set unggahan ini; dihitung ulang jika belum selesai atau sudah dipangkas"""
+                    results = ResultStore(results_dir)
+                    if results.complete:
+                        return results
+                    results.delete()
+                    results = ResultStore(results_dir)
+                    start = time.perf_counter()
+                    try:
+                        uploaded_csv.seek(0)
+                        for scenarios in pd.read_csv(uploaded_csv, usecols=list(PARAMETER_NAMES), chunksize=CHUNK_ROWS):
+                            arrays = [scenarios[name].to_numpy(dtype=float) for name in PARAMETER_NAMES]
+                            results.append_batch(arrays, solve_two_product_batch(*arrays))
+                    except ValueError as e:
+                        results.delete()
+                        st.error(f"Format CSV tidak valid: {e}")
+                        st.stop()
+                    results.finish()
+                    st.session_state.batch_seconds = (uploaded_csv.file_id, time.perf_counter() - start)
+                    # Result set milik sesi ini tidak dipangkas; milik sesi lain dipangkas menurut akses terakhir
+                    owned = st.session_state.setdefault("batch_result_sets", set())
+                    owned.add(uploaded_csv.file_id)
+                    prune(results_root(), keep=MAX_RESULT_SETS, protect=[results_root() / name for name in owned])
+                    return results
+
+                results = open_results()
+                overall = results.aggregate()
+                solved = st.session_state.get("batch_seconds", (None, None))
+                cols = st.columns(3)
+                cols[0].metric("Jumlah skenario", f"{len(results):,}")
+                cols[1].metric("Waktu solve", f"{solved[1]*1000:,.1f} ms" if solved[0] == uploaded_csv.file_id else "dari disk")
+                cols[2].metric("Rata-rata keuntungan", f"Rp{overall['mean']:,.0f}")
+
+                # Filter, agregasi, dan paging langsung dari file memory-map
+                cols = st.columns([2, 1, 1])
+                corners = cols[0].multiselect("Titik optimal", list(overall['corners']), key="batch_corners",
+                                              placeholder="Semua titik")
+                z_min = cols[1].number_input("Z minimum", value=None, key="batch_z_min")
+                z_max = cols[2].number_input("Z maksimum", value=None, key="batch_z_max")
+                where = ResultFilter(tuple(corners) or None, z_min, z_max)
+                selected = results.aggregate(where) if where.active else overall
+                if selected['count']:
+                    st.caption(f"{selected['count']:,} skenario cocok · Z rata-rata Rp{selected['mean']:,.0f} · "
+                               f"min Rp{selected['min']:,.0f} · maks Rp{selected['max']:,.0f} · " +
+                               " · ".join(f"{label}: {count:,}" for label, count in selected['corners'].items()))
+                else:
+                    st.caption("Tidak ada skenario yang cocok dengan filter.")
+
+                cols = st.columns([1, 1, 2])
+                page_size = cols[0].selectbox("Baris per halaman", (100, 1000, 10000), key="batch_page_size")
+                pages = max(1, -(-selected['count'] // page_size))
+                if st.session_state.get("batch_page", 1) > pages:
+                    st.session_state.batch_page = 1  # Filter mempersempit hasil
+                page = cols[1].number_input(f"Halaman (dari {pages:,})", min_value=1, max_value=pages,
+                                            key="batch_page")
+                rows = results.page((page - 1) * page_size, page_size, where)
+                table = pd.DataFrame({name: values for name, values in rows.items() if name != "titik"})
+                table["titik"] = np.array(CORNER_LABELS)[rows["titik"]]
+                st.dataframe(table, use_container_width=True)
+
+                def build_batch_csv(where=where):
+                    """CSV ditulis per potongan dari file memory-map ke file sementara milik unduhan ini"""
+                    return spooled_download(lambda f: open_results().write_csv(f, where))
+
+                st.download_button(
+                    label="📥 Download Hasil Batch (CSV)",
+                    data=build_batch_csv,
+                    file_name="hasil_batch.csv",
+                    mime="text/csv",
+                    use_container_width=True
+                )
+
+                st.markdown("**Laporan PDF per skenario**")
+                include_plots = st.checkbox("Sertakan grafik 300 dpi (lebih lambat)", key="batch_plots")
+                if selected['count'] > MAX_BATCH_REPORTS:
+                    st.caption(f"Laporan dibatasi pada {MAX_BATCH_REPORTS:,} skenario pertama yang cocok dengan filter.")
+
+                def iter_batch_reports(where=where):
+                    """Menghasilkan (parameters, optimal_point, optimal_value) per skenario (sesuai filter)"""
+                    rows = open_results().page(0, MAX_BATCH_REPORTS, where)
+                    for i in range(rows["Z"].size):
+                        parameters = {name: float(rows[name][i]) for name in PARAMETER_NAMES}
+                        yield parameters, (float(rows["x1"][i]), float(rows["x2"][i])), float(rows["Z"][i])
+
+                def render_batch_plot(parameters, optimal_point):
+                    return render_export(parameters, optimal_point, get_figure_pool())[0]
+
+                plot_renderer = render_batch_plot if include_plots else None
+
+                def build_batch_zip():
+                    from report import write_batch_zip
+                    return spooled_download(lambda f: write_batch_zip(iter_batch_reports(), f, plot_renderer))
+
+                def build_batch_pdf():
+                    from report import write_batch_pdf
+                    return spooled_download(lambda f: write_batch_pdf(iter_batch_reports(), f, plot_renderer))
+
+                cols = st.columns(2)
+                cols[0].download_button(
+                    label="📦 Download Laporan (ZIP)",
+                    data=build_batch_zip,
+                    file_name="laporan_batch.zip",
+                    mime="application/zip",
+                    use_container_width=True
+                )
+                cols[1].download_button(
+                    label="📑 Download Laporan (PDF multi-halaman)",
+                    data=build_batch_pdf,
+                    file_name="laporan_batch.pdf",
+                    mime="application/pdf",
+                    use_container_width=True
+                )
+
+    batch_analysis()
+
+    @st.fragment
+    def monte_carlo_analysis():
+        with st.expander("🎲 ANALISIS ROBUSTNESS (MONTE CARLO)", expanded=False):
+            from montecarlo import Distribution, run_monte_carlo
+            st.markdown("""
+            Keuntungan dan waktu produksi hanyalah estimasi. Pilih distribusi di sekitar nilai
+            pada **Parameter Produksi** di atas, lalu simulasikan ribuan kemungkinan sekaligus
+            untuk melihat sebaran keuntungan optimal dan seberapa sering setiap titik pojok optimal.
+            """)
+            distribution_labels = {"Tetap": "tetap", "Normal": "normal", "Uniform": "uniform", "Segitiga": "segitiga"}
+            with st.form("monte_carlo_form"):
+                spreads = {}
+                for name, label in (("p1", "Keuntungan produk 1"), ("t1", "Waktu produk 1"),
+                                    ("p2", "Keuntungan produk 2"), ("t2", "Waktu produk 2")):
+                    cols = st.columns(2)
+                    kind = cols[0].selectbox(label, list(distribution_labels), index=1, key=f"mc_kind_{name}")
+                    spread = cols[1].number_input("Sebaran (%)", min_value=0.0, max_value=100.0, value=10.0,
+                                                  step=1.0, key=f"mc_spread_{name}",
+                                                  help="Normal: simpangan baku; Uniform/Segitiga: setengah lebar rentang")
+                    spreads[name] = (distribution_labels[kind], spread)
+                cols = st.columns(2)
+                draws = cols[0].number_input("Jumlah sampel", min_value=1000, max_value=5_000_000, value=100_000, step=10_000, key="mc_draws")
+                seed = cols[1].number_input("Seed acak", min_value=0, value=42, step=1, key="mc_seed")
+                run_simulation = st.form_submit_button("🎲 Jalankan Simulasi", use_container_width=True)
+
+            if run_simulation:
+                base = {name: st.session_state.get(key, 0) for name, key in PARAMETER_WIDGET_KEYS.items()}
+                if base['total_time'] == 0 or (base['t1'] == 0 and base['t2'] == 0):
+                    st.error("Isi Parameter Produksi lalu klik HITUNG terlebih dahulu")
+                    st.stop()
+                distributions = {name: Distribution.relative(kind, base[name], spread) for name, (kind, spread) in spreads.items()}
+                with st.spinner(f"Mensimulasikan {draws:,} skenario..."):
+                    st.session_state.mc_result = run_monte_carlo(base, distributions, draws, seed=int(seed))
+
+            mc_result = st.session_state.get("mc_result")
+            if mc_result is not None:
+                summary = mc_result.summary()
+                cols = st.columns(4)
+                cols[0].metric("Rata-rata keuntungan", f"Rp{summary['mean']:,.0f}")
+                cols[1].metric("Persentil 5%", f"Rp{summary['p5']:,.0f}")
+                cols[2].metric("Persentil 95%", f"Rp{summary['p95']:,.0f}")
+                cols[3].metric("Simpangan baku", f"Rp{summary['std']:,.0f}")
+
+                cols = st.columns([2, 1])
+                with cols[0]:
+                    st.markdown("**Distribusi keuntungan optimal**")
+                    counts, edges = mc_result.histogram(bins=40)
+                    st.bar_chart(pd.DataFrame({"Keuntungan (Rp)": (edges[:-1] + edges[1:]) / 2, "Jumlah sampel": counts}),
+                                 x="Keuntungan (Rp)", y="Jumlah sampel")
+                with cols[1]:
+                    st.markdown("**Frekuensi titik optimal**")
+                    frequency = mc_result.corner_frequency()
+                    st.dataframe(
+                        pd.DataFrame({"Titik": list(frequency), "Frekuensi": [f"{v:.2%}" for v in frequency.values()]}),
+                        hide_index=True, use_container_width=True
+                    )
+                st.caption(f"{len(mc_result):,} sampel · {mc_result.workers} proses · {mc_result.seconds*1000:,.0f} ms")
+
+    monte_carlo_analysis()
+
+    def resolve_whatif():
+        """Callback what-if: solve ulang model terakhir dengan satu b/c diubah dari basisnya"""
+        from dataclasses import replace
+        name, solved_model, result, _ = st.session_state.model_result
+        b, c = solved_model.b.copy(), solved_model.c.copy()
+        try:
+            if st.session_state.whatif_rhs is not None:
+                b[solved_model.con_names.index(st.session_state.whatif_row)] = st.session_state.whatif_rhs
+            if st.session_state.whatif_cost is not None:
+                c[solved_model.var_names.index(st.session_state.whatif_var)] = st.session_state.whatif_cost
+        except ValueError:
+            st.session_state.whatif_error = "Nama kendala atau variabel tidak ditemukan di model"
+            return
+        edited = replace(solved_model, b=b, c=c)
+        start = time.perf_counter()
+        edited_result = resolve_lp(edited, solved_model, result.basis)
+        st.session_state.model_result = (name, edited, edited_result, time.perf_counter() - start)
+
+    @st.fragment
+    def model_import():
+        with st.expander("📥 IMPOR MODEL (MPS / LP)", expanded=False):
+            st.markdown("""
+            Rencana produksi besar bisa diimpor dari file **MPS** (format bebas) atau **CPLEX-LP**
+            lalu diselesaikan dengan solver yang sama. Batas variabel ditambahkan sebagai kendala;
+            variabel bebas (batas bawah negatif) belum didukung.
+            """)
+            uploaded_model = st.file_uploader("File model (.mps / .lp)", type=["mps", "lp"], key="model_file")
+
+            if uploaded_model is not None:
+                try:
+                    imported, parse_seconds = load_model_file(uploaded_model.getvalue(), uploaded_model.name)
+                except ValueError as e:
+                    st.error(f"Model tidak dapat dibaca: {e}")
+                    imported = None
+
+            if uploaded_model is not None and imported is not None:
+                model = imported.model
+                cols = st.columns(4)
+                cols[0].metric("Variabel", f"{model.num_vars:,}")
+                cols[1].metric("Kendala", f"{model.num_constraints:,}")
+                cols[2].metric("Koefisien non-nol", f"{imported.nnz:,}")
+                cols[3].metric("Waktu baca", f"{parse_seconds*1000:,.0f} ms")
+                st.caption(f"{imported.name} · {imported.format.upper()} · "
+                           f"{'maksimasi' if model.maximize else 'minimasi'} · {imported.integer.size:,} variabel bulat")
+
+                use_integer = False
+                if imported.integer.size:
+                    use_integer = st.checkbox("Selesaikan dengan variabel bulat (branch-and-bound)", key="model_integer")
+                solver_labels = {"auto": f"Otomatis ({choose_solver(model)})", "simplex": "Revised simplex",
+                                 "interior": "Interior-point"}
+                cols = st.columns([2, 1, 1])
+                solver_choice = cols[0].selectbox("Metode solver", list(solver_labels), format_func=solver_labels.get,
+                                                  key="model_solver", disabled=use_integer,
+                                                  help="Otomatis memilih interior-point untuk model besar dan padat")
+                use_crossover = cols[1].checkbox("Crossover ke titik pojok", value=True, key="model_crossover",
+                                                 disabled=use_integer,
+                                                 help="Tanpa crossover hasil interior-point tidak memiliki basis/titik pojok")
+                use_presolve = cols[2].checkbox("Presolve", value=True, key="model_presolve", disabled=use_integer,
+                                                help="Reduksi dan scaling model sebelum solve; model tidak "
+                                                     "feasible/tidak terbatas sering terdeteksi di tahap ini")
+                if st.button("🧮 Selesaikan Model", key="solve_model", use_container_width=True):
+                    from integer import solve_milp
+                    start = time.perf_counter()
+                    with st.spinner("Menyelesaikan model..."):
+                        if use_integer:
+                            result = solve_milp(model, integer=imported.integer, time_limit=INTEGER_TIME_LIMIT)
+                        else:
+                            result = solve_model(model, solver=solver_choice, crossover=use_crossover,
+                                                  presolve=use_presolve)
+                    st.session_state.model_result = (uploaded_model.name, model, result, time.perf_counter() - start)
+
+                model_result = st.session_state.get("model_result")
+                if model_result is not None and model_result[0] == uploaded_model.name:
+                    _, solved_model, result, solve_seconds = model_result
+                    if not np.all(np.isfinite(result.x)):
+                        st.error(f"Model tidak memiliki solusi: {result.message}")
+                    else:
+                        cols = st.columns(3)
+                        cols[0].metric("Nilai fungsi tujuan", f"{result.objective + imported.objective_offset:,.4f}")
+                        cols[1].metric("Iterasi", f"{result.iterations:,}",
+                                       help=SOLVE_METHOD_LABELS.get(getattr(result, 'method', None), "branch-and-bound"))
+                        cols[2].metric("Waktu solve", f"{solve_seconds*1000:,.0f} ms")
+                        st.caption(result.message)
+                        solution = pd.DataFrame({"Variabel": model.var_names, "Nilai": result.x})
+                        nonzero = solution[solution["Nilai"].abs() > 1e-9]
+                        st.dataframe(nonzero.head(1000), hide_index=True, use_container_width=True)
+                        if len(nonzero) > 1000:
+                            st.caption(f"Menampilkan 1.000 dari {len(nonzero):,} variabel bernilai non-nol.")
+                        st.download_button(
+                            label="📥 Download Solusi (CSV)",
+                            data=solution.to_csv(index=False),
+                            file_name=f"solusi_{imported.name}.csv",
+                            mime="text/csv",
+                            use_container_width=True
+                        )
+
+                    # What-if: ubah satu ruas kanan dan/atau satu koefisien tujuan lalu solve ulang
+                    # dari basis optimal terakhir (hanya untuk solusi LP, bukan branch-and-bound)
+                    if isinstance(result, LPResult) and result.success and result.basis.size:
+                        with st.form("model_whatif", border=False):
+                            st.markdown("**🔁 What-if**: solve ulang dari basis optimal terakhir")
+                            cols = st.columns(2)
+                            cols[0].text_input("Kendala", value=solved_model.con_names[0], key="whatif_row")
+                            cols[0].number_input("Ruas kanan baru", value=None, format="%g", key="whatif_rhs",
+                                                 placeholder="tidak diubah")
+                            cols[1].text_input("Variabel", value=solved_model.var_names[0], key="whatif_var")
+                            cols[1].number_input("Koefisien tujuan baru", value=None, format="%g", key="whatif_cost",
+                                                 placeholder="tidak diubah")
+                            st.form_submit_button("🔁 Solve Ulang", on_click=resolve_whatif, use_container_width=True)
+                    whatif_error = st.session_state.pop("whatif_error", None)
+                    if whatif_error:
+                        st.error(whatif_error)
+
+    model_import()
+
+
+# =============== RIWAYAT SKENARIO ===============
+with st.sidebar:
+    with st.expander("📜 Riwayat Skenario", expanded=False):
+        from datetime import datetime
+        history = get_scenario_store().recent(limit=20)
+        if not history:
+            st.caption("Belum ada skenario tersimpan.")
+        for item in history:
+            x1, x2 = item.optimal_point
+            saved = datetime.fromtimestamp(item.created_at).strftime("%d/%m %H:%M")
+            mode = " · bulat" if item.integer_mode else ""
+            st.button(
+                f"Rp{item.optimal_value:,.0f} · ({x1:.0f}, {x2:.0f}){mode}",
+                key=f"history_{item.id}",
+                help=f"Disimpan {saved} · " + ", ".join(f"{k}={v:g}" for k, v in item.parameters.items()),
+                on_click=load_scenario, args=(item.id,),
+                use_container_width=True
+            )
+
+# =============== PANEL DEBUG ===============
+if st.session_state.get("debug_panel"):
+    import json
+    with st.sidebar:
+        st.subheader("🛠️ Debug Performa")
+        last_trace = st.session_state.get("last_trace")
+        if last_trace:
+            st.markdown("**Klik HITUNG terakhir**")
+            st.dataframe(last_trace, hide_index=True, use_container_width=True,
+                         column_config={"ms": st.column_config.NumberColumn(format="%.1f")})
+        else:
+            st.caption("Belum ada perhitungan pada sesi ini.")
+        st.markdown("**Agregat proses server**")
+        st.dataframe(REGISTRY.stage_summary(), hide_index=True, use_container_width=True)
+        if metrics_server is not None:
+            host, port = metrics_server.server_address[:2]
+            st.caption(f"Scrape: http://{host}:{port}/metrics · /metrics.json")
+        cols = st.columns(2)
+        cols[0].download_button("Prometheus", data=REGISTRY.to_prometheus, file_name="metrics.txt", mime="text/plain")
+        cols[1].download_button("JSON", data=lambda: json.dumps(REGISTRY.to_json(), indent=2),
+                                file_name="metrics.json", mime="application/json")
 
 # =============== STYLE CUSTOM ===============
 st.markdown("""
@@ -0,0 +1,122 @@
+"""Aset statis aplikasi (logo & header) yang dibuat sekali lalu disimpan di disk.
+
+Gambar dibangun dengan PIL hanya jika file di folder ``assets/`` belum ada,
+kemudian disimpan agar proses/replika berikutnya cukup membaca file tersebut.
+Jalankan ``python assets.py`` untuk membangun ulang aset.
+"""
+from functools import lru_cache
+from io import BytesIO
+from pathlib import Path
+import base64
+import os
+
+from metrics import timed
+
+ASSET_DIR = Path(__file__).resolve().parent / "assets"
+LOGO_PATH = ASSET_DIR / "logo.png"
+HEADER_PATH = ASSET_DIR / "header.jpg"
+
+
+@timed("assets.logo")
+def render_logo() -> bytes:
+    """Menggambar logo aplikasi dan mengembalikan bytes PNG"""
+    from PIL import Image, ImageDraw, ImageFont  # Diimpor hanya saat aset dibangun
+
+    img = Image.new('RGBA', (200, 80), (0,0,0,0))
+    draw = ImageDraw.Draw(img)
+
+    # Background gradient
+    for i in range(80):
+        draw.line([(0,i), (200,i)], fill=(0, 100+i, 200))
+
+    # Text
+    try:
+        font = ImageFont.truetype("arial.ttf", 24)
+    except OSError:
+        font = ImageFont.load_default()
+    draw.text((50, 25), "LINEAR PROGRAMMING", fill=(255,255,255), font=font, stroke_width=2, stroke_fill=(0,0,0))
+
+    buffered = BytesIO()
+    img.save(buffered, format="PNG")
+    return buffered.getvalue()
+
+
+@timed("assets.header")
+def render_header(logo_png: bytes = b"") -> bytes:
+    """Menggambar header aplikasi (dengan logo) dan mengembalikan bytes JPEG"""
+    from PIL import Image, ImageDraw, ImageFont  # Diimpor hanya saat aset dibangun
+
+    img = Image.new('RGB', (1000, 200), (70, 130, 180))
+    draw = ImageDraw.Draw(img)
+
+    # Diagonal pattern
+    for i in range(-200, 1000, 30):
+        draw.line([(i,0), (i+200,200)], fill=(100,150,200), width=2)
+
+    # Main title
+    try:
+        font = ImageFont.truetype("arial.ttf", 50)
+    except OSError:
+        font = ImageFont.load_default()
+    draw.text((100, 60), "APLIKASI MODEL LINEAR PROGRAMMING", fill=(255,255,0), font=font)
+
+    # Add logo (jika logo tersedia)
+    if logo_png:
+        logo_img = Image.open(BytesIO(logo_png)).resize((150,60))
+        img.paste(logo_img, (800, 20), logo_img)
+
+    buffered = BytesIO()
+    img.save(buffered, format="JPEG")
+    return buffered.getvalue()
+
+
+def load_or_build(path: Path, build) -> bytes:
+    """Membaca aset dari disk; jika belum ada, bangun lalu simpan secara atomik"""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        pass
+    data = build()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Folder read-only: aset tetap dipakai dari memori
+    return data
+
+
+@lru_cache(maxsize=None)
+def logo_png() -> bytes:
+    return load_or_build(LOGO_PATH, render_logo)
+
+
+@lru_cache(maxsize=None)
+def header_jpeg() -> bytes:
+    return load_or_build(HEADER_PATH, lambda: render_header(logo_png()))
+
+
+def logo_base64() -> str:
+    """Logo dalam bentuk base64 untuk data URL"""
+    return base64.b64encode(logo_png()).decode()
+
+
+def header_base64() -> str:
+    """Header dalam bentuk base64 untuk data URL"""
+    return base64.b64encode(header_jpeg()).decode()
+
+
+def build_assets():
+    """Membangun ulang semua aset statis dan menyimpannya ke folder assets/"""
+    for path in (LOGO_PATH, HEADER_PATH):
+        path.unlink(missing_ok=True)
+    logo_png.cache_clear()
+    header_jpeg.cache_clear()
+    logo_png()
+    header_jpeg()
+
+
+if __name__ == "__main__":
+    build_assets()
+    print(f"Aset disimpan di {ASSET_DIR}")
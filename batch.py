@@ -0,0 +1,95 @@
+"""Solver titik pojok dua produk yang tervektorisasi untuk banyak skenario sekaligus.
+
+Setiap parameter adalah array NumPy berbentuk (N,). Semua titik pojok A-E dan
+nilai fungsi tujuannya dihitung dengan broadcasting tanpa loop Python, sehingga
+jutaan skenario dapat dievaluasi dalam hitungan detik.
+"""
+from dataclasses import dataclass
+
+import numpy as np  # Komputasi numerik tervektorisasi
+
+CORNER_LABELS = ("A", "B", "C", "D", "E")
+PARAMETER_NAMES = ("p1", "t1", "max1", "p2", "t2", "max2", "total_time")
+
+
+@dataclass
+class BatchResult:
+    """Hasil solve batch untuk N skenario"""
+    corners: np.ndarray        # (N, 5, 2) koordinat titik A-E
+    values: np.ndarray         # (N, 5) nilai Z di setiap titik pojok
+    feasible: np.ndarray       # (N, 5) apakah titik memenuhi semua kendala
+    optimal_index: np.ndarray  # (N,) indeks titik optimal (0=A ... 4=E)
+    optimal_point: np.ndarray  # (N, 2) solusi optimal (x1, x2)
+    optimal_value: np.ndarray  # (N,) keuntungan maksimum
+
+    def __len__(self):
+        return self.optimal_value.shape[0]
+
+    @property
+    def optimal_label(self) -> np.ndarray:
+        """Label titik optimal ('A'-'E') untuk setiap skenario"""
+        return np.array(CORNER_LABELS)[self.optimal_index]
+
+
+def _safe_div(num, den):
+    """Pembagian yang menghasilkan +/-inf (bukan NaN) saat penyebut 0"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = num / den
+    return np.where(den > 0, out, np.where(num >= 0, np.inf, -np.inf))
+
+
+def corner_points(p1, t1, max1, p2, t2, max2, total_time) -> np.ndarray:
+    """Menghitung titik pojok A-E untuk semua skenario, hasil berbentuk (N, 5, 2)"""
+    t1, max1, t2, max2, total_time = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (t1, max1, t2, max2, total_time))
+    )
+    zeros = np.zeros_like(total_time)
+
+    x1 = np.stack([
+        zeros,                                                       # A: origin
+        np.minimum(_safe_div(total_time, t1), max1),                 # B: maks produk 1
+        max1,                                                        # C: x1 = max1
+        np.minimum(_safe_div(total_time - t2 * max2, t1), max1),     # D: x2 = max2
+        zeros,                                                       # E: maks produk 2
+    ], axis=-1)
+    x2 = np.stack([
+        zeros,
+        zeros,
+        np.minimum(_safe_div(total_time - t1 * max1, t2), max2),
+        max2,
+        np.minimum(_safe_div(total_time, t2), max2),
+    ], axis=-1)
+    return np.stack([x1, x2], axis=-1)
+
+
+def solve_two_product_batch(p1, t1, max1, p2, t2, max2, total_time, tol: float = 1e-9) -> BatchResult:
+    """Menyelesaikan N skenario dua produk sekaligus dengan metode titik pojok"""
+    p1, t1, max1, p2, t2, max2, total_time = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=float)) for a in (p1, t1, max1, p2, t2, max2, total_time))
+    )
+    corners = corner_points(p1, t1, max1, p2, t2, max2, total_time)
+    x1, x2 = corners[..., 0], corners[..., 1]
+
+    with np.errstate(invalid="ignore"):
+        # Titik yang tidak terdefinisi (pembagian dengan waktu 0) bernilai -inf, bukan NaN
+        defined = np.isfinite(x1) & np.isfinite(x2)
+        values = np.where(defined, p1[:, None] * x1 + p2[:, None] * x2, -np.inf)
+        slack = tol * (1.0 + np.abs(total_time))[:, None]
+        feasible = (
+            defined
+            & (x1 >= -tol) & (x2 >= -tol)
+            & (x1 <= max1[:, None] + tol) & (x2 <= max2[:, None] + tol)
+            & (t1[:, None] * x1 + t2[:, None] * x2 <= total_time[:, None] + slack)
+        )
+
+    masked = np.where(feasible, values, -np.inf)
+    optimal_index = np.argmax(masked, axis=1)
+    rows = np.arange(optimal_index.size)
+    return BatchResult(
+        corners=corners,
+        values=values,
+        feasible=feasible,
+        optimal_index=optimal_index,
+        optimal_point=corners[rows, optimal_index],
+        optimal_value=masked[rows, optimal_index],
+    )
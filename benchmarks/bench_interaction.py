@@ -0,0 +1,123 @@
+"""Benchmark latensi per interaksi di halaman Optimasi (sebelum/sesudah perubahan).
+
+Interaksi yang diukur lewat AppTest headless:
+
+* ``ubah_parameter``: mengubah satu ``number_input`` parameter produksi.
+  Jika widget berada di dalam ``st.form`` browser tidak memicu rerun sama
+  sekali, sehingga latensinya 0.
+* ``hitung``: klik/submit HITUNG. Jika hasil dirender di ``st.fragment``
+  server hanya menjalankan ulang fragment tersebut; durasinya diambil dari
+  metrik ``optimasi.fragment``. Tanpa fragment yang dihitung adalah rerun penuh.
+* ``rerun_penuh``: rerun seluruh skrip (misal navigasi), sebagai pembanding.
+
+Versi lain dari repo bisa diukur dengan ``--ref`` (diekstrak dengan ``git archive``)::
+
+    python benchmarks/bench_interaction.py --ref HEAD~1 --repeat 5 --output latensi.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPET = """
+import json, statistics, sys, time
+sys.path.insert(0, ".")
+from streamlit.testing.v1 import AppTest
+
+REPEAT = {repeat}
+INPUTS = {{'p1': 120000, 't1': 3, 'max1': 30, 'p2': 80000, 't2': 2, 'max2': 40, 'total': 120}}
+
+def fragment_seconds():
+    try:
+        from metrics import REGISTRY
+    except ImportError:
+        return None
+    rows = [r for r in REGISTRY.stage_summary() if r["stage"] == "optimasi.fragment"]
+    return rows[0]["total_ms"] / 1000 if rows else None
+
+def timed(action):
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+def hitung_button(at):
+    return next(b for b in at.button if "HITUNG" in b.label)
+
+at = AppTest.from_file("app.py", default_timeout=120)
+at.session_state["current_page"] = "Optimasi"
+at.run()
+# Nilai di dalam st.form baru terkirim saat submit, jadi isi nilai dan klik dalam satu run
+for widget in at.number_input:
+    if widget.key in INPUTS:
+        widget.set_value(INPUTS[widget.key])
+hitung_button(at).click().run()
+assert not at.exception, at.exception
+
+in_form = bool(getattr(at.number_input(key="p1").proto, "form_id", ""))
+edit, hitung, full = [], [], []
+for i in range(REPEAT):
+    at.number_input(key="p1").set_value(INPUTS["p1"] + i + 1)
+    seconds = timed(at.run)
+    edit.append(0.0 if in_form else seconds)
+
+    at.number_input(key="p1").set_value(INPUTS["p1"] + i + 1)
+    before = fragment_seconds()
+    seconds = timed(lambda: hitung_button(at).click().run())
+    after = fragment_seconds()
+    hitung.append(after - (before or 0.0) if after is not None else seconds)
+
+    at.session_state["current_page"] = "Optimasi"
+    full.append(timed(at.run))
+assert not at.exception, at.exception
+
+def summary(samples):
+    return {{"median_ms": statistics.median(samples) * 1000, "min_ms": min(samples) * 1000,
+             "max_ms": max(samples) * 1000}}
+
+print(json.dumps({{"form": in_form, "fragment": fragment_seconds() is not None,
+                  "ubah_parameter": summary(edit), "hitung": summary(hitung), "rerun_penuh": summary(full)}}))
+"""
+
+
+def measure(tree, repeat):
+    """Menjalankan pengukuran di proses baru dengan direktori kerja ``tree``"""
+    out = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(SNIPPET.format(repeat=repeat))],
+        cwd=tree, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def export_ref(ref, target):
+    """Mengekstrak isi repo pada ``ref`` ke direktori ``target``"""
+    archive = subprocess.run(["git", "archive", ref], cwd=ROOT, capture_output=True, check=True).stdout
+    subprocess.run(["tar", "-x", "-C", target], input=archive, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="jumlah pengulangan per interaksi")
+    parser.add_argument("--ref", help="revisi git pembanding (misal HEAD~1)")
+    parser.add_argument("--output", help="simpan hasil JSON ke file ini")
+    args = parser.parse_args()
+
+    results = {"sekarang": measure(ROOT, args.repeat)}
+    if args.ref:
+        with tempfile.TemporaryDirectory() as tree:
+            export_ref(args.ref, tree)
+            results[args.ref] = measure(tree, args.repeat)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,374 @@
+"""Benchmark per tahap: solve, grafik, PDF, aset, dan rerun halaman Optimasi.
+
+Setiap tahap diukur terpisah agar perubahan pada kode titik pojok, blok
+matplotlib, atau ``create_pdf_report`` terlihat dampaknya masing-masing.
+Ukuran masalah bisa diatur dan hasil ditulis sebagai JSON (beserta commit git)
+sehingga bisa dibandingkan antar commit::
+
+    python benchmarks/bench_stages.py --output sebelum.json
+    python benchmarks/bench_stages.py --batch-sizes 1,1000,100000 --lp-sizes 50x20,500x200
+    python benchmarks/bench_stages.py --compare sebelum.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+
+PARAMETERS = {'p1': 120000, 't1': 3, 'max1': 30, 'p2': 80000, 't2': 2, 'max2': 40, 'total_time': 120}
+APP_INPUTS = {'p1': 120000, 't1': 3, 'max1': 30, 'p2': 80000, 't2': 2, 'max2': 40, 'total': 120}
+STAGES = ["corner", "results", "lp", "warmstart", "frontier", "integer", "modelfile", "figure", "savefig", "concurrent", "pdf", "assets", "apptest"]
+
+
+def _summary(samples):
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def _measure(fn, repeat, warmup=1):
+    """Menjalankan fn beberapa kali (setelah pemanasan) dan meringkas durasinya"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return _summary(samples)
+
+
+def _random_scenarios(size, rng):
+    """Parameter dua produk acak (urutan PARAMETER_NAMES)"""
+    return (
+        rng.uniform(1e4, 2e5, size), rng.uniform(1, 6, size), rng.uniform(5, 60, size),
+        rng.uniform(1e4, 2e5, size), rng.uniform(1, 6, size), rng.uniform(5, 60, size),
+        rng.uniform(50, 300, size),
+    )
+
+
+def _random_lp(m, n, rng):
+    from solver import LinearProgram
+    A = rng.uniform(0, 10, (m, n)) * (rng.random((m, n)) < 0.3)
+    return LinearProgram(c=rng.uniform(1, 20, n), A=A, senses=["<="] * m, b=rng.uniform(50, 200, m))
+
+
+def bench_corner(sizes, repeat):
+    from batch import solve_two_product_batch
+    from production import solve_production
+    rng = np.random.default_rng(0)
+    results = {"solve_production": _measure(lambda: solve_production(PARAMETERS), repeat)}
+    for size in sizes:
+        scenarios = _random_scenarios(size, rng)
+        results[f"batch_{size}"] = _measure(lambda: solve_two_product_batch(*scenarios), repeat)
+    return results
+
+
+def bench_results(sizes, repeat):
+    """Result store kolumnar: append hasil batch, agregasi, halaman terfilter, dan ekspor CSV"""
+    import tempfile
+    from batch import solve_two_product_batch
+    from resultstore import ResultFilter, ResultStore
+    rng = np.random.default_rng(0)
+    results = {}
+    with tempfile.TemporaryDirectory() as root:
+        for size in sizes:
+            scenarios = _random_scenarios(size, rng)
+            solved = solve_two_product_batch(*scenarios)
+            counter = iter(range(10 ** 9))
+
+            def append():
+                ResultStore(os.path.join(root, f"append_{size}_{next(counter)}")).append_batch(scenarios, solved)
+
+            store = ResultStore(os.path.join(root, f"set_{size}"))
+            store.append_batch(scenarios, solved)
+            where = ResultFilter(("B", "E"), z_min=float(np.median(solved.optimal_value)))
+            results[f"append_{size}"] = _measure(append, repeat)
+            results[f"aggregate_{size}"] = _measure(lambda: store.aggregate(where), repeat)
+            results[f"page_{size}"] = _measure(lambda: store.page(size // 4, 1000, where), repeat)
+            results[f"csv_{size}"] = _measure(lambda: store.write_csv(os.path.join(root, "export.csv"), where), repeat)
+    return results
+
+
+def bench_lp(sizes, repeat):
+    from interior import solve_interior
+    from presolve import presolve
+    from solver import solve_lp
+    rng = np.random.default_rng(0)
+    results = {}
+    for m, n in sizes:
+        model = _random_lp(m, n, rng)
+        results[f"{m}x{n}"] = _measure(lambda: solve_lp(model), repeat)
+        results[f"{m}x{n}_interior"] = _measure(lambda: solve_interior(model), repeat)
+        results[f"{m}x{n}_presolve"] = _measure(lambda: presolve(model), repeat)
+    return results
+
+
+def bench_warmstart(sizes, repeat):
+    """Solve ulang setelah ruas kanan / fungsi tujuan diubah: dari awal vs dari basis optimal"""
+    from dataclasses import replace
+    from solver import resolve_lp, solve_lp
+    rng = np.random.default_rng(0)
+    results = {}
+    for m, n in sizes:
+        model = _random_lp(m, n, rng)
+        base = solve_lp(model)
+        edits = {
+            "rhs": replace(model, b=model.b * rng.uniform(0.8, 1.2, m)),
+            "objective": replace(model, c=model.c * rng.uniform(0.8, 1.2, n)),
+        }
+        for kind, edited in edits.items():
+            cold, warm = solve_lp(edited), resolve_lp(edited, model, base.basis)
+            results[f"{m}x{n}_{kind}_cold"] = dict(_measure(lambda: solve_lp(edited), repeat), iterations=cold.iterations)
+            results[f"{m}x{n}_{kind}_warm"] = dict(_measure(lambda: resolve_lp(edited, model, base.basis), repeat),
+                                                   iterations=warm.iterations, method=warm.method)
+    return results
+
+
+def bench_integer(sizes, repeat):
+    from integer import solve_milp
+    from production import solve_production
+    rng = np.random.default_rng(0)
+    results = {"two_product": _measure(lambda: solve_production(dict(PARAMETERS, max1=31), integer=True), repeat)}
+    for m, n in sizes:
+        model = _random_lp(m, n, rng)
+        results[f"{m}x{n}"] = _measure(lambda: solve_milp(model, max_nodes=200), repeat)
+    return results
+
+
+def _write_model_files(nnz, directory, rng):
+    """Menulis model acak (4 koefisien per kolom) sebagai file MPS dan LP"""
+    n = max(nnz // 4, 1)
+    m = max(n // 2, 1)
+    rows = rng.integers(0, m, (n, 4))
+    values = rng.uniform(1, 10, (n, 4)).round(3)
+    mps = os.path.join(directory, f"model_{nnz}.mps")
+    with open(mps, "w") as f:
+        f.write("NAME BENCH\nOBJSENSE\n    MAX\nROWS\n N obj\n")
+        f.write("".join(f" L R{i}\n" for i in range(m)))
+        f.write("COLUMNS\n")
+        f.write("".join(f"    X{j} obj {values[j, 0]} R{rows[j, 1]} {values[j, 1]}\n"
+                        f"    X{j} R{rows[j, 2]} {values[j, 2]} R{rows[j, 3]} {values[j, 3]}\n" for j in range(n)))
+        f.write("RHS\n" + "".join(f"    RHS R{i} 100\n" for i in range(m)) + "ENDATA\n")
+    terms = [[] for _ in range(m)]
+    for j in range(n):
+        for k in range(1, 4):
+            terms[rows[j, k]].append(f"{values[j, k]} X{j}")
+    lp = os.path.join(directory, f"model_{nnz}.lp")
+    with open(lp, "w") as f:
+        f.write("Maximize\n obj: " + " + ".join(f"{values[j, 0]} X{j}" for j in range(n)) + "\nSubject To\n")
+        f.write("".join(f" R{i}: " + " + ".join(row) + " <= 100\n" for i, row in enumerate(terms) if row))
+        f.write("End\n")
+    return mps, lp
+
+
+def bench_modelfile(sizes, repeat):
+    """Impor file MPS/LP dibandingkan dengan sekadar membaca file yang sama"""
+    import tempfile
+    from modelfile import read_model
+    rng = np.random.default_rng(0)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for nnz in sizes:
+            for path in _write_model_files(nnz, directory, rng):
+                def read_bytes():
+                    with open(path, "rb") as f:
+                        f.read()
+                fmt = os.path.splitext(path)[1][1:]
+                results[f"{fmt}_{nnz}_baca_file"] = _measure(read_bytes, repeat)
+                results[f"{fmt}_{nnz}_impor"] = _measure(lambda: read_model(path), repeat)
+    return results
+
+
+def bench_figure(repeat):
+    from plotting import FigurePool, build_solution_figure
+    pool = FigurePool(size=1)
+
+    def build_pooled():
+        with pool.figure() as fig:
+            build_solution_figure(PARAMETERS, (30, 15), fig)
+    return {"build_solution_figure": _measure(lambda: build_solution_figure(PARAMETERS, (30, 15)), repeat),
+            "build_solution_figure_pool": _measure(build_pooled, repeat)}
+
+
+def bench_savefig(repeat):
+    from io import BytesIO
+    from plotting import EXPORT_DPI, build_solution_svg, build_solution_figure
+
+    fig = build_solution_figure(PARAMETERS, (30, 15))
+    results = {}
+    for dpi in (72, EXPORT_DPI):
+        results[f"{dpi}dpi"] = _measure(lambda: fig.savefig(BytesIO(), format='png', bbox_inches='tight', dpi=dpi), repeat)
+    # Pratinjau layar: SVG langsung dari poligon eksak, tanpa figure/raster
+    results["svg"] = _measure(lambda: build_solution_svg(PARAMETERS, (30, 15)), repeat)
+    return results
+
+
+def bench_concurrent(users, repeat, dpi=72):
+    """``users`` thread merender grafik bersamaan lewat satu FigurePool bersama
+
+    Setiap hasil dibandingkan dengan render serial untuk parameter yang sama
+    (grafik tidak boleh saling tercampur antar thread).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from plotting import FigurePool
+    pool = FigurePool()
+    jobs = [(dict(PARAMETERS, total_time=100 + k), (30, 5 + k / 2)) for k in range(users)]
+    expected = [pool.render(parameters, point, dpi)[0] for parameters, point in jobs]
+    latencies, mismatches = [], 0
+    with ThreadPoolExecutor(max_workers=users) as executor:
+        for _ in range(repeat):
+            results = list(executor.map(lambda job: pool.render(job[0], job[1], dpi), jobs))
+            latencies += [seconds for _, seconds in results]
+            mismatches += sum(png != want for (png, _), want in zip(results, expected))
+    latencies.sort()
+    return {f"{users}_pengguna_{dpi}dpi": dict(_summary(latencies), p95_ms=latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+                                               berbeda=mismatches, **pool.stats())}
+
+
+def bench_frontier(sizes, repeat, grid=50):
+    """Frontier fungsi tujuan c + t * d: satu pass parametric simplex vs ``grid`` solve terpisah"""
+    from dataclasses import replace
+    from solver import parametric_objective, solve_lp
+    rng = np.random.default_rng(0)
+    results = {}
+    for m, n in sizes:
+        model = _random_lp(m, n, rng)
+        direction = rng.uniform(-1, 1, n) * np.abs(model.c).mean()
+        frontier = parametric_objective(model, direction, 0.0, 1.0)
+        results[f"{m}x{n}_parametrik"] = dict(_measure(lambda: parametric_objective(model, direction, 0.0, 1.0), repeat),
+                                              segmen=len(frontier.segments), pivot=frontier.pivots)
+        results[f"{m}x{n}_grid_{grid}"] = _measure(
+            lambda: [solve_lp(replace(model, c=model.c + t * direction)) for t in np.linspace(0.0, 1.0, grid)], repeat)
+    return results
+
+
+def bench_pdf(repeat):
+    from plotting import render_export
+    from production import solve_production
+    from report import create_pdf_report
+    solution = solve_production(PARAMETERS)
+    plot_png = render_export(PARAMETERS, solution['optimal_point'])[0]
+    return {
+        "tanpa_grafik": _measure(lambda: create_pdf_report(solution['optimal_point'], solution['optimal_value'], PARAMETERS), repeat),
+        "dengan_grafik": _measure(lambda: create_pdf_report(solution['optimal_point'], solution['optimal_value'], PARAMETERS, plot_png, solution['sensitivity']), repeat),
+    }
+
+
+def bench_assets(repeat):
+    from assets import render_header, render_logo
+    logo = render_logo()
+    return {
+        "render_logo": _measure(render_logo, repeat),
+        "render_header": _measure(lambda: render_header(logo), repeat),
+    }
+
+
+def bench_apptest(repeat):
+    """Rerun penuh halaman Optimasi (klik HITUNG) lewat AppTest headless"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.session_state["current_page"] = "Optimasi"
+    at.run()
+    for widget in at.number_input:
+        if widget.key in APP_INPUTS:
+            widget.set_value(APP_INPUTS[widget.key])
+
+    def click():
+        next(b for b in at.button if "HITUNG" in b.label).click().run()
+        assert not at.exception, at.exception
+
+    first = time.perf_counter()
+    click()  # Submit pertama: solve + render (cache kosong)
+    first = time.perf_counter() - first
+    return {"hitung_pertama": _summary([first]), "hitung_rerun": _measure(click, repeat, warmup=0)}
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _compare(baseline, results):
+    """Mencetak rasio median hasil sekarang terhadap baseline per tahap"""
+    for stage, cases in results["stages"].items():
+        for case, summary in cases.items():
+            old = baseline.get("stages", {}).get(stage, {}).get(case)
+            if old is None:
+                continue
+            ratio = summary["median_ms"] / old["median_ms"] if old["median_ms"] else float("inf")
+            print(f"{stage:>8} {case:<24} {old['median_ms']:10.2f} ms -> {summary['median_ms']:10.2f} ms  x{ratio:.2f}",
+                  file=sys.stderr)
+
+
+def _parse_lp_sizes(text):
+    return [tuple(int(v) for v in size.lower().split("x")) for size in text.split(",") if size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="jumlah pengulangan per pengukuran")
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"tahap yang diukur ({','.join(STAGES)})")
+    parser.add_argument("--users", type=int, default=50, help="jumlah thread render bersamaan (tahap concurrent)")
+    parser.add_argument("--batch-sizes", default="1,1000,100000", help="jumlah skenario batch titik pojok")
+    parser.add_argument("--lp-sizes", default="50x20,200x100,500x200", help="ukuran LP umum (baris x kolom)")
+    parser.add_argument("--integer-sizes", default="10x10,20x20", help="ukuran model bilangan bulat")
+    parser.add_argument("--model-sizes", default="10000,500000", help="jumlah koefisien non-nol file MPS/LP")
+    parser.add_argument("--output", help="simpan hasil JSON ke file ini")
+    parser.add_argument("--compare", help="file JSON hasil sebelumnya untuk dibandingkan")
+    args = parser.parse_args()
+
+    stages = [stage for stage in args.stages.split(",") if stage]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"tahap tidak dikenal: {', '.join(sorted(unknown))}")
+
+    runners = {
+        "corner": lambda: bench_corner([int(v) for v in args.batch_sizes.split(",") if v], args.repeat),
+        "results": lambda: bench_results([int(v) for v in args.batch_sizes.split(",") if v], args.repeat),
+        "lp": lambda: bench_lp(_parse_lp_sizes(args.lp_sizes), args.repeat),
+        "warmstart": lambda: bench_warmstart(_parse_lp_sizes(args.lp_sizes), args.repeat),
+        "integer": lambda: bench_integer(_parse_lp_sizes(args.integer_sizes), args.repeat),
+        "modelfile": lambda: bench_modelfile([int(v) for v in args.model_sizes.split(",") if v], args.repeat),
+        "figure": lambda: bench_figure(args.repeat),
+        "frontier": lambda: bench_frontier(_parse_lp_sizes(args.lp_sizes), args.repeat),
+        "savefig": lambda: bench_savefig(args.repeat),
+        "concurrent": lambda: bench_concurrent(args.users, args.repeat),
+        "pdf": lambda: bench_pdf(args.repeat),
+        "assets": lambda: bench_assets(args.repeat),
+        "apptest": lambda: bench_apptest(args.repeat),
+    }
+    results = {
+        "commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "repeat": args.repeat,
+        "stages": {stage: runners[stage]() for stage in stages},
+    }
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+    if args.compare:
+        with open(args.compare) as f:
+            _compare(json.load(f), results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark cold start: latensi import modul dan render pertama setiap halaman.
+
+Setiap pengukuran dijalankan di proses Python baru agar mencerminkan replika
+yang baru dinyalakan. Hasil dicetak sebagai JSON.
+
+    python benchmarks/bench_startup.py [--repeat 3] [--output hasil.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "streamlit",
+    "numpy",
+    "pandas",
+    "scipy.sparse.linalg",
+    "matplotlib.pyplot",
+    "reportlab.platypus",
+    "PIL.Image",
+    "assets",
+    "solver",
+    "batch",
+    "plotting",
+    "report",
+]
+
+PAGES = ["Beranda", "Pengertian", "Optimasi"]
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+FIRST_RENDER_SNIPPET = """
+import time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state["current_page"] = {page!r}
+loaded = time.perf_counter()
+at.run()
+assert not at.exception, at.exception
+print(loaded - start, time.perf_counter() - loaded)
+"""
+
+
+def _run(snippet):
+    """Menjalankan potongan kode di proses baru dan mengembalikan stdout"""
+    out = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(snippet)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return out.stdout.strip().splitlines()[-1]
+
+
+def _summary(samples):
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "min_ms": min(samples) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def bench_imports(repeat):
+    results = {}
+    for module in MODULES:
+        samples = [float(_run(IMPORT_SNIPPET.format(module=module))) for _ in range(repeat)]
+        results[module] = _summary(samples)
+    return results
+
+
+def bench_first_render(repeat):
+    app = os.path.join(ROOT, "app.py")
+    results = {}
+    for page in PAGES:
+        harness, render = [], []
+        for _ in range(repeat):
+            h, r = map(float, _run(FIRST_RENDER_SNIPPET.format(app=app, page=page)).split())
+            harness.append(h)
+            render.append(r)
+        results[page] = {"harness": _summary(harness), "first_render": _summary(render)}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="jumlah pengulangan per pengukuran")
+    parser.add_argument("--output", help="simpan hasil JSON ke file ini")
+    args = parser.parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "imports": bench_imports(args.repeat),
+        "first_render": bench_first_render(args.repeat),
+    }
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
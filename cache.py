@@ -0,0 +1,83 @@
+"""Cache hasil solve dengan ukuran terbatas dan eviksi LRU.
+
+Kunci cache adalah tuple parameter produksi yang sudah dinormalisasi sehingga
+input yang sama (misal 120 dan 120.0) selalu memakai entri yang sama.
+"""
+from collections import OrderedDict
+import threading
+
+from batch import PARAMETER_NAMES
+
+_MISSING = object()
+
+
+def normalize_parameters(parameters) -> tuple:
+    """Mengubah dict parameter menjadi tuple float berurutan sebagai kunci cache"""
+    return tuple(float(parameters[name]) for name in PARAMETER_NAMES)
+
+
+class LRUCache:
+    """Cache thread-safe berukuran tetap dengan eviksi Least Recently Used"""
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize <= 0:
+            raise ValueError("maxsize harus lebih besar dari 0")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Mengambil nilai dan menandainya sebagai yang terakhir dipakai"""
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Menyimpan nilai; entri terlama dibuang jika cache penuh"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Mengembalikan nilai dari cache atau menghitungnya dengan ``compute()``
+
+        ``compute`` dijalankan di luar lock agar sesi lain tidak ikut menunggu.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        """Statistik penggunaan cache"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
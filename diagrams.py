@@ -0,0 +1,267 @@
+"""Render diagram Mermaid (flowchart) menjadi SVG di server, tanpa CDN.
+
+Subset sintaks yang didukung cukup untuk diagram di aplikasi ini::
+
+    graph TD | TB | BT | LR | RL   (atau ``flowchart``)
+    A[Teks] --> B(Teks) --> C{Teks}
+    A -->|label| B
+    A --- B,  A -.-> B,  A ==> B
+
+Hasil SVG disimpan berdasarkan hash sumber di ``assets/diagrams/`` sehingga
+setiap diagram hanya dirender sekali untuk semua proses. Sintaks di luar
+subset ini memunculkan ``UnsupportedDiagram`` dengan pesan yang menjelaskan
+bagian yang tidak didukung; tidak ada renderer cadangan di browser.
+"""
+from dataclasses import dataclass, field
+from functools import lru_cache
+from html import escape
+import hashlib
+import re
+
+from assets import ASSET_DIR, load_or_build
+
+DIAGRAM_DIR = ASSET_DIR / "diagrams"
+
+FONT_SIZE = 14
+CHAR_WIDTH = 7.6
+NODE_HEIGHT = 40
+NODE_PADDING = 24
+NODE_GAP = 30
+RANK_GAP = {"TB": 60, "LR": 130}
+MARGIN = 20
+
+_HEADER = re.compile(r"^(?:graph|flowchart)\s+(TD|TB|BT|LR|RL)\s*$", re.IGNORECASE)
+_NODE = re.compile(
+    r"\s*(?P<id>[A-Za-z0-9_]+)\s*"
+    r"(?:(?P<shape>\(\[|\(\(|\[|\(|\{)(?P<text>[^\]\)\}]*)(?:\]\)|\)\)|\]|\)|\}))?\s*"
+)
+_EDGE = re.compile(r"\s*(?P<op>-->|---|-\.->|==>)\s*(?:\|(?P<label>[^|]*)\|)?\s*")
+_SHAPES = {"[": "rect", "(": "round", "{": "diamond", "((": "circle", "([": "stadium"}
+
+
+class UnsupportedDiagram(ValueError):
+    """Sintaks Mermaid di luar subset yang bisa dirender di server"""
+
+
+@dataclass
+class Flowchart:
+    direction: str
+    nodes: dict = field(default_factory=dict)   # id -> (teks, bentuk)
+    edges: list = field(default_factory=list)   # (asal, tujuan, label, operator)
+
+
+def source_hash(code: str) -> str:
+    """Hash sumber diagram (spasi di awal/akhir baris diabaikan)"""
+    normalized = "\n".join(line.strip() for line in code.strip().splitlines() if line.strip())
+    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+
+
+def parse_flowchart(code: str) -> Flowchart:
+    """Mengurai sumber flowchart Mermaid menjadi node dan edge"""
+    lines = [line.strip() for line in code.strip().splitlines() if line.strip() and not line.strip().startswith("%%")]
+    if not lines:
+        raise UnsupportedDiagram("Diagram kosong")
+    header = _HEADER.match(lines[0])
+    if not header:
+        raise UnsupportedDiagram(f"Jenis diagram tidak didukung: {lines[0]!r}")
+    direction = header.group(1).upper()
+    chart = Flowchart("TB" if direction == "TD" else direction)
+
+    for line in lines[1:]:
+        pos, previous, pending = 0, None, None
+        while True:
+            node = _NODE.match(line, pos)
+            if not node:
+                raise UnsupportedDiagram(f"Baris tidak dikenali: {line!r}")
+            node_id = node.group("id")
+            if node.group("shape"):
+                chart.nodes[node_id] = (node.group("text").strip(), _SHAPES[node.group("shape")])
+            else:
+                chart.nodes.setdefault(node_id, (node_id, "rect"))
+            if pending is not None:
+                chart.edges.append((previous, node_id, *pending))
+            previous, pos = node_id, node.end()
+            if pos >= len(line):
+                break
+            edge = _EDGE.match(line, pos)
+            if not edge:
+                raise UnsupportedDiagram(f"Baris tidak dikenali: {line!r}")
+            pending = ((edge.group("label") or "").strip(), edge.group("op"))
+            pos = edge.end()
+    return chart
+
+
+def _ranks(chart: Flowchart) -> dict:
+    """Peringkat (lapisan) tiap node = jalur terpanjang dari node sumber"""
+    order = list(chart.nodes)
+    children = {node: [] for node in order}
+    for src, dst, _, _ in chart.edges:
+        children[src].append(dst)
+
+    # Urutan topologis dengan DFS; edge balik (siklus) diabaikan
+    state, topo = {}, []
+
+    def visit(node):
+        state[node] = 1
+        for child in children[node]:
+            if state.get(child) is None:
+                visit(child)
+        state[node] = 2
+        topo.append(node)
+
+    for node in order:
+        if node not in state:
+            visit(node)
+    topo.reverse()
+    index = {node: i for i, node in enumerate(topo)}
+
+    rank = {node: 0 for node in order}
+    for node in topo:
+        for child in children[node]:
+            if index[child] > index[node]:
+                rank[child] = max(rank[child], rank[node] + 1)
+    return rank
+
+
+def _node_size(text: str, shape: str):
+    width = max(len(text) * CHAR_WIDTH + 2 * NODE_PADDING, 60)
+    height = NODE_HEIGHT
+    if shape == "diamond":
+        width, height = width * 1.3, height * 1.6
+    elif shape == "circle":
+        width = height = max(width, height)
+    return width, height
+
+
+def _layout(chart: Flowchart):
+    """Menghitung posisi pusat setiap node; mengembalikan (posisi, ukuran, lebar, tinggi)"""
+    rank = _ranks(chart)
+    layers = {}
+    for node in chart.nodes:
+        layers.setdefault(rank[node], []).append(node)
+
+    # Satu putaran barycenter untuk mengurangi edge yang bersilangan
+    parents = {node: [] for node in chart.nodes}
+    for src, dst, _, _ in chart.edges:
+        parents[dst].append(src)
+    slot = {}
+    for r in sorted(layers):
+        layer = layers[r]
+        if r > 0:
+            layer.sort(key=lambda n: (sum(slot[p] for p in parents[n] if p in slot) / len(parents[n])) if parents[n] else slot.get(n, 0))
+        for i, node in enumerate(layer):
+            slot[node] = i
+
+    sizes = {node: _node_size(*chart.nodes[node]) for node in chart.nodes}
+    horizontal = chart.direction in ("LR", "RL")
+    along = 1 if horizontal else 0    # sumbu posisi node di dalam satu lapisan
+    across = 0 if horizontal else 1   # sumbu antar lapisan
+    gap = RANK_GAP["LR" if horizontal else "TB"]
+
+    layer_span = {r: sum(sizes[n][along] for n in layers[r]) + NODE_GAP * (len(layers[r]) - 1) for r in layers}
+    layer_depth = {r: max(sizes[n][across] for n in layers[r]) for r in layers}
+    total_span = max(layer_span.values())
+
+    positions = {}
+    offset = MARGIN
+    for r in sorted(layers):
+        cursor = MARGIN + (total_span - layer_span[r]) / 2
+        for node in layers[r]:
+            center = [0.0, 0.0]
+            center[along] = cursor + sizes[node][along] / 2
+            center[across] = offset + layer_depth[r] / 2
+            positions[node] = center
+            cursor += sizes[node][along] + NODE_GAP
+        offset += layer_depth[r] + gap
+    depth = offset - gap + MARGIN
+    span = total_span + 2 * MARGIN
+
+    width, height = (depth, span) if horizontal else (span, depth)
+    if chart.direction in ("BT", "RL"):
+        for node, (x, y) in positions.items():
+            positions[node] = [width - x, y] if horizontal else [x, height - y]
+    return positions, sizes, width, height
+
+
+def _boundary_point(center, size, shape, toward):
+    """Titik pada tepi node di arah titik ``toward``"""
+    cx, cy = center
+    dx, dy = toward[0] - cx, toward[1] - cy
+    if dx == 0 and dy == 0:
+        return cx, cy
+    half_w, half_h = size[0] / 2, size[1] / 2
+    if shape == "diamond":
+        scale = 1.0 / (abs(dx) / half_w + abs(dy) / half_h)
+    elif shape == "circle":
+        scale = half_w / (dx * dx + dy * dy) ** 0.5
+    else:
+        scale = min(half_w / abs(dx) if dx else float("inf"), half_h / abs(dy) if dy else float("inf"))
+    return cx + dx * scale, cy + dy * scale
+
+
+def _shape_svg(shape, center, size):
+    cx, cy = center
+    w, h = size
+    x, y = cx - w / 2, cy - h / 2
+    style = 'fill="#ECECFF" stroke="#9370DB" stroke-width="1.5"'
+    if shape == "diamond":
+        points = f"{cx:.1f},{y:.1f} {x + w:.1f},{cy:.1f} {cx:.1f},{y + h:.1f} {x:.1f},{cy:.1f}"
+        return f'<polygon points="{points}" {style}/>'
+    if shape == "circle":
+        return f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{w / 2:.1f}" {style}/>'
+    radius = {"round": 8, "stadium": h / 2}.get(shape, 0)
+    return f'<rect x="{x:.1f}" y="{y:.1f}" width="{w:.1f}" height="{h:.1f}" rx="{radius:.1f}" {style}/>'
+
+
+def render_flowchart_svg(code: str) -> str:
+    """Merender sumber flowchart Mermaid menjadi string SVG"""
+    chart = parse_flowchart(code)
+    positions, sizes, width, height = _layout(chart)
+    marker_id = f"arrow-{source_hash(code)}"  # Unik per diagram karena SVG di-inline dalam satu halaman
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width:.0f} {height:.0f}" '
+        f'width="100%" style="max-width:{width:.0f}px" font-family="sans-serif" font-size="{FONT_SIZE}">',
+        f'<defs><marker id="{marker_id}" viewBox="0 0 10 10" refX="9" refY="5" markerWidth="8" markerHeight="8" '
+        'orient="auto-start-reverse"><path d="M0,0 L10,5 L0,10 z" fill="#333"/></marker></defs>',
+    ]
+
+    labels = []
+    for src, dst, label, op in chart.edges:
+        start = _boundary_point(positions[src], sizes[src], chart.nodes[src][1], positions[dst])
+        end = _boundary_point(positions[dst], sizes[dst], chart.nodes[dst][1], positions[src])
+        dash = ' stroke-dasharray="4 3"' if op == "-.->" else ""
+        stroke = 3 if op == "==>" else 1.5
+        marker = "" if op == "---" else f' marker-end="url(#{marker_id})"'
+        parts.append(
+            f'<line x1="{start[0]:.1f}" y1="{start[1]:.1f}" x2="{end[0]:.1f}" y2="{end[1]:.1f}" '
+            f'stroke="#333" stroke-width="{stroke}"{dash}{marker}/>'
+        )
+        if label:
+            mx, my = (start[0] + end[0]) / 2, (start[1] + end[1]) / 2
+            w = len(label) * CHAR_WIDTH * 0.85 + 8
+            labels.append(
+                f'<rect x="{mx - w / 2:.1f}" y="{my - 9:.1f}" width="{w:.1f}" height="18" fill="#f9f9f9"/>'
+                f'<text x="{mx:.1f}" y="{my:.1f}" text-anchor="middle" dominant-baseline="central" '
+                f'font-size="{FONT_SIZE - 2}">{escape(label)}</text>'
+            )
+
+    for node, (text, shape) in chart.nodes.items():
+        parts.append(_shape_svg(shape, positions[node], sizes[node]))
+        cx, cy = positions[node]
+        parts.append(
+            f'<text x="{cx:.1f}" y="{cy:.1f}" text-anchor="middle" dominant-baseline="central">{escape(text)}</text>'
+        )
+    parts.extend(labels)
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=64)
+def _cached_svg(key: str, code: str) -> str:
+    path = DIAGRAM_DIR / f"{key}.svg"
+    return load_or_build(path, lambda: render_flowchart_svg(code).encode()).decode()
+
+
+def mermaid_svg(code: str) -> str:
+    """SVG diagram dari cache (memori lalu disk), dirender jika belum ada"""
+    return _cached_svg(source_hash(code), code)
@@ -0,0 +1,185 @@
+"""Geometri eksak daerah feasible model LP dua variabel.
+
+Daerah feasible adalah irisan half-plane ``G x <= h``: kendala model (``>=``
+dibalik, ``=`` menjadi dua half-plane) ditambah x1, x2 >= 0. Titik pojoknya
+dicari dengan memotong semua pasangan garis batas sekaligus (broadcasting
+NumPy), membuang titik potong yang melanggar half-plane lain, lalu
+mengurutkannya berlawanan arah jarum jam. Hasilnya poligon konveks eksak
+(bukan sampel ``linspace``) untuk kendala apa pun, yang bisa ditulis sebagai
+path SVG atau digambar dengan matplotlib.
+"""
+from dataclasses import dataclass
+
+import numpy as np  # Komputasi numerik tervektorisasi
+
+from solver import EQ, GE, LinearProgram
+
+SUBSCRIPTS = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+SENSE_SYMBOLS = {"<=": "≤", ">=": "≥", "=": "="}
+
+
+@dataclass
+class Region:
+    """Daerah feasible dua dimensi ``G x <= h`` beserta titik pojoknya"""
+    G: np.ndarray         # (k, 2) koefisien half-plane, baris dinormalisasi
+    h: np.ndarray         # (k,) ruas kanan
+    names: list           # nama setiap half-plane
+    vertices: np.ndarray  # (V, 2) titik pojok, berlawanan arah jarum jam
+    active: list          # per titik pojok: indeks half-plane yang aktif (tight)
+    bounded: bool
+
+    @property
+    def empty(self) -> bool:
+        return self.vertices.shape[0] == 0
+
+    @property
+    def area(self) -> float:
+        """Luas poligon (rumus shoelace); inf jika daerah tidak terbatas"""
+        if not self.bounded:
+            return np.inf
+        if self.vertices.shape[0] < 3:
+            return 0.0
+        x, y = self.vertices.T
+        return 0.5 * abs(float(x @ np.roll(y, -1) - y @ np.roll(x, -1)))
+
+    def clip(self, x_max: float, y_max: float) -> "Region":
+        """Irisan dengan kotak [0, x_max] x [0, y_max] (untuk menggambar daerah tidak terbatas)"""
+        G = np.vstack([self.G, [[1.0, 0.0], [0.0, 1.0]]])
+        h = np.concatenate([self.h, [x_max, y_max]])
+        return _region(G, h, self.names + ["x₁ ≤ batas grafik", "x₂ ≤ batas grafik"])
+
+    def vertex_names(self) -> list:
+        """Untuk setiap titik pojok: nama half-plane yang berpotongan di titik itu"""
+        return [" ∩ ".join(self.names[i] for i in active) for active in self.active]
+
+
+def half_planes(A, b, senses):
+    """Mengubah kendala ``A x (<=, >=, =) b`` menjadi ``G x <= h`` (baris G bernorma 1)
+
+    Mengembalikan ``(G, h, source)``; ``source`` adalah indeks kendala asal
+    setiap half-plane. Baris nol (``0 <= h``) ikut dikembalikan apa adanya.
+    """
+    A = np.asarray(A.toarray() if hasattr(A, "toarray") else A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    senses = np.asarray(senses)
+    rows = np.arange(b.size)
+    G = np.vstack([A[senses != GE], -A[senses == GE], -A[senses == EQ]])
+    h = np.concatenate([b[senses != GE], -b[senses == GE], -b[senses == EQ]])
+    source = np.concatenate([rows[senses != GE], rows[senses == GE], rows[senses == EQ]])
+    norms = np.linalg.norm(G, axis=1)
+    scale = np.where(norms > 0, norms, 1.0)
+    return G / scale[:, None], h / scale, source
+
+
+def _region(G, h, names, tol: float = 1e-9) -> Region:
+    """Titik pojok irisan half-plane dari perpotongan semua pasangan garis batas"""
+    zero = np.linalg.norm(G, axis=1) == 0
+    if np.any(h[zero] < -tol):
+        return Region(G, h, names, np.empty((0, 2)), [], True)  # Kendala 0 <= h < 0
+    keep = np.flatnonzero(~zero)
+    G, h, names = G[keep], h[keep], [names[i] for i in keep]
+
+    # Semua pasangan (i, j) sekaligus; pasangan sejajar (determinan 0) dilewati
+    i, j = np.triu_indices(h.size, 1)
+    det = G[i, 0] * G[j, 1] - G[i, 1] * G[j, 0]
+    ok = np.abs(det) > tol
+    i, j, det = i[ok], j[ok], det[ok]
+    points = np.column_stack([
+        (h[i] * G[j, 1] - h[j] * G[i, 1]) / det,
+        (G[i, 0] * h[j] - G[j, 0] * h[i]) / det,
+    ])
+    scale = 1.0 + np.abs(h).max(initial=0.0)
+    slack = G @ points.T - h[:, None]  # (k, titik)
+    points = points[np.all(slack <= tol * scale, axis=0)]
+
+    # Titik potong yang sama (lebih dari dua garis melalui satu titik) digabung
+    if points.size:
+        extent = 1.0 + np.abs(points).max()
+        _, first = np.unique(np.round(points / extent, 9), axis=0, return_index=True)
+        points = points[np.sort(first)]
+        center = points.mean(axis=0)
+        order = np.argsort(np.arctan2(points[:, 1] - center[1], points[:, 0] - center[0]), kind="stable")
+        points = points[order] + 0.0  # Tanpa -0.0
+    tight = np.abs(G @ points.T - h[:, None]) <= tol * scale
+    active = [np.flatnonzero(tight[:, v]).tolist() for v in range(points.shape[0])]
+
+    # Tidak terbatas jika ada arah d != 0 dengan G d <= 0; dalam 2-D arah ekstremnya
+    # sejajar salah satu garis batas, jadi cukup diperiksa +/- arah setiap garis
+    directions = np.vstack([G[:, ::-1] * [1.0, -1.0], G[:, ::-1] * [-1.0, 1.0]])
+    bounded = points.shape[0] == 0 or not np.any(np.all(G @ directions.T <= tol, axis=0))
+    return Region(G, h, names, points, active, bool(bounded))
+
+
+def feasible_region(A, b, senses, con_names=None, tol: float = 1e-9) -> Region:
+    """Daerah feasible ``A x (<=, >=, =) b, x >= 0`` untuk dua variabel"""
+    A = np.asarray(A.toarray() if hasattr(A, "toarray") else A, dtype=float).reshape(-1, 2)
+    G, h, source = half_planes(A, b, senses)
+    con_names = con_names or [f"R{i + 1}" for i in range(A.shape[0])]
+    names = [con_names[i] for i in source] + ["x₁ ≥ 0", "x₂ ≥ 0"]
+    G = np.vstack([G, [[-1.0, 0.0], [0.0, -1.0]]])
+    h = np.concatenate([h, [0.0, 0.0]])
+    return _region(G, h, names, tol)
+
+
+def model_region(model: LinearProgram, tol: float = 1e-9) -> Region:
+    """Daerah feasible model LP dua variabel"""
+    if model.num_vars != 2:
+        raise ValueError(f"Geometri hanya untuk model dua variabel (model ini {model.num_vars} variabel)")
+    return feasible_region(model.A, model.b, model.senses, model.con_names, tol)
+
+
+def clip_lines(A, b, x_max: float, y_max: float) -> np.ndarray:
+    """Ruas garis ``A_i x = b_i`` di dalam kotak [0, x_max] x [0, y_max]
+
+    Hasil berbentuk (m, 2, 2) (dua ujung per garis); garis yang tidak melewati
+    kotak bernilai NaN.
+    """
+    A = np.asarray(A.toarray() if hasattr(A, "toarray") else A, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float)
+    a1, a2 = A[:, :1], A[:, 1:]
+    # Perpotongan dengan keempat sisi kotak: x = 0, x = x_max, y = 0, y = y_max
+    edge_x = np.array([0.0, x_max])
+    edge_y = np.array([0.0, y_max])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        on_vertical = np.stack([np.broadcast_to(edge_x, (b.size, 2)), (b[:, None] - a1 * edge_x) / a2], axis=-1)
+        on_horizontal = np.stack([(b[:, None] - a2 * edge_y) / a1, np.broadcast_to(edge_y, (b.size, 2))], axis=-1)
+    candidates = np.concatenate([on_vertical, on_horizontal], axis=1)  # (m, 4, 2)
+    margin = 1e-9 * (1.0 + max(x_max, y_max))
+    inside = (np.all(np.isfinite(candidates), axis=-1)
+              & (candidates[..., 0] >= -margin) & (candidates[..., 0] <= x_max + margin)
+              & (candidates[..., 1] >= -margin) & (candidates[..., 1] <= y_max + margin))
+
+    # Ujung ruas = kandidat terjauh di kedua arah sepanjang garis
+    direction = np.column_stack([-A[:, 1], A[:, 0]])
+    position = np.einsum("mkd,md->mk", np.nan_to_num(candidates), direction)
+    rows = np.arange(b.size)
+    start = np.argmin(np.where(inside, position, np.inf), axis=1)
+    end = np.argmax(np.where(inside, position, -np.inf), axis=1)
+    segments = np.stack([candidates[rows, start], candidates[rows, end]], axis=1)
+    segments[~inside.any(axis=1)] = np.nan
+    return segments
+
+
+def constraint_label(coefs, sense: str, rhs: float) -> str:
+    """Teks kendala, misal ``3x₁ + 2x₂ ≤ 120``"""
+    terms = []
+    for j, coef in enumerate(coefs):
+        if coef == 0:
+            continue
+        name = f"x{j + 1}".translate(SUBSCRIPTS)
+        magnitude = "" if abs(coef) == 1 else f"{abs(coef):g}"
+        if not terms:
+            terms.append(f"{'-' if coef < 0 else ''}{magnitude}{name}")
+        else:
+            terms.append(f"{'-' if coef < 0 else '+'} {magnitude}{name}")
+    return f"{' '.join(terms) or '0'} {SENSE_SYMBOLS.get(sense, sense)} {rhs:g}"
+
+
+def svg_path(points, to_screen) -> str:
+    """Path SVG tertutup (``M ... L ... Z``) dari titik (V, 2); ``to_screen`` memetakan koordinat ke piksel"""
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if points.shape[0] == 0:
+        return ""
+    screen = to_screen(points)
+    coords = [f"{x:.2f},{y:.2f}" for x, y in screen]
+    return "M" + " L".join(coords) + " Z"
@@ -0,0 +1,351 @@
+"""Mode headless tanpa Streamlit: CLI dan server HTTP lokal berbasis JSON-lines.
+
+Setiap baris input adalah satu record JSON, salah satu dari:
+
+* kasus dua produk: ``{"id": 1, "p1": 120000, "t1": 3, "max1": 30, "p2": 80000,
+  "t2": 2, "max2": 40, "total_time": 120}``
+* model LP umum: ``{"id": "m1", "c": [...], "A": [[...]], "senses": ["<=", ...],
+  "b": [...], "maximize": true}``
+
+Tambahkan ``"integer": true`` (atau daftar indeks variabel bulat untuk model
+umum) untuk mencari solusi bilangan bulat dengan branch-and-bound; hasilnya
+memuat ``gap`` dan ``nodes``. ``"time_limit"`` (detik) membatasi pencarian.
+
+Setiap record menghasilkan satu baris JSON solusi. Solver yang dipakai sama
+dengan halaman Optimasi (``production.solve_production`` / ``solver.solve_lp``).
+
+Contoh::
+
+    python headless.py solve skenario.jsonl -o hasil.jsonl --workers 4
+    python headless.py serve --port 8765 --workers 4
+    curl -sN --data-binary @skenario.jsonl http://127.0.0.1:8765/solve
+    curl -s http://127.0.0.1:8765/metrics
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+
+from batch import PARAMETER_NAMES
+from integer import solve_milp
+from metrics import REGISTRY
+from production import model_from_record, solve_production
+from solver import solve_lp
+
+MAX_IN_FLIGHT = 64  # Batas kelompok record yang sedang diproses per koneksi
+MAX_BATCH_LINES = 128  # Jumlah record maksimum per tugas worker (mengurangi overhead IPC)
+
+
+def _clean(value):
+    """Mengubah nilai NumPy/NaN menjadi tipe yang bisa ditulis sebagai JSON"""
+    if hasattr(value, "tolist"):
+        value = value.tolist()
+    if isinstance(value, dict):
+        return {k: _clean(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean(v) for v in value]
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def solve_record(record: dict) -> dict:
+    """Menyelesaikan satu record (dua produk atau model umum)"""
+    integer = record.get("integer") or None
+    time_limit = record.get("time_limit")
+    if "c" in record and integer is not None:
+        result = solve_milp(model_from_record(record), None if integer is True else integer,
+                            time_limit=time_limit)
+        output = {
+            "status": result.status,
+            "x": result.x,
+            "objective": result.objective,
+            "gap": result.gap,
+            "nodes": result.nodes,
+            "iterations": result.iterations,
+            "message": result.message,
+        }
+    elif "c" in record:
+        result = solve_lp(model_from_record(record))
+        output = {
+            "status": result.status,
+            "x": result.x,
+            "objective": result.objective,
+            "duals": result.duals,
+            "iterations": result.iterations,
+            "message": result.message,
+        }
+    else:
+        missing = [name for name in PARAMETER_NAMES if name not in record]
+        if missing:
+            raise ValueError(f"Parameter tidak lengkap: {', '.join(missing)}")
+        solution = solve_production(record, sensitivity=False, integer=bool(integer), time_limit=time_limit)
+        output = {
+            "status": solution["status"],
+            "x": solution["optimal_point"],
+            "objective": solution["optimal_value"],
+            "label": solution["optimal_label"],
+            "iterations": solution["iterations"],
+            "message": solution["message"],
+        }
+        if solution["integer"] is not None:
+            output["gap"] = solution["integer"]["gap"]
+            output["nodes"] = solution["integer"]["nodes"]
+    if "id" in record:
+        output = {"id": record["id"], **output}
+    return _clean(output)
+
+
+def error_line(line, message: str) -> str:
+    """Baris JSON error untuk satu record; ``id`` diambil dari record jika masih terbaca"""
+    output = {"status": "error", "message": message}
+    try:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", errors="replace")
+        record = json.loads(line)
+    except ValueError:
+        record = None
+    if isinstance(record, dict) and "id" in record:
+        output = {"id": record["id"], **output}
+    return json.dumps(output, ensure_ascii=False)
+
+
+def solve_line(line) -> str:
+    """Menyelesaikan satu baris JSON (str atau bytes UTF-8) dan mengembalikan satu baris JSON (tanpa newline)"""
+    try:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("Record harus berupa objek JSON")
+        output = solve_record(record)
+    except Exception as e:
+        return error_line(line, str(e))
+    return json.dumps(output, ensure_ascii=False)
+
+
+def solve_lines(lines) -> list:
+    """Menyelesaikan sekelompok baris dalam satu tugas worker"""
+    return [solve_line(line) for line in lines]
+
+
+def _make_executor(workers: int):
+    """Process pool untuk beberapa worker, satu thread jika workers <= 1"""
+    if workers > 1:
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=1)
+
+
+# =============== CLI ===============
+def run_cli(input_stream, output_stream, workers: int = 1, chunksize: int = 256):
+    """Membaca JSON-lines dari input dan menulis solusi (urutan sama) ke output"""
+    lines = (line for line in input_stream if line.strip())
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for out in executor.map(solve_line, lines, chunksize=chunksize):
+                output_stream.write(out + "\n")
+    else:
+        for line in lines:
+            output_stream.write(solve_line(line) + "\n")
+    output_stream.flush()
+
+
+# =============== SERVER HTTP ===============
+async def _read_headers(reader):
+    """Membaca request line dan header HTTP/1.1"""
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    if not request_line:
+        return None, None, {}
+    method, path, _ = request_line.split(" ", 2)
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return method, path, headers
+
+
+async def _iter_body(reader, headers):
+    """Menghasilkan potongan body (Content-Length atau chunked) saat tiba"""
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                await reader.readline()
+                return
+            yield await reader.readexactly(size)
+            await reader.readline()
+    else:
+        remaining = int(headers.get("content-length", 0))
+        while remaining > 0:
+            chunk = await reader.read(min(remaining, 65536))
+            if not chunk:
+                return
+            remaining -= len(chunk)
+            yield chunk
+
+
+async def _iter_line_batches(body):
+    """Memecah potongan body menjadi kelompok baris (bytes, per potongan yang tiba)
+
+    Baris tetap bytes; decode UTF-8 terjadi per record di ``solve_line`` sehingga
+    baris yang rusak hanya menghasilkan satu baris error.
+    """
+    buffer = b""
+    async for chunk in body:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        lines = [line for line in lines if line.strip()]
+        for start in range(0, len(lines), MAX_BATCH_LINES):
+            yield lines[start:start + MAX_BATCH_LINES]
+    if buffer.strip():
+        yield [buffer]
+
+
+def _chunk(data: bytes) -> bytes:
+    return b"%x\r\n%s\r\n" % (len(data), data)
+
+
+async def _send_simple(writer, status: str, body: bytes, content_type="text/plain; charset=utf-8"):
+    writer.write(
+        f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+
+
+async def _stream_solutions(reader, writer, headers, executor):
+    """Menyelesaikan record dari body dan mengalirkan solusi saat masing-masing selesai
+
+    Setelah header 200 terkirim, kegagalan apa pun (worker mati, body rusak)
+    ditulis sebagai baris error di dalam stream, lalu stream ditutup dengan benar.
+    """
+    if headers.get("transfer-encoding", "").lower() != "chunked":
+        int(headers.get("content-length", 0))  # ValueError -> 400 sebelum stream dimulai
+    loop = asyncio.get_running_loop()
+    results = asyncio.Queue()
+    in_flight = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    async def solve(lines):
+        outputs = None
+        try:
+            start = time.perf_counter()
+            outputs = await loop.run_in_executor(executor, solve_lines, lines)
+            REGISTRY.observe("stage_seconds", time.perf_counter() - start, stage="headless.batch")
+            REGISTRY.inc("headless_records_total", len(outputs))
+        except Exception as e:
+            # Misal BrokenProcessPool: setiap record tetap mendapat satu baris hasil
+            REGISTRY.inc("headless_errors_total", len(lines))
+            message = f"Worker gagal: {type(e).__name__}: {e}"
+            outputs = [error_line(line, message) for line in lines]
+        finally:
+            results.put_nowait(outputs if outputs is not None else [error_line(line, "Dibatalkan") for line in lines])
+            in_flight.release()
+
+    def write_batch(outputs):
+        writer.write(_chunk("".join(out + "\n" for out in outputs).encode()))
+
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+        b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n"
+    )
+    tasks = []
+    written = 0
+    try:
+        async for lines in _iter_line_batches(_iter_body(reader, headers)):
+            await in_flight.acquire()
+            tasks.append(asyncio.create_task(solve(lines)))
+            while not results.empty():
+                write_batch(results.get_nowait())
+                written += 1
+            await writer.drain()
+    except ValueError as e:
+        # Body rusak (misal ukuran chunk tidak valid): record yang sudah diterima tetap diselesaikan
+        write_batch([json.dumps({"status": "error", "message": f"Body tidak valid: {e}"}, ensure_ascii=False)])
+
+    while written < len(tasks):
+        write_batch(await results.get())
+        written += 1
+        if results.empty():
+            await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+async def _handle_connection(reader, writer, executor):
+    try:
+        method, path, headers = await _read_headers(reader)
+        if method is None:
+            return
+        if method == "GET" and path == "/health":
+            await _send_simple(writer, "200 OK", b"ok\n")
+        elif method == "GET" and path == "/metrics":
+            await _send_simple(writer, "200 OK", REGISTRY.to_prometheus().encode(),
+                               "text/plain; version=0.0.4; charset=utf-8")
+        elif method == "GET" and path == "/metrics.json":
+            await _send_simple(writer, "200 OK", json.dumps(REGISTRY.to_json()).encode(), "application/json")
+        elif method == "POST" and path == "/solve":
+            await _stream_solutions(reader, writer, headers, executor)
+        else:
+            await _send_simple(writer, "404 Not Found", b"Gunakan POST /solve, GET /health atau GET /metrics\n")
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except ValueError as e:
+        await _send_simple(writer, "400 Bad Request", f"{e}\n".encode())
+    finally:
+        writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, workers: int = 1):
+    """Menjalankan server HTTP lokal hingga dihentikan"""
+    executor = _make_executor(workers)
+    server = await asyncio.start_server(
+        lambda r, w: _handle_connection(r, w, executor), host, port
+    )
+    print(f"Server optimasi berjalan di http://{host}:{port} (POST /solve)", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Optimasi produksi tanpa Streamlit (JSON-lines)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve_cmd = commands.add_parser("solve", help="selesaikan record dari file/stdin")
+    solve_cmd.add_argument("input", nargs="?", default="-", help="file JSON-lines (default: stdin)")
+    solve_cmd.add_argument("-o", "--output", default="-", help="file hasil (default: stdout)")
+    solve_cmd.add_argument("--workers", type=int, default=1, help="jumlah proses worker")
+
+    serve_cmd = commands.add_parser("serve", help="jalankan server HTTP lokal")
+    serve_cmd.add_argument("--host", default="127.0.0.1")
+    serve_cmd.add_argument("--port", type=int, default=8765)
+    serve_cmd.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="jumlah proses worker")
+
+    args = parser.parse_args(argv)
+    if args.command == "solve":
+        source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+        target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+        try:
+            run_cli(source, target, workers=args.workers)
+        finally:
+            for stream in (source, target):
+                if stream not in (sys.stdin, sys.stdout):
+                    stream.close()
+    else:
+        try:
+            asyncio.run(serve(args.host, args.port, args.workers))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
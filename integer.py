@@ -0,0 +1,249 @@
+"""Solusi bilangan bulat (integer programming) dengan branch-and-bound.
+
+Setiap node adalah relaksasi LP dari model asli ditambah batas cabang
+``x_j <= floor(v)`` atau ``x_j >= ceil(v)``, diselesaikan dengan
+``solver.solve_lp``. Node dipilih best-first (batas relaksasi terbaik lebih
+dulu) dan dipangkas bila relaksasinya tidak feasible atau tidak bisa
+mengalahkan solusi bulat terbaik (incumbent).
+
+Dengan ``workers > 1`` beberapa node terbaik diselesaikan sekaligus di
+process pool; model dikirim sekali ke setiap worker dan tugas hanya berisi
+batas cabang. Batas jumlah node dan waktu menjamin solve selalu berhenti,
+dengan gap antara incumbent dan batas terbaik dilaporkan.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import heapq
+import math
+import time
+
+import numpy as np  # Komputasi numerik
+import scipy.sparse as sp  # Baris batas cabang
+
+from solver import (
+    EQ, GE, INFEASIBLE, LE, OPTIMAL, UNBOUNDED,
+    LinearProgram, solve_lp,
+)
+
+# Status tambahan saat pencarian dihentikan sebelum selesai
+NODE_LIMIT = "node_limit"
+TIME_LIMIT = "time_limit"
+
+INTEGER_TOL = 1e-6
+
+
+@dataclass
+class MILPResult:
+    """Hasil branch-and-bound"""
+    status: str
+    x: np.ndarray
+    objective: float
+    bound: float
+    gap: float
+    nodes: int
+    pruned: int
+    iterations: int
+    relaxation_objective: float
+    seconds: float
+    message: str = ""
+
+    @property
+    def success(self) -> bool:
+        return self.status == OPTIMAL
+
+    @property
+    def has_solution(self) -> bool:
+        """True jika ada solusi bulat feasible (meski belum terbukti optimal)"""
+        return bool(np.all(np.isfinite(self.x)))
+
+
+def _bounded_model(model: LinearProgram, lower: dict, upper: dict) -> LinearProgram:
+    """Model asli ditambah baris batas cabang x_j >= lower[j] dan x_j <= upper[j]"""
+    columns = list(lower) + list(upper)
+    if not columns:
+        return model
+    k = len(columns)
+    extra = sp.csr_matrix((np.ones(k), (np.arange(k), columns)), shape=(k, model.num_vars))
+    return LinearProgram(
+        c=model.c,
+        A=sp.vstack([model.A, extra], format="csr"),
+        senses=np.concatenate([model.senses, [GE] * len(lower) + [LE] * len(upper)]),
+        b=np.concatenate([model.b, list(lower.values()) + list(upper.values())]),
+        maximize=model.maximize,
+        var_names=model.var_names,
+        con_names=list(model.con_names) + [f"cabang {model.var_names[j]}" for j in columns],
+    )
+
+
+def _solve_node(model: LinearProgram, lower: dict, upper: dict):
+    """Relaksasi LP satu node; mengembalikan (status, x, objective, iterasi)"""
+    result = solve_lp(_bounded_model(model, lower, upper))
+    return result.status, result.x, result.objective, result.iterations
+
+
+# Model dikirim sekali per proses worker lewat initializer
+_WORKER_MODEL = None
+
+
+def _init_worker(model):
+    global _WORKER_MODEL
+    _WORKER_MODEL = model
+
+
+def _solve_node_in_worker(bounds):
+    return _solve_node(_WORKER_MODEL, *bounds)
+
+
+def _is_feasible(model: LinearProgram, x: np.ndarray, tol: float = 1e-7) -> bool:
+    """Memeriksa apakah x memenuhi semua kendala model"""
+    lhs = model.A @ x
+    slack = tol * (1.0 + np.abs(model.b))
+    return bool(
+        np.all(x >= 0)
+        and np.all(lhs[model.senses == LE] <= model.b[model.senses == LE] + slack[model.senses == LE])
+        and np.all(lhs[model.senses == GE] >= model.b[model.senses == GE] - slack[model.senses == GE])
+        and np.all(np.abs(lhs - model.b)[model.senses == EQ] <= slack[model.senses == EQ])
+    )
+
+
+def _fractional(x: np.ndarray, integer: np.ndarray) -> np.ndarray:
+    """Indeks variabel bulat yang nilainya masih pecahan"""
+    values = x[integer]
+    return integer[np.abs(values - np.round(values)) > INTEGER_TOL]
+
+
+def solve_milp(model: LinearProgram, integer=None, workers: int = 1, max_nodes: int = 10000,
+               time_limit: float = None, gap_tol: float = 1e-9) -> MILPResult:
+    """Menyelesaikan model dengan variabel bulat memakai branch-and-bound
+
+    ``integer`` adalah daftar indeks variabel bulat (default: semua variabel).
+    Pencarian berhenti saat gap relatif <= ``gap_tol``, atau saat ``max_nodes``
+    node / ``time_limit`` detik tercapai (status ``node_limit``/``time_limit``).
+    """
+    start = time.perf_counter()
+    n = model.num_vars
+    integer = np.arange(n) if integer is None else np.unique(np.asarray(integer, dtype=int))
+    sign = 1.0 if model.maximize else -1.0  # Di dalam pencarian semua model dianggap maksimasi
+
+    nodes = pruned = iterations = 0
+    incumbent_x = np.full(n, np.nan)
+    incumbent = -math.inf
+
+    def consider(x):
+        """Menjadikan x incumbent baru jika bulat, feasible, dan lebih baik"""
+        nonlocal incumbent, incumbent_x
+        x = x.copy()
+        x[integer] = np.round(x[integer])
+        value = sign * float(model.c @ x)
+        if value > incumbent and _is_feasible(model, x):
+            incumbent, incumbent_x = value, x
+
+    # Node akar: relaksasi LP
+    status, x, objective, it = _solve_node(model, {}, {})
+    nodes, iterations = 1, it
+    if status != OPTIMAL:
+        message = {
+            INFEASIBLE: "Relaksasi LP tidak feasible, tidak ada solusi bulat",
+            UNBOUNDED: "Relaksasi LP tidak terbatas",
+        }.get(status, "Relaksasi LP gagal diselesaikan")
+        return MILPResult(status, incumbent_x, np.nan, np.nan, np.nan, nodes, 0, iterations,
+                          np.nan, time.perf_counter() - start, message)
+    root_value = sign * objective
+
+    # Heuristik pembulatan ke bawah memberi incumbent awal untuk pemangkasan
+    consider(np.floor(x + INTEGER_TOL))
+
+    # Antrian best-first: (-batas relaksasi induk, urutan, lower, upper, x induk)
+    queue = []
+    counter = 0
+
+    def branch(value, x, lower, upper):
+        """Menambahkan dua anak untuk variabel paling pecahan, atau mencatat solusi bulat"""
+        nonlocal counter
+        candidates = _fractional(x, integer)
+        if candidates.size == 0:
+            consider(x)
+            return
+        frac = x[candidates] - np.floor(x[candidates])
+        j = int(candidates[np.argmin(np.abs(frac - 0.5))])
+        down = {**upper, j: math.floor(x[j])}
+        up = {**lower, j: math.ceil(x[j])}
+        heapq.heappush(queue, (-value, counter, lower, down))
+        heapq.heappush(queue, (-value, counter + 1, up, upper))
+        counter += 2
+
+    def prune_bound(value):
+        return value <= incumbent + gap_tol * max(1.0, abs(incumbent))
+
+    branch(root_value, x, {}, {})
+
+    executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(model,)) if workers > 1 else None
+    stop_status = OPTIMAL
+    try:
+        while queue:
+            if nodes >= max_nodes:
+                stop_status = NODE_LIMIT
+                break
+            if time_limit is not None and time.perf_counter() - start >= time_limit:
+                stop_status = TIME_LIMIT
+                break
+
+            # Ambil beberapa node terbaik sekaligus (satu per worker)
+            batch = []
+            while queue and len(batch) < max(workers, 1) and nodes + len(batch) < max_nodes:
+                parent_bound, _, lower, upper = heapq.heappop(queue)
+                if prune_bound(-parent_bound):
+                    pruned += 1
+                    continue
+                batch.append((lower, upper))
+            if not batch:
+                continue
+
+            if executor is not None:
+                solved = list(executor.map(_solve_node_in_worker, batch))
+            else:
+                solved = [_solve_node(model, lower, upper) for lower, upper in batch]
+            nodes += len(batch)
+
+            for (lower, upper), (status, x, objective, it) in zip(batch, solved):
+                iterations += it
+                if status != OPTIMAL:
+                    pruned += 1
+                    continue
+                value = sign * objective
+                if prune_bound(value):
+                    pruned += 1
+                    continue
+                branch(value, x, lower, upper)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    open_bound = max((-entry[0] for entry in queue), default=-math.inf)
+    bound = max(incumbent, open_bound) if queue else incumbent
+    if not math.isfinite(incumbent):
+        # Tidak ada solusi bulat: terbukti infeasible, atau belum ditemukan sebelum batas
+        status = INFEASIBLE if stop_status == OPTIMAL else stop_status
+        message = ("Tidak ada solusi bulat yang memenuhi semua kendala" if status == INFEASIBLE
+                   else "Batas pencarian tercapai sebelum solusi bulat ditemukan")
+        return MILPResult(status, incumbent_x, np.nan, sign * open_bound if queue else np.nan, np.nan,
+                          nodes, pruned, iterations, sign * root_value, time.perf_counter() - start, message)
+
+    gap = (bound - incumbent) / max(1.0, abs(incumbent))
+    if stop_status == OPTIMAL:
+        message = "Solusi bulat optimal ditemukan"
+    else:
+        message = f"Batas pencarian tercapai; solusi bulat terbaik dengan gap {gap:.2%}"
+    return MILPResult(
+        status=stop_status,
+        x=incumbent_x,
+        objective=sign * incumbent,
+        bound=sign * bound,
+        gap=gap,
+        nodes=nodes,
+        pruned=pruned,
+        iterations=iterations,
+        relaxation_objective=sign * root_value,
+        seconds=time.perf_counter() - start,
+        message=message,
+    )
@@ -0,0 +1,255 @@
+"""Solver interior-point primal-dual (Mehrotra predictor-corrector) untuk model besar.
+
+Model diubah ke bentuk standar ``solver.to_standard_form`` (tanpa kolom
+artifisial) lalu setiap iterasi menyelesaikan persamaan normal::
+
+    (A D A^T) dy = r,   D = X S^-1
+
+Sampai ``DENSE_MAX_ROWS`` baris matriks ``A D A^T`` difaktorkan padat dengan
+Cholesky LAPACK (BLAS multithread); untuk A yang padat perkaliannya juga lewat
+BLAS. Di atas batas itu dipakai LU sparse.
+
+Solusi interior-point berada di dalam daerah feasible (bukan titik pojok).
+Dengan ``crossover=True`` basis diidentifikasi dari solusi tersebut lalu
+diselesaikan dengan ``solver.solve_from_basis`` sehingga hasil akhirnya tetap
+titik pojok lengkap dengan basis, dual dan analisis sensitivitas.
+"""
+import time
+
+import numpy as np  # Komputasi numerik
+import scipy.linalg as la  # Faktorisasi Cholesky padat (LAPACK)
+import scipy.sparse as sp  # Persamaan normal sparse
+from scipy.sparse.linalg import splu  # Faktorisasi persamaan normal sparse
+
+from metrics import timed
+from presolve import solve_presolved
+from solver import (
+    COLD_START, OPTIMAL,
+    LinearProgram, LPResult, solve_from_basis, solve_lp, to_standard_form,
+)
+
+# Nilai LPResult.method untuk hasil interior-point
+INTERIOR = "interior"
+INTERIOR_CROSSOVER = "interior_crossover"
+
+# Pilihan solver di UI/CLI
+SOLVER_CHOICES = ("auto", "simplex", "interior")
+
+DENSE_MAX_ROWS = 8000      # Di atas ini persamaan normal difaktorkan dengan LU sparse
+DENSE_MIN_DENSITY = 0.05   # Kolom asli A sepadat ini disimpan padat untuk perkalian BLAS
+AUTO_MIN_SIZE = 300        # Pilihan otomatis: min(m, n) minimal untuk interior-point
+AUTO_MIN_DENSITY = 0.02    # ... dan kepadatan A minimal
+AUTO_MIN_NNZ = 200000      # Model dengan koefisien sebanyak ini selalu interior-point
+
+STEP_FACTOR = 0.995        # Proporsi langkah ke batas x, s > 0
+
+
+class _NormalEquations:
+    """Faktorisasi A D A^T untuk satu iterasi (Cholesky padat, atau LU sparse jika sangat besar)
+
+    Kolom ``[:num_orig]`` adalah variabel asli, sisanya slack/surplus (satu
+    koefisien per kolom) yang hanya menambah diagonal ``A D A^T``.
+    """
+
+    def __init__(self, A: sp.csr_matrix, num_orig: int):
+        m = A.shape[0]
+        self.A = A
+        self.num_orig = num_orig
+        self.cholesky = m <= DENSE_MAX_ROWS
+        # Bagian asli disimpan padat bila memang padat; perkalian A D A^T lalu lewat BLAS (gemm)
+        original = A[:, :num_orig]
+        if self.cholesky and original.nnz >= DENSE_MIN_DENSITY * m * max(num_orig, 1):
+            self.dense = original.toarray()
+            self.slack = A[:, num_orig:].tocsr()
+        else:
+            self.dense = None
+
+    def factor(self, d):
+        if self.dense is not None:
+            M = (self.dense * d[:self.num_orig]) @ self.dense.T
+            slack = (self.slack @ sp.diags(d[self.num_orig:]) @ self.slack.T).tocoo()
+            M[slack.row, slack.col] += slack.data
+        elif self.cholesky:
+            M = (self.A @ sp.diags(d) @ self.A.T).toarray()
+        else:
+            M = (self.A @ sp.diags(d) @ self.A.T).tocsc()
+            M = M + sp.identity(M.shape[0], format="csc") * (1e-14 * max(M.diagonal().max(), 1.0))
+            self._lu = splu(M, permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+                            options={"SymmetricMode": True})
+            return
+        M[np.diag_indices_from(M)] += 1e-14 * max(M.diagonal().max(), 1.0)
+        self._cho = la.cho_factor(M, lower=True, check_finite=False)
+
+    def solve(self, r):
+        if self.cholesky:
+            return la.cho_solve(self._cho, r, check_finite=False)
+        return self._lu.solve(r)
+
+
+def _step_length(v, dv) -> float:
+    """Langkah terbesar (maks 1) agar v + a dv tetap >= 0"""
+    negative = dv < 0
+    if not negative.any():
+        return 1.0
+    return min(1.0, float(np.min(-v[negative] / dv[negative])))
+
+
+def choose_solver(model: LinearProgram) -> str:
+    """``"interior"`` untuk model besar dan padat, selain itu ``"simplex"``"""
+    m, n = model.A.shape
+    nnz = model.A.nnz
+    density = nnz / max(m * n, 1)
+    if nnz >= AUTO_MIN_NNZ or (min(m, n) >= AUTO_MIN_SIZE and density >= AUTO_MIN_DENSITY):
+        return "interior"
+    return "simplex"
+
+
+def _basis_guess(x, s, m, num_cols, slack_columns) -> np.ndarray:
+    """Tebakan basis dari solusi interior: kolom dengan x_j/s_j terbesar
+
+    Jika variabel yang jelas positif kurang dari m (solusi degenerate), basis
+    dilengkapi slack agar tetap bisa difaktorkan.
+    """
+    ratio = x / np.maximum(s, 1e-300)
+    order = np.argsort(-ratio, kind="stable")
+    positive = order[:np.count_nonzero(x > s)][:m]
+    if positive.size == m:
+        return positive
+    chosen = np.zeros(num_cols, dtype=bool)
+    chosen[positive] = True
+    fill = slack_columns[~chosen[slack_columns]]
+    chosen[fill] = True
+    rest = order[~chosen[order]]
+    return np.concatenate([positive, fill, rest])[:m].astype(int)
+
+
+@timed("solver.interior")
+def solve_interior(model: LinearProgram, crossover: bool = True, tol: float = 1e-8,
+                   max_iter: int = 100) -> LPResult:
+    """Menyelesaikan model dengan metode interior-point primal-dual
+
+    ``crossover=False`` mengembalikan titik interior apa adanya (basis kosong,
+    tanpa analisis sensitivitas). Jika interior-point tidak konvergen (misal
+    model tidak feasible atau tidak terbatas) model diselesaikan ulang dengan
+    simplex agar statusnya pasti.
+    """
+    start = time.perf_counter()
+    std = to_standard_form(model)
+    num_cols = std.A.shape[1] - std.artificial.size  # Kolom artifisial ada di akhir
+    A = std.A[:, :num_cols].tocsr()
+    A_T = A.T.tocsr()
+    b, c = std.b, std.c[:num_cols]
+    m = A.shape[0]
+    normal = _NormalEquations(A, std.num_orig)
+
+    # Titik awal Mehrotra
+    normal.factor(np.ones(num_cols))
+    x = A_T @ normal.solve(b)
+    y = normal.solve(A @ c)
+    s = c - A_T @ y
+    x += max(-1.5 * x.min(), 0.0) + 1e-2
+    s += max(-1.5 * s.min(), 0.0) + 1e-2
+    xs = x @ s
+    x += 0.5 * xs / s.sum()
+    s += 0.5 * xs / x.sum()
+
+    b_norm, c_norm = 1.0 + np.linalg.norm(b), 1.0 + np.linalg.norm(c)
+    converged = False
+    for iteration in range(1, max_iter + 1):
+        r_p = b - A @ x
+        r_d = c - A_T @ y - s
+        mu = x @ s / num_cols
+        primal, dual = c @ x, b @ y
+        residual = max(np.linalg.norm(r_p) / b_norm, np.linalg.norm(r_d) / c_norm)
+        if residual < tol and abs(primal - dual) / (1.0 + abs(primal)) < tol:
+            converged = True
+            break
+        if mu < 1e-14 * (1.0 + abs(primal)):
+            # Komplementaritas sudah habis tetapi residual tertahan oleh kondisi persamaan normal;
+            # solusi diterima dengan toleransi longgar (crossover merapikannya ke titik pojok)
+            converged = residual < np.sqrt(tol)
+            break
+        if not np.isfinite(mu) or np.abs(x).max() > 1e12 * b_norm or np.abs(y).max() > 1e12 * c_norm:
+            break  # Divergen: kemungkinan tidak feasible atau tidak terbatas
+
+        d = x / s
+        normal.factor(d)
+
+        def direction(r_xs):
+            dy = normal.solve(r_p + A @ (d * r_d - r_xs / s))
+            ds = r_d - A_T @ dy
+            return (r_xs - x * ds) / s, dy, ds
+
+        # Prediktor (affine scaling) lalu korektor dengan parameter centering Mehrotra
+        dx, dy, ds = direction(-x * s)
+        alpha_p, alpha_d = _step_length(x, dx), _step_length(s, ds)
+        mu_affine = (x + alpha_p * dx) @ (s + alpha_d * ds) / num_cols
+        sigma = (mu_affine / mu) ** 3
+        dx, dy, ds = direction(-x * s - dx * ds + sigma * mu)
+
+        alpha_p = min(1.0, STEP_FACTOR * _step_length(x, dx))
+        alpha_d = min(1.0, STEP_FACTOR * _step_length(s, ds))
+        x += alpha_p * dx
+        y += alpha_d * dy
+        s += alpha_d * ds
+    else:
+        iteration = max_iter
+
+    if not converged:
+        result = solve_lp(model)
+        result.message = f"Interior-point tidak konvergen setelah {iteration} iterasi; diselesaikan dengan simplex. {result.message}"
+        return result
+
+    n = std.num_orig
+    sign = -1.0 if model.maximize else 1.0
+    if not crossover:
+        x_orig = np.maximum(x[:n], 0.0)
+        return LPResult(
+            status=OPTIMAL,
+            x=x_orig,
+            objective=float(model.c @ x_orig),
+            duals=sign * y * std.row_sign + 0.0,
+            reduced_costs=sign * s[:n] + 0.0,
+            basis=np.empty(0, dtype=int),
+            iterations=iteration,
+            message=f"Solusi optimal (interior-point, {iteration} iterasi, {time.perf_counter() - start:.2f} s)",
+            method=INTERIOR,
+        )
+
+    # Crossover: basis dari partisi x_j vs s_j, dirapikan dengan simplex
+    slack_columns = std.slack_of_row[std.slack_of_row >= 0]
+    result = solve_from_basis(model, _basis_guess(x, s, m, num_cols, slack_columns))
+    pivots = result.iterations
+    result.iterations = iteration + pivots
+    if result.method == COLD_START:
+        result.message = f"Basis crossover tidak dapat dipakai; diselesaikan ulang dengan simplex. {result.message}"
+    else:
+        result.method = INTERIOR_CROSSOVER
+        if result.status == OPTIMAL:
+            result.message = (f"Solusi optimal (interior-point {iteration} iterasi + crossover {pivots} pivot, "
+                              f"{time.perf_counter() - start:.2f} s)")
+    return result
+
+
+def solve(model: LinearProgram, solver: str = "auto", crossover: bool = True, presolve: bool = False) -> LPResult:
+    """Menyelesaikan model dengan solver pilihan (``SOLVER_CHOICES``)
+
+    ``"auto"`` memakai ``choose_solver``: interior-point untuk model besar dan
+    padat, revised simplex untuk sisanya. ``presolve=True`` mereduksi model
+    dulu (``presolve.solve_presolved``); ringkasannya ditambahkan ke pesan hasil.
+    """
+    if solver not in SOLVER_CHOICES:
+        raise ValueError(f"Solver tidak dikenal: {solver!r}")
+
+    def run(reduced):
+        choice = choose_solver(reduced) if solver == "auto" else solver
+        if choice == "interior":
+            return solve_interior(reduced, crossover=crossover)
+        return solve_lp(reduced)
+
+    if not presolve:
+        return run(model)
+    result, reduction = solve_presolved(model, run)
+    if reduction.status is None:
+        result.message = f"{reduction.summary()}. {result.message}"
+    return result
@@ -0,0 +1,287 @@
+"""Instrumentasi waktu per tahap dan ekspor metrik (Prometheus teks & JSON).
+
+Pemakaian::
+
+    trace = start_trace("hitung")      # awal handler
+    ...
+    trace.lap("validasi")              # durasi sejak lap sebelumnya
+
+    @timed("pdf.report")               # fungsi helper
+    def create_pdf_report(...): ...
+
+Setiap durasi dicatat ke histogram ``lp_stage_seconds{stage=...}`` pada
+``REGISTRY`` dan, jika ada trace aktif di thread/konteks yang sama, juga ke
+trace tersebut untuk ditampilkan di panel debug. Modul ini hanya memakai
+pustaka standar agar aman diimpor dari modul mana pun.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import bisect
+import json
+import math
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _number(value) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """Kumpulan counter, histogram dan gauge yang thread-safe"""
+
+    def __init__(self, prefix: str = "lp", buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self._help = {}
+        self._counters = {}     # (nama, label) -> nilai
+        self._histograms = {}   # (nama, label) -> {"counts", "sum", "count", "max"}
+        self._gauges = {}       # nama -> fungsi yang mengembalikan {label: nilai}
+        self._lock = threading.RLock()
+
+    def describe(self, name: str, text: str):
+        self._help[name] = text
+
+    def inc(self, name: str, amount: float = 1.0, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0, "max": 0.0}
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                hist["counts"][index] += 1
+            hist["sum"] += value
+            hist["count"] += 1
+            hist["max"] = max(hist["max"], value)
+
+    def gauge(self, name: str, collect):
+        """Mendaftarkan gauge yang nilainya dibaca saat ekspor
+
+        ``collect()`` mengembalikan angka atau dict ``{tuple_label: angka}``.
+        """
+        with self._lock:
+            self._gauges[name] = collect
+
+    def clear(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _gauge_values(self):
+        values = {}
+        for name, collect in list(self._gauges.items()):
+            try:
+                result = collect()
+            except Exception:
+                continue  # Gauge yang gagal dibaca dilewati agar ekspor tetap jalan
+            values[name] = result if isinstance(result, dict) else {(): result}
+        return values
+
+    def stage_summary(self, name: str = "stage_seconds") -> list:
+        """Ringkasan histogram per label (jumlah, total, rata-rata, maks) untuk tabel"""
+        rows = []
+        with self._lock:
+            for (metric, labels), hist in sorted(self._histograms.items()):
+                if metric != name or not hist["count"]:
+                    continue
+                rows.append({
+                    **dict(labels),
+                    "count": hist["count"],
+                    "total_ms": hist["sum"] * 1000,
+                    "mean_ms": hist["sum"] / hist["count"] * 1000,
+                    "max_ms": hist["max"] * 1000,
+                })
+        return rows
+
+    def to_json(self) -> dict:
+        with self._lock:
+            counters = [
+                {"name": f"{self.prefix}_{name}", "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {
+                    "name": f"{self.prefix}_{name}",
+                    "labels": dict(labels),
+                    "buckets": dict(zip(map(str, self.buckets), _cumulative(hist["counts"]))),
+                    "sum": hist["sum"],
+                    "count": hist["count"],
+                    "max": hist["max"],
+                }
+                for (name, labels), hist in sorted(self._histograms.items())
+            ]
+        gauges = [
+            {"name": f"{self.prefix}_{name}", "labels": dict(labels), "value": value}
+            for name, series in self._gauge_values().items()
+            for labels, value in series.items()
+        ]
+        return {"counters": counters, "histograms": histograms, "gauges": gauges}
+
+    def to_prometheus(self) -> str:
+        """Ekspor dalam format teks Prometheus (exposition format 0.0.4)"""
+        lines = []
+
+        def header(name, kind):
+            full = f"{self.prefix}_{name}"
+            if name in self._help:
+                lines.append(f"# HELP {full} {self._help[name]}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        with self._lock:
+            for name in sorted({name for name, _ in self._counters}):
+                full = header(name, "counter")
+                for (metric, labels), value in sorted(self._counters.items()):
+                    if metric == name:
+                        lines.append(f"{full}{_label_text(labels)} {_number(value)}")
+
+            for name in sorted({name for name, _ in self._histograms}):
+                full = header(name, "histogram")
+                for (metric, labels), hist in sorted(self._histograms.items()):
+                    if metric != name:
+                        continue
+                    for bound, count in zip(self.buckets + (math.inf,), _cumulative(hist["counts"]) + [hist["count"]]):
+                        lines.append(f"{full}_bucket{_label_text(labels + (('le', _number(bound)),))} {count}")
+                    lines.append(f"{full}_sum{_label_text(labels)} {_number(hist['sum'])}")
+                    lines.append(f"{full}_count{_label_text(labels)} {hist['count']}")
+
+        for name, series in sorted(self._gauge_values().items()):
+            full = header(name, "gauge")
+            for labels, value in sorted(series.items()):
+                lines.append(f"{full}{_label_text(labels)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _cumulative(counts) -> list:
+    total, result = 0, []
+    for count in counts:
+        total += count
+        result.append(total)
+    return result
+
+
+REGISTRY = MetricsRegistry()
+REGISTRY.describe("stage_seconds", "Durasi setiap tahap pemrosesan (detik)")
+
+
+# =============== TRACE PER RERUN ===============
+class Trace:
+    """Daftar (tahap, detik) untuk satu eksekusi handler"""
+
+    def __init__(self, name: str, registry: MetricsRegistry = REGISTRY):
+        self.name = name
+        self.registry = registry
+        self.stages = []
+        self.started = time.perf_counter()
+        self._last = self.started
+
+    def record(self, stage: str, seconds: float):
+        self.stages.append((stage, seconds))
+
+    def lap(self, stage: str) -> float:
+        """Mencatat durasi sejak lap sebelumnya sebagai tahap ``<trace>.<stage>``"""
+        now = time.perf_counter()
+        seconds = now - self._last
+        self._last = now
+        full = f"{self.name}.{stage}"
+        self.registry.observe("stage_seconds", seconds, stage=full)
+        self.record(full, seconds)
+        return seconds
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def rows(self) -> list:
+        return [{"tahap": stage, "ms": seconds * 1000} for stage, seconds in self.stages]
+
+
+_current_trace = ContextVar("current_trace", default=None)
+
+
+def start_trace(name: str) -> Trace:
+    """Memulai trace baru untuk konteks (thread/rerun) saat ini"""
+    trace = Trace(name)
+    _current_trace.set(trace)
+    return trace
+
+
+def current_trace():
+    return _current_trace.get()
+
+
+@contextmanager
+def stage(name: str, registry: MetricsRegistry = REGISTRY):
+    """Mengukur blok kode sebagai satu tahap"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        registry.observe("stage_seconds", seconds, stage=name)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.record(name, seconds)
+
+
+def timed(name: str):
+    """Dekorator: setiap panggilan fungsi dicatat sebagai tahap ``name``"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# =============== ENDPOINT HTTP ===============
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            body, content_type = self.registry.to_prometheus().encode(), "text/plain; version=0.0.4; charset=utf-8"
+        elif self.path == "/metrics.json":
+            body, content_type = json.dumps(self.registry.to_json()).encode(), "application/json"
+        else:
+            self.send_error(404, "Gunakan /metrics atau /metrics.json")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrape berkala tidak perlu memenuhi log
+
+
+def start_http_server(port: int, host: str = "127.0.0.1"):
+    """Menjalankan endpoint /metrics dan /metrics.json di thread daemon"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True)
+    thread.start()
+    return server
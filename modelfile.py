@@ -0,0 +1,556 @@
+"""Impor model dari file MPS (free MPS) dan CPLEX-LP menjadi ``LinearProgram``.
+
+File dibuka dengan ``mmap`` sehingga hanya bagian yang sedang dibaca yang
+dimuat oleh sistem operasi. Batas section dicari dengan regex langsung di atas
+buffer, lalu setiap section diurai sekaligus oleh parser CSV berbasis C milik
+pandas. Teks LP diubah dulu menjadi satu token per baris hanya dengan
+penggantian literal. Nama baris/kolom dipetakan ke indeks dengan hash table
+(``pd.factorize``) dan matriks kendala dibangun langsung dari array triplet
+(baris, kolom, nilai), tanpa loop Python per koefisien.
+
+Batasan, karena ``LinearProgram`` hanya mengenal variabel x >= 0:
+
+* batas atas dan batas bawah positif ditambahkan sebagai baris kendala;
+* variabel bebas atau dengan batas bawah negatif ditolak dengan ``ValueError``;
+* MPS harus berformat bebas (nama tanpa spasi) dan setiap baris RHS/RANGES/BOUNDS
+  memuat nama set; section SOS/kuadratik tidak didukung.
+"""
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+import mmap
+import re
+
+import numpy as np  # Array triplet koefisien
+import pandas as pd  # Parser CSV berbasis C untuk isi section
+import scipy.sparse as sp  # Matriks kendala sparse
+
+from metrics import timed
+from solver import EQ, GE, LE, LinearProgram
+
+FORMATS = ("mps", "lp")
+
+_NEWLINE = re.compile(rb"\n")
+_NUMBER = rb"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+_COMPARATORS = {"<=": LE, "=<": LE, "<": LE, ">=": GE, "=>": GE, ">": GE, "=": EQ}
+
+
+@dataclass
+class ModelFile:
+    """Model hasil impor beserta informasi dari file"""
+    model: LinearProgram
+    integer: np.ndarray          # Indeks variabel bulat (MARKER INTORG, BV/LI/UI, General/Binary)
+    name: str = ""
+    format: str = "mps"
+    objective_offset: float = 0.0  # Konstanta fungsi tujuan (tidak ikut dioptimalkan)
+
+    @property
+    def nnz(self) -> int:
+        return int(self.model.A.nnz)
+
+
+# =============== UTILITAS ===============
+def _sections(buffer, pattern) -> list:
+    """Daftar (kata kunci, sisa baris header, awal isi, akhir isi) untuk setiap section
+
+    ``pattern`` diawali ``\\n`` sehingga regex melompat antar baris dengan pencarian
+    literal; baris pertama file diperiksa terpisah.
+    """
+    first_line = _NEWLINE.search(buffer)
+    first_line = bytes(buffer[:first_line.start() if first_line else len(buffer)])
+    headers = []
+    match = pattern.match(b"\n" + first_line)
+    if match:
+        headers.append((match.group(1), match.group(2), 0, match.end() - 1))
+    headers.extend((match.group(1), match.group(2), match.start(), match.end()) for match in pattern.finditer(buffer))
+    result = []
+    for i, (keyword, rest, _, start) in enumerate(headers):
+        end = headers[i + 1][2] if i + 1 < len(headers) else len(buffer)
+        result.append((keyword.upper().decode(), rest.strip(), start, end))
+    return result
+
+
+def _read_table(data: bytes, names, dtype=None) -> pd.DataFrame:
+    """Membaca isi section yang dipisah spasi dengan parser C pandas"""
+    if not data.strip():
+        return pd.DataFrame({name: pd.Series(dtype=(dtype or {}).get(name, object)) for name in names})
+    return pd.read_csv(BytesIO(data), sep=r"\s+", header=None, names=names, dtype=dtype,
+                       engine="c", na_filter=True, keep_default_na=False, na_values=[""])
+
+
+def _lookup(declared, names, what: str) -> np.ndarray:
+    """Posisi setiap nama di ``declared`` (satu kali hash untuk keduanya)
+
+    Nama yang tidak ada di ``declared`` menghasilkan ValueError.
+    """
+    k = len(declared)
+    codes, uniques = pd.factorize(np.concatenate([np.asarray(declared, dtype=object), np.asarray(names, dtype=object)]))
+    if codes[:k].max(initial=-1) != k - 1:
+        raise ValueError(f"Nama {what.lower()} ganda")
+    if len(uniques) > k:
+        raise ValueError(f"{what} tidak dikenal: {uniques[k]}")
+    return codes[k:]
+
+
+def _with_bounds(c, A, senses, b, maximize, var_names, con_names, lower, upper):
+    """Menyusun LinearProgram; batas variabel ditambahkan sebagai baris kendala"""
+    negative = np.flatnonzero(lower < 0)
+    if negative.size:
+        raise ValueError(f"Variabel bebas/batas bawah negatif belum didukung: {var_names[negative[0]]}")
+
+    fixed = np.flatnonzero(np.isfinite(upper) & (lower == upper))
+    lower_rows = np.flatnonzero((lower > 0) & (lower != upper))
+    upper_rows = np.flatnonzero(np.isfinite(upper) & (lower != upper))
+    columns = np.concatenate([fixed, lower_rows, upper_rows])
+    if columns.size:
+        k = columns.size
+        extra = sp.csr_matrix((np.ones(k), (np.arange(k), columns)), shape=(k, A.shape[1]))
+        A = sp.vstack([A, extra], format="csr")
+        senses = np.concatenate([senses, [EQ] * fixed.size + [GE] * lower_rows.size + [LE] * upper_rows.size])
+        b = np.concatenate([b, lower[fixed], lower[lower_rows], upper[upper_rows]])
+        con_names = (list(con_names) + [f"tetap {var_names[j]}" for j in fixed]
+                     + [f"batas bawah {var_names[j]}" for j in lower_rows]
+                     + [f"batas atas {var_names[j]}" for j in upper_rows])
+    return LinearProgram(c=c, A=A, senses=senses, b=b, maximize=maximize,
+                         var_names=list(var_names), con_names=list(con_names))
+
+
+# =============== MPS ===============
+_MPS_SECTION = re.compile(
+    rb"\n(?=[^ \t\n*])(?i:(NAME|ROWS|COLUMNS|RHS|RANGES|BOUNDS|SOS|QUADOBJ|QSECTION|QMATRIX|QCMATRIX|ENDATA"
+    rb"|OBJSENSE|OBJSENS|OBJNAME))\b([^\n]*)"
+)
+_MPS_COMMENT = re.compile(rb"^\*[^\n]*", re.M)
+_MPS_MARKER = re.compile(rb"^[ \t]*\S+[ \t]+'MARKER'[ \t]+'(INTORG|INTEND)'[^\n]*", re.M | re.I)
+
+
+def _pairs(table: pd.DataFrame, key: str):
+    """Menggabungkan pasangan (baris, nilai) kolom ke-1 dan ke-2 pada baris MPS"""
+    second = table["row2"].notna().to_numpy()
+    keys = np.concatenate([table[key].to_numpy(), table[key].to_numpy()[second]])
+    rows = np.concatenate([table["row1"].to_numpy(), table["row2"].to_numpy()[second]])
+    values = np.concatenate([table["value1"].to_numpy(dtype=float), table["value2"].to_numpy(dtype=float)[second]])
+    return keys, rows, values
+
+
+@timed("modelfile.mps")
+def parse_mps(buffer) -> ModelFile:
+    """Mengurai model MPS dari buffer bytes-like (bytes, memoryview, mmap)"""
+    sections = _sections(buffer, _MPS_SECTION)
+    if not any(keyword == "COLUMNS" for keyword, *_ in sections):
+        raise ValueError("File MPS tidak memiliki section COLUMNS")
+
+    def body(start, end):
+        data = bytes(buffer[start:end])
+        return _MPS_COMMENT.sub(b"", data) if b"*" in data else data
+
+    name, maximize = "", False
+    pair_columns = ["set", "row1", "value1", "row2", "value2"]
+    pair_dtype = {"set": object, "row1": object, "value1": float, "row2": object, "value2": float}
+    rows = _read_table(b"", ["type", "name"])
+    columns, rhs, ranges, bounds = [], [], [], []
+    for keyword, rest, start, end in sections:
+        if keyword == "NAME":
+            name = rest.decode(errors="replace")
+        elif keyword in ("OBJSENSE", "OBJSENS"):
+            maximize = (rest or bytes(body(start, end)).strip()).upper().startswith(b"MAX")
+        elif keyword == "ROWS":
+            rows = _read_table(body(start, end), ["type", "name"], {"type": object, "name": object})
+        elif keyword == "COLUMNS":
+            data = body(start, end)
+            # Blok di antara MARKER INTORG/INTEND berisi variabel bulat
+            position, integer_block = 0, False
+            for marker in (_MPS_MARKER.finditer(data) if b"'MARKER'" in data else ()):
+                columns.append((_read_table(data[position:marker.start()], pair_columns, pair_dtype), integer_block))
+                position, integer_block = marker.end(), marker.group(1).upper() == b"INTORG"
+            columns.append((_read_table(data[position:], pair_columns, pair_dtype), integer_block))
+        elif keyword == "RHS":
+            rhs.append(_read_table(body(start, end), pair_columns, pair_dtype))
+        elif keyword == "RANGES":
+            ranges.append(_read_table(body(start, end), pair_columns, pair_dtype))
+        elif keyword == "BOUNDS":
+            bounds.append(_read_table(body(start, end), ["type", "set", "column", "value"],
+                                      {"type": object, "set": object, "column": object, "value": float}))
+        elif keyword not in ("ENDATA", "OBJNAME"):
+            raise ValueError(f"Section MPS {keyword} belum didukung")
+
+    # Baris: N pertama = fungsi tujuan, N lain diabaikan, L/G/E = kendala
+    row_types = rows["type"].str.upper().to_numpy(dtype=str)
+    row_names = rows["name"].to_numpy(dtype=object)
+    objective_rows = np.flatnonzero(row_types == "N")
+    if objective_rows.size == 0:
+        raise ValueError("File MPS tidak memiliki baris fungsi tujuan (N)")
+    constraint_rows = np.flatnonzero(row_types != "N")
+    if not np.isin(row_types[constraint_rows], ("L", "G", "E")).all():
+        raise ValueError("Jenis baris MPS harus N, L, G atau E")
+    objective_row = objective_rows[0]
+    position_of_row = np.full(len(row_names), -1)
+    position_of_row[constraint_rows] = np.arange(constraint_rows.size)
+    m = constraint_rows.size
+
+    # Kolom: urutan kemunculan pertama di COLUMNS
+    tables = [table for table, _ in columns]
+    table = pd.concat(tables, ignore_index=True) if tables else _read_table(b"", pair_columns)
+    keys, entry_rows, values = _pairs(table, "set")
+    var_codes, var_names = pd.factorize(keys)
+    n = len(var_names)
+    integer_mask = np.zeros(n, dtype=bool)
+    offset = 0
+    for block, integer_block in columns:
+        if integer_block and len(block):
+            integer_mask[var_codes[offset:offset + len(block)]] = True
+        offset += len(block)
+
+    entry_rows = _lookup(row_names, entry_rows, "Baris")
+    is_objective = entry_rows == objective_row
+    c = np.bincount(var_codes[is_objective], weights=values[is_objective], minlength=n)
+    in_matrix = position_of_row[entry_rows] >= 0
+    A = sp.csr_matrix(
+        (values[in_matrix], (position_of_row[entry_rows[in_matrix]], var_codes[in_matrix])), shape=(m, n)
+    )
+
+    # Ruas kanan (nilai pada baris tujuan = minus konstanta tujuan)
+    b = np.zeros(m)
+    objective_offset = 0.0
+    if rhs:
+        _, rhs_rows, rhs_values = _pairs(pd.concat(rhs, ignore_index=True), "set")
+        rhs_rows = _lookup(row_names, rhs_rows, "Baris RHS")
+        objective_offset = -float(rhs_values[rhs_rows == objective_row].sum())
+        keep = position_of_row[rhs_rows] >= 0
+        b[position_of_row[rhs_rows[keep]]] = rhs_values[keep]
+
+    senses = np.select([row_types[constraint_rows] == "L", row_types[constraint_rows] == "G"], [LE, GE], EQ)
+    con_names = row_names[constraint_rows].tolist()
+
+    # RANGES: baris menjadi dua sisi, sisi kedua ditambahkan sebagai baris baru
+    if ranges:
+        _, range_rows, range_values = _pairs(pd.concat(ranges, ignore_index=True), "set")
+        range_rows = position_of_row[_lookup(row_names, range_rows, "Baris RANGES")]
+        if (range_rows < 0).any():
+            raise ValueError("RANGES tidak boleh mengenai baris N")
+        base, sense = b[range_rows], senses[range_rows]
+        width = np.abs(range_values)
+        up = (sense == GE) | ((sense == EQ) & (range_values > 0))
+        extra_b = np.where(up, base + width, base - width)
+        extra_senses = np.where(up, LE, GE)
+        # Baris E dengan range menjadi pertidaksamaan pada sisi yang berlawanan
+        senses = senses.copy()
+        senses[range_rows[sense == EQ]] = np.where(up[sense == EQ], GE, LE)
+        A = sp.vstack([A, A[range_rows]], format="csr")
+        b = np.concatenate([b, extra_b])
+        senses = np.concatenate([senses, extra_senses])
+        con_names = con_names + [f"range {con_names[i]}" for i in range_rows]
+
+    lower, upper = np.zeros(n), np.full(n, np.inf)
+    if bounds:
+        table = pd.concat(bounds, ignore_index=True)
+        kinds = table["type"].str.upper().to_numpy(dtype=str)
+        var = _lookup(var_names, table["column"].to_numpy(), "Kolom BOUNDS")
+        value = table["value"].to_numpy(dtype=float)
+        for kind_set, target in ((("UP", "UI"), upper), (("LO", "LI"), lower), (("FX",), lower), (("FX",), upper)):
+            mask = np.isin(kinds, kind_set)
+            target[var[mask]] = value[mask]
+        lower[var[kinds == "MI"]] = -np.inf
+        lower[var[kinds == "FR"]] = -np.inf
+        upper[var[kinds == "FR"]] = np.inf
+        upper[var[kinds == "PL"]] = np.inf
+        binary = var[kinds == "BV"]
+        lower[binary], upper[binary] = 0.0, 1.0
+        integer_mask[var[np.isin(kinds, ("BV", "LI", "UI"))]] = True
+        unknown = ~np.isin(kinds, ("UP", "UI", "LO", "LI", "FX", "MI", "FR", "PL", "BV"))
+        if unknown.any():
+            raise ValueError(f"Jenis batas MPS belum didukung: {kinds[unknown][0]}")
+
+    model = _with_bounds(c, A, senses, b, maximize, var_names.tolist(), con_names, lower, upper)
+    return ModelFile(model, np.flatnonzero(integer_mask), name, "mps", objective_offset)
+
+
+# =============== CPLEX LP ===============
+# Isi fungsi tujuan/kendala boleh langsung menyusul kata kunci pada baris yang sama
+# ("Maximize obj: 3 x", "Subject To c1: x <= 4"). Kata kunci yang diikuti ':' atau
+# pembanding (dan, selain Maximize/Minimize, tanda +/-) adalah nama variabel/kendala
+_LP_INLINE = rb"(?=[ \t]+[^\s:<>=*%s]|[ \t\r]*(?:\n|\Z))"
+_LP_SECTION = re.compile(
+    rb"\n[ \t]*(?i:((?:maximi[sz]e|maximum|max|minimi[sz]e|minimum|min)" + _LP_INLINE % b""
+    + rb"|(?:subject[ \t]+to|such[ \t]+that|s\.t\.|st\.?|bounds?|generals?|gen|integers?|binar(?:y|ies)|bin"
+    rb"|semi-continuous|semis?|sos)" + _LP_INLINE % rb"+\-"
+    + rb"|end(?=[ \t\r]*(?:\n|\Z))))()[ \t\r]*"
+)
+_LP_COMMENT = re.compile(rb"\\[^\n]*")
+_LP_EXPONENT = (re.compile(rb"[eE]-(?=[0-9])"), re.compile(rb"[eE]\+(?=[0-9])"))
+_LP_BOUND = re.compile(rb"<=|>=|=<|=>|<|>|=|[^\s<>=]+")
+_LP_TOKEN_CHARS = ("+", "-", "<", ">", "=", ":")
+_LP_DIGITS = tuple("0123456789.")
+_LP_CONSTANT = re.compile(_NUMBER.decode())
+_LP_GLUED = re.compile(r"(" + _NUMBER.decode() + r")(\D.*)")
+
+
+def _lp_rows(data: bytes) -> pd.DataFrame:
+    """Memecah teks ekspresi linear menjadi tabel token (kolom a, b, c)
+
+    Hanya penggantian literal (tanpa callback per suku): setiap tanda +/-,
+    pembanding dan nama kendala memulai baris baru, lalu parser C pandas
+    memisahkan token per baris::
+
+        c1: 3 x - y <= -2   ->   c1 :  /  3 x  /  - y  /  <=  /  - 2
+    """
+    data = data.replace(b"*", b" ").replace(b"\r", b" ")
+    # Tanda pada eksponen (1e-5) dilindungi dulu agar tidak dipecah
+    data = _LP_EXPONENT[0].sub(b"E\x04", data)
+    data = _LP_EXPONENT[1].sub(b"E\x05", data)
+    data = data.replace(b"-", b"\n- ").replace(b"+", b"\n+ ")
+    data = data.replace(b"\x04", b"-").replace(b"\x05", b"+")
+    data = data.replace(b"=<", b"\x01").replace(b"<=", b"\x01").replace(b"<", b"\x01")
+    data = data.replace(b"=>", b"\x02").replace(b">=", b"\x02").replace(b">", b"\x02")
+    data = data.replace(b"=", b"\x03")
+    data = data.replace(b"\x01", b"\n<= ").replace(b"\x02", b"\n>= ").replace(b"\x03", b"\n= ")
+    data = data.replace(b":", b" :\n")
+    if not data.strip():
+        return pd.DataFrame({"a": [], "b": [], "c": []}, dtype=object)
+    try:
+        table = pd.read_csv(BytesIO(data), sep=r"\s+", header=None, names=["a", "b", "c"], dtype=object,
+                            engine="c", na_filter=False, quoting=3)
+    except pd.errors.ParserError:
+        raise ValueError("Ekspresi linear tidak valid (terlalu banyak token dalam satu suku)") from None
+    return table.fillna("")
+
+
+def _lp_expressions(table: pd.DataFrame, constants: bool = False):
+    """Menguraikan tabel ``_lp_rows`` menjadi suku, ruas kanan dan nama kendala
+
+    Mengembalikan dict berisi array ``coef``, ``var``, ``term_row`` (nomor kendala
+    tiap suku), ``sense``, ``rhs`` (per kendala), pasangan ``name_row``/``name``
+    dan ``offset``. Dengan ``constants=True`` (fungsi tujuan) suku berupa angka
+    saja dijumlahkan ke ``offset``, bukan ditolak.
+    """
+    a, b, c = (table[column].to_numpy() for column in "abc")
+    is_name = b == ":"
+    is_comparator = (a == "<=") | (a == ">=") | (a == "=")
+    # Ruas kanan bertanda (<= -2) terpecah ke baris berikutnya
+    value_next = is_comparator & (b == "")
+    is_value = np.zeros_like(is_comparator)
+    is_value[1:] = value_next[:-1]
+    is_term = ~is_name & ~is_comparator & ~is_value
+
+    signed = (a == "+") | (a == "-")
+    first = np.where(signed, b, a)[is_term]
+    second = np.where(signed, c, b)[is_term]
+    extra = (~signed & (c != ""))[is_term]
+    has_coef = second != ""
+    var = np.where(has_coef, second, first)
+    coef_text = np.where(has_coef, first, "1")
+    initial = var.astype("<U1")
+    offset = 0.0
+    constant = np.zeros(var.size, dtype=bool)
+    if constants:
+        # Konstanta fungsi tujuan (obj: 3 x + 2 y + 5)
+        for i in np.flatnonzero(~has_coef & np.isin(initial, _LP_DIGITS)):
+            constant[i] = _LP_CONSTANT.fullmatch(var[i]) is not None
+        signs = np.where(a[is_term] == "-", -1.0, 1.0)
+        offset = float((signs[constant] * var[constant].astype(float)).sum())
+    # Koefisien yang menempel pada variabel (2x) dipisah satu per satu; jarang dipakai
+    for i in np.flatnonzero(~has_coef & ~constant & np.isin(initial, _LP_DIGITS)):
+        match = _LP_GLUED.fullmatch(var[i])
+        if match:
+            coef_text[i], var[i] = match.groups()
+            initial[i] = var[i][:1]
+    bad = extra | (np.isin(initial, _LP_DIGITS + _LP_TOKEN_CHARS) & ~constant) | (var == "")
+    if bad.any():
+        raise ValueError(f"Suku tidak valid di dekat: {' '.join(table[is_term].iloc[int(np.argmax(bad))].tolist()).strip()}")
+    try:
+        coef = coef_text.astype(float)
+    except ValueError:
+        raise ValueError(f"Koefisien tidak valid: {_first_invalid_number(coef_text)}") from None
+    coef[a[is_term] == "-"] *= -1.0
+    if constant.any():
+        term_index = np.flatnonzero(is_term)[~constant]
+        is_term = np.zeros_like(is_term)
+        is_term[term_index] = True
+        coef, var = coef[~constant], var[~constant]
+
+    row = np.cumsum(is_comparator) - is_comparator
+    comparator_rows = np.flatnonzero(is_comparator)
+    following = np.minimum(comparator_rows + 1, a.size - 1)
+    split_value = value_next[comparator_rows]
+    value_text = np.where(split_value, a[following] + b[following], b[comparator_rows])
+    if (c[comparator_rows] != "").any() or (split_value & ~((a[following] == "+") | (a[following] == "-"))).any():
+        raise ValueError("Ruas kanan kendala tidak valid")
+    try:
+        rhs = value_text.astype(float)
+    except ValueError:
+        raise ValueError(f"Ruas kanan tidak valid: {_first_invalid_number(value_text)}") from None
+
+    return {
+        "coef": coef,
+        "var": var,
+        "term_row": row[is_term],
+        "sense": np.select([a[comparator_rows] == "<=", a[comparator_rows] == ">="], [LE, GE], EQ),
+        "rhs": rhs,
+        "name_row": row[is_name],
+        "name": a[is_name],
+        "offset": offset,
+    }
+
+
+def _first_invalid_number(texts) -> str:
+    """Teks pertama yang bukan angka (hanya dipakai untuk pesan kesalahan)"""
+    for text in texts:
+        try:
+            float(text)
+        except ValueError:
+            return text
+    return ""
+
+
+def _lp_bound_value(token: bytes) -> float:
+    text = token.decode().lower().lstrip("+")
+    if text.lstrip("-") in ("inf", "infinity"):
+        return -np.inf if text.startswith("-") else np.inf
+    return float(text)
+
+
+@timed("modelfile.lp")
+def parse_lp(buffer) -> ModelFile:
+    """Mengurai model CPLEX-LP dari buffer bytes-like (bytes, memoryview, mmap)
+
+    Koefisien sebaiknya dipisah spasi atau ``*`` dari nama variabel (``3 x``,
+    ``3*x``); bentuk ``3x`` tetap diterima tetapi diurai lebih lambat.
+    """
+    sections = _sections(buffer, _LP_SECTION)
+    if not sections or not sections[0][0].startswith(("MAX", "MIN")):
+        raise ValueError("File LP harus diawali Maximize atau Minimize")
+
+    maximize = sections[0][0].startswith("MAX")
+    objective, constraints = _lp_rows(b""), _lp_rows(b"")
+    bound_lines, integer_names, binary_names = [], [], []
+    for keyword, _, start, end in sections:
+        data = _LP_COMMENT.sub(b"", bytes(buffer[start:end])).replace(b"\t", b" ")
+        if keyword.startswith(("MAX", "MIN")):
+            objective = _lp_rows(data)
+        elif keyword.startswith(("SUBJECT", "SUCH", "S.T.", "ST")):
+            constraints = _lp_rows(data)
+        elif keyword.startswith("BOUND"):
+            bound_lines.extend(line for line in data.splitlines() if line.strip())
+        elif keyword.startswith(("GEN", "INTEGER")):
+            integer_names.extend(name.decode() for name in data.split())
+        elif keyword.startswith("BIN"):
+            binary_names.extend(name.decode() for name in data.split())
+        elif keyword != "END":
+            raise ValueError(f"Section LP {keyword} belum didukung")
+
+    objective = _lp_expressions(objective, constants=True)
+    if objective["rhs"].size:
+        raise ValueError("Fungsi tujuan tidak boleh memuat pembanding")
+    constraints = _lp_expressions(constraints)
+    m = constraints["rhs"].size
+    if constraints["term_row"].size and constraints["term_row"].max() >= m:
+        raise ValueError("Kendala terakhir tidak memiliki ruas kanan")
+
+    # Variabel: urutan kemunculan pertama (tujuan, kendala, bounds, bulat)
+    bound_tokens = [_LP_BOUND.findall(line) for line in bound_lines]
+    bound_vars = [next((t.decode() for t in tokens if not _is_bound_number(t) and t not in _COMPARATOR_BYTES
+                        and t.lower() != b"free"), "") for tokens in bound_tokens]
+    codes, var_names = pd.factorize(np.concatenate([
+        objective["var"], constraints["var"], np.array(bound_vars + integer_names + binary_names, dtype=str),
+    ]))
+    n = len(var_names)
+    n_obj, n_con = objective["var"].size, constraints["var"].size
+
+    c = np.bincount(codes[:n_obj], weights=objective["coef"], minlength=n)
+    A = sp.csr_matrix((constraints["coef"], (constraints["term_row"], codes[n_obj:n_obj + n_con])), shape=(m, n))
+    senses, b = constraints["sense"], constraints["rhs"]
+    con_names = np.array([f"R{i + 1}" for i in range(m)], dtype=object)
+    named = constraints["name_row"] < m
+    con_names[constraints["name_row"][named]] = constraints["name"][named]
+
+    extra_codes = codes[n_obj + n_con:]
+    lower, upper = np.zeros(n), np.full(n, np.inf)
+    for line, tokens, j in zip(bound_lines, bound_tokens, extra_codes):
+        _apply_bound(line, tokens, j, lower, upper)
+    integer_mask = np.zeros(n, dtype=bool)
+    integer_mask[extra_codes[len(bound_vars):]] = True
+    binary = extra_codes[len(bound_vars) + len(integer_names):]
+    lower[binary] = np.maximum(lower[binary], 0.0)
+    upper[binary] = np.minimum(upper[binary], 1.0)
+
+    # Ruas kanan tak hingga berarti kendala tidak membatasi: dibuang
+    finite = np.isfinite(b)
+    if not finite.all():
+        A, senses, b, con_names = A[finite], senses[finite], b[finite], con_names[finite]
+
+    model = _with_bounds(c, A, senses, b, maximize, var_names.tolist(), con_names.tolist(), lower, upper)
+    return ModelFile(model, np.flatnonzero(integer_mask), "", "lp", objective["offset"])
+
+
+_COMPARATOR_BYTES = {key.encode() for key in _COMPARATORS}
+
+
+def _is_bound_number(token: bytes) -> bool:
+    try:
+        _lp_bound_value(token)
+    except ValueError:
+        return False
+    return True
+
+
+def _apply_bound(line, tokens, j, lower, upper):
+    """Menerapkan satu baris Bounds (``x <= 4``, ``0 <= x <= 4``, ``x free``, ...)"""
+    if len(tokens) == 2 and tokens[1].lower() == b"free":
+        lower[j], upper[j] = -np.inf, np.inf
+        return
+    if len(tokens) == 3:
+        left, op, right = tokens
+        if _is_bound_number(left):
+            # "v <= x" sama dengan "x >= v"
+            op = {b"<=": b">=", b"=<": b">=", b"<": b">=", b">=": b"<=", b"=>": b"<=", b">": b"<="}.get(op, op)
+            value = _lp_bound_value(left)
+        else:
+            value = _lp_bound_value(right)
+        sense = _COMPARATORS.get(op.decode())
+        if sense == LE:
+            upper[j] = value
+        elif sense == GE:
+            lower[j] = value
+        elif sense == EQ:
+            lower[j] = upper[j] = value
+        else:
+            raise ValueError(f"Batas tidak valid: {line.decode().strip()}")
+        return
+    if len(tokens) == 5 and _COMPARATORS.get(tokens[1].decode()) == _COMPARATORS.get(tokens[3].decode()) != EQ:
+        first, last = _lp_bound_value(tokens[0]), _lp_bound_value(tokens[4])
+        if _COMPARATORS[tokens[1].decode()] == LE:
+            lower[j], upper[j] = first, last
+        else:
+            lower[j], upper[j] = last, first
+        return
+    raise ValueError(f"Batas tidak valid: {line.decode().strip()}")
+
+
+# =============== BACA FILE ===============
+def detect_format(filename: str) -> str:
+    """Format dari ekstensi file (.mps / .lp)"""
+    suffix = Path(filename).suffix.lower().lstrip(".")
+    if suffix not in FORMATS:
+        raise ValueError(f"Ekstensi file tidak dikenal: {filename!r} (gunakan .mps atau .lp)")
+    return suffix
+
+
+def parse_model(buffer, format: str) -> ModelFile:
+    """Mengurai buffer bytes-like dengan format ``"mps"`` atau ``"lp"``"""
+    if format not in FORMATS:
+        raise ValueError(f"Format model tidak dikenal: {format!r}")
+    return parse_mps(buffer) if format == "mps" else parse_lp(buffer)
+
+
+def read_model(path, format: str = None) -> ModelFile:
+    """Membaca file model lewat ``mmap`` (format ditebak dari ekstensi jika tidak diberikan)"""
+    path = Path(path)
+    format = format or detect_format(path.name)
+    with open(path, "rb") as f:
+        if path.stat().st_size == 0:
+            raise ValueError(f"File kosong: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            result = parse_model(buffer, format)
+    if not result.name:
+        result.name = path.stem
+    return result
@@ -0,0 +1,214 @@
+"""Analisis robustness Monte Carlo untuk kasus dua produk.
+
+Keuntungan (p1, p2) dan waktu produksi (t1, t2) diperlakukan sebagai variabel
+acak. Semua sampel dibangkitkan sekaligus (tervektorisasi) lalu ditulis ke
+``multiprocessing.shared_memory``. Worker di process pool hanya menerima nama
+blok memori dan rentang indeks, membaca input langsung dari memori bersama,
+menyelesaikan potongannya dengan ``batch.solve_two_product_batch``, dan menulis
+hasil ke blok memori keluaran. Tidak ada array yang di-pickle per tugas.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+import os
+import threading
+import time
+
+import numpy as np  # Komputasi numerik tervektorisasi
+
+from batch import CORNER_LABELS, PARAMETER_NAMES, solve_two_product_batch
+from cache import normalize_parameters
+from metrics import timed
+
+STOCHASTIC_PARAMETERS = ("p1", "t1", "p2", "t2")
+DISTRIBUTION_KINDS = ("tetap", "normal", "uniform", "segitiga")
+
+SLICE_SIZE = 65536        # Skenario per potongan solve (membatasi memori sementara)
+MIN_PARALLEL_DRAWS = 50000  # Di bawah ini solve di proses sendiri lebih cepat
+
+
+@dataclass(frozen=True)
+class Distribution:
+    """Distribusi satu parameter
+
+    * ``tetap``: selalu ``loc``
+    * ``normal``: rata-rata ``loc``, simpangan baku ``scale``
+    * ``uniform``: seragam pada ``[loc - scale, loc + scale]``
+    * ``segitiga``: minimum ``loc - scale``, modus ``loc``, maksimum ``loc + scale``
+
+    Sampel negatif dipotong menjadi 0 (keuntungan dan waktu tidak negatif).
+    """
+    kind: str = "tetap"
+    loc: float = 0.0
+    scale: float = 0.0
+
+    def __post_init__(self):
+        if self.kind not in DISTRIBUTION_KINDS:
+            raise ValueError(f"Jenis distribusi tidak dikenal: {self.kind!r}")
+        if self.scale < 0:
+            raise ValueError("scale tidak boleh negatif")
+
+    @classmethod
+    def relative(cls, kind: str, value: float, spread_pct: float):
+        """Distribusi di sekitar estimasi titik dengan sebaran dalam persen"""
+        return cls(kind, float(value), abs(float(value)) * spread_pct / 100.0)
+
+    def sample(self, rng: np.random.Generator, size: int, out: np.ndarray = None) -> np.ndarray:
+        if out is None:
+            out = np.empty(size)
+        if self.kind == "tetap" or self.scale == 0:
+            out.fill(self.loc)
+        elif self.kind == "normal":
+            out[:] = rng.normal(self.loc, self.scale, size)
+        elif self.kind == "uniform":
+            out[:] = rng.uniform(self.loc - self.scale, self.loc + self.scale, size)
+        else:
+            out[:] = rng.triangular(self.loc - self.scale, self.loc, self.loc + self.scale, size)
+        np.maximum(out, 0.0, out=out)
+        return out
+
+
+@dataclass
+class MonteCarloResult:
+    """Hasil simulasi untuk N sampel"""
+    optimal_value: np.ndarray  # (N,) keuntungan optimal per sampel
+    optimal_index: np.ndarray  # (N,) indeks titik optimal (0=A ... 4=E)
+    optimal_point: np.ndarray  # (N, 2) solusi optimal per sampel
+    seconds: float
+    workers: int
+
+    def __len__(self):
+        return self.optimal_value.shape[0]
+
+    def corner_frequency(self) -> dict:
+        """Proporsi sampel di mana setiap titik A-E optimal"""
+        counts = np.bincount(self.optimal_index, minlength=len(CORNER_LABELS))
+        return {label: float(count) / len(self) for label, count in zip(CORNER_LABELS, counts)}
+
+    def summary(self) -> dict:
+        """Statistik ringkas distribusi keuntungan optimal"""
+        values = self.optimal_value
+        p5, p50, p95 = np.percentile(values, [5, 50, 95])
+        return {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "min": float(values.min()),
+            "p5": float(p5),
+            "median": float(p50),
+            "p95": float(p95),
+            "max": float(values.max()),
+        }
+
+    def histogram(self, bins: int = 50):
+        """(jumlah, tepi_bin) distribusi keuntungan optimal"""
+        return np.histogram(self.optimal_value, bins=bins)
+
+
+def sample_inputs(parameters, distributions: dict, draws: int, seed=None, out: np.ndarray = None) -> np.ndarray:
+    """Membangkitkan matriks input (7, N) dengan urutan ``PARAMETER_NAMES``
+
+    Parameter yang tidak ada di ``distributions`` bernilai tetap sesuai ``parameters``.
+    """
+    rng = np.random.default_rng(seed)
+    if out is None:
+        out = np.empty((len(PARAMETER_NAMES), draws))
+    for row, (name, value) in enumerate(zip(PARAMETER_NAMES, normalize_parameters(parameters))):
+        distribution = distributions.get(name) or Distribution("tetap", value)
+        distribution.sample(rng, draws, out=out[row])
+    return out
+
+
+def _solve_into(inputs, values, index, points, start, stop):
+    """Menyelesaikan sampel [start, stop) dan menulis hasil ke array keluaran"""
+    for lo in range(start, stop, SLICE_SIZE):
+        hi = min(lo + SLICE_SIZE, stop)
+        result = solve_two_product_batch(*inputs[:, lo:hi])
+        values[lo:hi] = result.optimal_value
+        index[lo:hi] = result.optimal_index
+        points[lo:hi] = result.optimal_point
+
+
+def _views(blocks, layout):
+    """Array NumPy di atas blok memori bersama sesuai (shape, dtype) pada layout"""
+    return [np.ndarray(shape, dtype=dtype, buffer=block.buf) for block, (shape, dtype) in zip(blocks, layout)]
+
+
+def _solve_shared(names, layout, start, stop):
+    """Tugas worker: hanya nama blok memori dan rentang indeks yang dikirim"""
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    arrays = _views(blocks, layout)
+    try:
+        _solve_into(*arrays, start, stop)
+    finally:
+        del arrays  # View harus dilepas sebelum blok ditutup
+        for block in blocks:
+            block.close()
+    return stop - start
+
+
+_pools = {}
+_pool_lock = threading.Lock()
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool yang dipakai ulang antar simulasi (satu per jumlah worker per proses)
+
+    Pool lama tidak pernah dimatikan saat ``workers`` berubah: thread lain
+    (sesi lain) mungkin masih mengirim pekerjaan ke pool tersebut.
+    """
+    with _pool_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return pool
+
+
+@timed("montecarlo.run")
+def run_monte_carlo(parameters, distributions: dict, draws: int = 100000, seed=None,
+                    workers: int = None) -> MonteCarloResult:
+    """Menjalankan simulasi Monte Carlo dan mengembalikan distribusi solusi optimal
+
+    ``workers`` default ke jumlah core. Simulasi kecil (< ``MIN_PARALLEL_DRAWS``)
+    atau ``workers=1`` diselesaikan di proses ini tanpa memori bersama.
+    """
+    start = time.perf_counter()
+    draws = int(draws)
+    if draws <= 0:
+        raise ValueError("Jumlah sampel harus lebih besar dari 0")
+    workers = workers or os.cpu_count() or 1
+    specs = [
+        ((len(PARAMETER_NAMES), draws), np.float64),  # input
+        ((draws,), np.float64),                       # keuntungan optimal
+        ((draws,), np.int8),                          # indeks titik optimal
+        ((draws, 2), np.float64),                     # titik optimal
+    ]
+
+    if workers == 1 or draws < MIN_PARALLEL_DRAWS:
+        inputs, values, index, points = (np.empty(shape, dtype) for shape, dtype in specs)
+        sample_inputs(parameters, distributions, draws, seed, out=inputs)
+        _solve_into(inputs, values, index, points, 0, draws)
+        return MonteCarloResult(values, index, points, time.perf_counter() - start, 1)
+
+    blocks = [
+        shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        for shape, dtype in specs
+    ]
+    arrays = _views(blocks, specs)
+    try:
+        sample_inputs(parameters, distributions, draws, seed, out=arrays[0])
+
+        # Beberapa potongan per worker agar beban tetap seimbang
+        names = [block.name for block in blocks]
+        step = max(SLICE_SIZE // 4, -(-draws // (workers * 4)))
+        pool = get_pool(workers)
+        futures = [pool.submit(_solve_shared, names, specs, lo, min(lo + step, draws)) for lo in range(0, draws, step)]
+        for future in futures:
+            future.result()
+
+        values, index, points = (array.copy() for array in arrays[1:])
+    finally:
+        del arrays  # View harus dilepas sebelum blok ditutup
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return MonteCarloResult(values, index, points, time.perf_counter() - start, workers)
@@ -0,0 +1,294 @@
+"""Pipeline render grafik solusi dua tingkat.
+
+* Pratinjau: SVG vektor dari poligon feasible eksak (``geometry``), tanpa
+  matplotlib sama sekali, untuk ditampilkan di layar.
+* Ekspor: PNG 300 dpi (matplotlib) untuk PDF, hanya dibuat saat laporan
+  benar-benar diminta.
+
+Render matplotlib tidak memakai state global ``pyplot``: setiap grafik
+digambar pada objek ``Figure`` sendiri dengan canvas Agg, dipinjam dari
+``FigurePool`` yang dipakai bersama oleh semua sesi/thread. Render berat bisa
+dialihkan ke process pool (``FigurePool(processes=N)``).
+
+Setiap fungsi render mengembalikan ``(data, detik)`` agar waktu render
+masing-masing tingkat bisa dilaporkan.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from html import escape
+from io import BytesIO
+import math
+import queue
+import threading
+import time
+
+import numpy as np  # Komputasi numerik untuk garis kendala
+
+from cache import normalize_parameters
+from geometry import clip_lines, constraint_label, model_region, svg_path
+from metrics import stage
+from solver import two_product_model
+
+EXPORT_DPI = 300
+FIGSIZE = (10, 6)                   # Ukuran figure matplotlib (inci)
+POOL_SIZE = 4                       # Jumlah Figure yang disimpan untuk dipakai ulang
+SVG_SIZE = (720, 432)               # Lebar, tinggi pratinjau (piksel; rasio figsize 10x6)
+SVG_MARGIN = (64, 16, 20, 52)       # Kiri, kanan, atas, bawah
+# Warna kendala berurutan (waktu produksi, permintaan 1, permintaan 2, ...) seperti grafik matplotlib
+LINE_COLORS = ("#1f77b4", "#d62728", "#2ca02c", "#9467bd", "#ff7f0e", "#8c564b")
+
+
+def solution_geometry(parameters, optimal_point):
+    """Model, daerah feasible eksak, dan batas sumbu grafik (x_max, y_max)"""
+    model = two_product_model(*normalize_parameters(parameters))
+    region = model_region(model)
+    points = region.vertices
+    finite_optimum = np.isfinite(optimal_point).all()
+    if finite_optimum:
+        points = np.vstack([points, [optimal_point]])
+    extent = points.max(axis=0) if points.size else np.zeros(2)
+    extent = np.where(extent > 0, extent * 1.2, 40.0)  # Sama dengan grafik lama saat batas 0
+    return model, region, float(extent[0]), float(extent[1])
+
+
+def _is_bound(coefs) -> bool:
+    """Kendala satu variabel (batas) digambar putus-putus"""
+    return np.count_nonzero(coefs) == 1
+
+
+def new_figure():
+    """Figure matplotlib dengan canvas Agg sendiri (tanpa pyplot, aman dipakai per thread)"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg  # Diimpor saat grafik pertama kali dibuat
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=FIGSIZE)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def build_solution_figure(parameters, optimal_point, fig=None):
+    """Menggambar daerah feasible (poligon eksak) dan solusi optimal pada ``fig`` (baru jika None)"""
+    model, region, x_max, y_max = solution_geometry(parameters, optimal_point)
+    A = model.A.toarray()
+    fig = fig if fig is not None else new_figure()
+    ax = fig.add_subplot()
+
+    # Daerah feasible: poligon eksak dipotong ke area grafik
+    shown = region.clip(x_max, y_max)
+    if not shown.empty:
+        ax.fill(shown.vertices[:, 0], shown.vertices[:, 1], color='lightblue', alpha=0.3)
+
+    # Garis batas setiap kendala
+    for i, segment in enumerate(clip_lines(A, model.b, x_max, y_max)):
+        if np.isnan(segment).any():
+            continue
+        ax.plot(segment[:, 0], segment[:, 1], color=LINE_COLORS[i % len(LINE_COLORS)],
+                linestyle='--' if _is_bound(A[i]) else '-', linewidth=1.5 if _is_bound(A[i]) else 2,
+                label=constraint_label(A[i], model.senses[i], model.b[i]))
+
+    # Titik pojok dan solusi optimal
+    if not region.empty:
+        ax.plot(region.vertices[:, 0], region.vertices[:, 1], 'o', color='#333333', markersize=4)
+    ax.plot(optimal_point[0], optimal_point[1], 'ro', markersize=10, label='Solusi Optimal')
+    ax.annotate(f'Optimal\n({optimal_point[0]:.0f}, {optimal_point[1]:.0f})',
+                xy=optimal_point,
+                xytext=(optimal_point[0]+5, optimal_point[1]+5),
+                arrowprops=dict(facecolor='black', arrowstyle='->'))
+
+    ax.set_xlim(0, x_max)
+    ax.set_ylim(0, y_max)
+    ax.set_xlabel('Produk 1 (x₁)', fontsize=12)
+    ax.set_ylabel('Produk 2 (x₂)', fontsize=12)
+    ax.legend()
+    ax.grid(True, linestyle='--', alpha=0.6)
+    return fig
+
+
+def _ticks(upper: float, count: int = 6) -> np.ndarray:
+    """Posisi tick 'bulat' (1, 2, 5 x 10^k) dari 0 sampai ``upper``"""
+    raw = upper / count
+    power = 10.0 ** math.floor(math.log10(raw))
+    step = next(f * power for f in (1, 2, 5, 10) if f * power >= raw)
+    return np.arange(0.0, upper + step * 1e-9, step)
+
+
+def build_solution_svg(parameters, optimal_point) -> str:
+    """Grafik daerah feasible dan solusi optimal sebagai dokumen SVG"""
+    model, region, x_max, y_max = solution_geometry(parameters, optimal_point)
+    A = model.A.toarray()
+    width, height = SVG_SIZE
+    left, right, top, bottom = SVG_MARGIN
+    plot_w, plot_h = width - left - right, height - top - bottom
+
+    def to_screen(points):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        return np.column_stack([left + points[:, 0] / x_max * plot_w,
+                                top + plot_h - points[:, 1] / y_max * plot_h])
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+             f'width="{width}" height="{height}" font-family="sans-serif" font-size="12">',
+             f'<rect width="{width}" height="{height}" fill="white"/>']
+
+    # Grid dan label sumbu
+    for value in _ticks(x_max):
+        x = to_screen([value, 0])[0, 0]
+        parts.append(f'<line x1="{x:.2f}" y1="{top}" x2="{x:.2f}" y2="{top + plot_h}" stroke="#b0b0b0" '
+                     f'stroke-dasharray="4 3" stroke-opacity="0.6"/>'
+                     f'<text x="{x:.2f}" y="{top + plot_h + 16}" text-anchor="middle">{value:g}</text>')
+    for value in _ticks(y_max):
+        y = to_screen([0, value])[0, 1]
+        parts.append(f'<line x1="{left}" y1="{y:.2f}" x2="{left + plot_w}" y2="{y:.2f}" stroke="#b0b0b0" '
+                     f'stroke-dasharray="4 3" stroke-opacity="0.6"/>'
+                     f'<text x="{left - 6}" y="{y + 4:.2f}" text-anchor="end">{value:g}</text>')
+    parts.append(f'<text x="{left + plot_w / 2:.2f}" y="{height - 10}" text-anchor="middle" font-size="14">Produk 1 (x₁)</text>'
+                 f'<text transform="translate(16 {top + plot_h / 2:.2f}) rotate(-90)" text-anchor="middle" '
+                 f'font-size="14">Produk 2 (x₂)</text>')
+
+    # Daerah feasible eksak
+    shown = region.clip(x_max, y_max)
+    if not shown.empty:
+        parts.append(f'<path d="{svg_path(shown.vertices, to_screen)}" fill="lightblue" fill-opacity="0.3"/>')
+
+    # Garis kendala
+    legend = []
+    for i, segment in enumerate(clip_lines(A, model.b, x_max, y_max)):
+        color = LINE_COLORS[i % len(LINE_COLORS)]
+        dash = ' stroke-dasharray="7 4"' if _is_bound(A[i]) else ''
+        legend.append((constraint_label(A[i], model.senses[i], model.b[i]), f'stroke="{color}"{dash}'))
+        if np.isnan(segment).any():
+            continue
+        (x1, y1), (x2, y2) = to_screen(segment)
+        parts.append(f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" '
+                     f'stroke="{color}" stroke-width="2"{dash}/>')
+
+    # Titik pojok (koordinat muncul sebagai tooltip) dan solusi optimal
+    for (px, py), (x, y), name in zip(to_screen(region.vertices), region.vertices, region.vertex_names()):
+        parts.append(f'<circle cx="{px:.2f}" cy="{py:.2f}" r="3.5" fill="#333333">'
+                     f'<title>({x:g}, {y:g}): {escape(name)}</title></circle>')
+    if np.isfinite(optimal_point).all():
+        (px, py), = to_screen(optimal_point)
+        parts.append(f'<circle cx="{px:.2f}" cy="{py:.2f}" r="7" fill="red"/>'
+                     f'<text x="{px + 10:.2f}" y="{py - 18:.2f}">Optimal</text>'
+                     f'<text x="{px + 10:.2f}" y="{py - 4:.2f}">({optimal_point[0]:.0f}, {optimal_point[1]:.0f})</text>')
+        legend.append(("Solusi Optimal", None))
+
+    # Legenda di pojok kanan atas
+    legend_w, row_h = 190, 18
+    x0, y0 = left + plot_w - legend_w - 8, top + 8
+    parts.append(f'<rect x="{x0}" y="{y0}" width="{legend_w}" height="{row_h * len(legend) + 8}" '
+                 f'fill="white" fill-opacity="0.85" stroke="#cccccc" rx="3"/>')
+    for k, (label, stroke) in enumerate(legend):
+        y = y0 + 4 + row_h * k + row_h / 2
+        if stroke is None:
+            parts.append(f'<circle cx="{x0 + 20}" cy="{y:.2f}" r="5" fill="red"/>')
+        else:
+            parts.append(f'<line x1="{x0 + 8}" y1="{y:.2f}" x2="{x0 + 32}" y2="{y:.2f}" {stroke} stroke-width="2"/>')
+        parts.append(f'<text x="{x0 + 40}" y="{y + 4:.2f}">{escape(label)}</text>')
+
+    parts.append(f'<rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}" fill="none" stroke="#333333"/>')
+    parts.append('</svg>')
+    return "".join(parts)
+
+
+def _draw_png(fig, parameters, optimal_point, dpi) -> bytes:
+    """Menggambar grafik pada ``fig`` (kosong) lalu merasternya menjadi PNG"""
+    with stage("plot.figure"):
+        build_solution_figure(parameters, optimal_point, fig)
+    buffer = BytesIO()
+    with stage(f"plot.savefig_{dpi}dpi"):
+        fig.savefig(buffer, format='png', bbox_inches='tight', dpi=dpi)
+    return buffer.getvalue()
+
+
+class FigurePool:
+    """Kumpulan Figure yang dipakai ulang oleh banyak thread (sesi Streamlit) sekaligus
+
+    Jumlah Figure (dan render yang berjalan bersamaan) dibatasi ``size``;
+    render lain menunggu Figure bebas. Render bersifat CPU-bound dan terkunci
+    GIL, jadi membatasi jumlahnya membuat render yang datang lebih dulu
+    selesai lebih dulu alih-alih semua melambat bersama, dan memori tetap
+    terbatas. Dengan ``processes > 0`` rasterisasi dikerjakan di process pool.
+    """
+
+    def __init__(self, size: int = POOL_SIZE, processes: int = 0):
+        self.size = size
+        self.processes = processes
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._waits = 0
+        self._renders = 0
+        self._executor = ProcessPoolExecutor(max_workers=processes) if processes > 0 else None
+
+    @contextmanager
+    def figure(self):
+        """Meminjam Figure kosong; dikembalikan (dibersihkan) ke pool setelah dipakai"""
+        fig = self._acquire()
+        try:
+            yield fig
+        finally:
+            fig.clear()
+            self._idle.put(fig)
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return new_figure()
+            self._waits += 1
+        return self._idle.get()
+
+    def render(self, parameters, optimal_point, dpi) -> tuple:
+        """Render PNG pada DPI tertentu; mengembalikan (png_bytes, detik)"""
+        start = time.perf_counter()
+        with self._lock:
+            self._renders += 1
+        if self._executor is not None:
+            png = self._executor.submit(_render_in_worker, dict(parameters), tuple(optimal_point), dpi).result()
+        else:
+            with self.figure() as fig:
+                png = _draw_png(fig, parameters, optimal_point, dpi)
+        return png, time.perf_counter() - start
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": self.size, "created": self._created, "idle": self._idle.qsize(),
+                    "waits": self._waits, "renders": self._renders, "processes": self.processes}
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_figure_pool() -> FigurePool:
+    """Pool bawaan per proses (dipakai bila pemanggil tidak memberi pool sendiri)"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = FigurePool()
+        return _default_pool
+
+
+def _render_in_worker(parameters, optimal_point, dpi) -> bytes:
+    """Dijalankan di proses worker; setiap worker memakai pool bawaannya sendiri"""
+    return get_figure_pool().render(parameters, optimal_point, dpi)[0]
+
+
+def render_preview(parameters, optimal_point):
+    """Render pratinjau layar sebagai SVG; mengembalikan (svg_text, detik)"""
+    start = time.perf_counter()
+    with stage("plot.svg"):
+        svg = build_solution_svg(parameters, optimal_point)
+    return svg, time.perf_counter() - start
+
+
+def render_export(parameters, optimal_point, pool: FigurePool = None):
+    """Render gambar ekspor 300 dpi untuk PDF; mengembalikan (png_bytes, detik)"""
+    return (pool or get_figure_pool()).render(parameters, optimal_point, EXPORT_DPI)
@@ -0,0 +1,434 @@
+"""Presolve model LP: reduksi, scaling, dan deteksi dini model tidak feasible/tidak terbatas.
+
+Reduksi diulang sampai model tidak berubah lagi:
+
+* baris kosong: diperiksa (0 <= b, 0 >= b, 0 = b) lalu dibuang;
+* kolom kosong: variabel ditetapkan 0, atau model tidak terbatas bila variabel
+  itu menambah nilai tujuan tanpa dibatasi kendala apa pun;
+* baris singleton ``a x_j (<=, >=, =) b`` adalah batas variabel: hanya batas
+  terketat per variabel yang dipertahankan, batas bawah <= 0 (sudah dijamin
+  x >= 0) dibuang, dan batas atas = batas bawah atau kendala ``=`` menetapkan
+  nilai variabel (disubstitusikan ke ruas kanan kendala lain);
+* baris yang menurut batas aktivitasnya selalu terpenuhi dibuang, yang tidak
+  mungkin terpenuhi langsung didiagnosis sebagai infeasible.
+
+Model tereduksi lalu di-scaling (rata-rata geometrik baris dan kolom, dibulatkan
+ke pangkat 2 agar tidak menambah galat pembulatan). ``PresolveResult.postsolve``
+memetakan hasil solve model tereduksi kembali ke model asli, termasuk dual,
+reduced cost, dan basis (sehingga analisis sensitivitas dan warm start tetap
+bisa dipakai).
+"""
+from dataclasses import dataclass, field
+import time
+
+import numpy as np  # Komputasi numerik tervektorisasi
+import scipy.sparse as sp  # Matriks kendala sparse
+
+from metrics import timed
+from solver import (
+    EQ, GE, INFEASIBLE, LE, OPTIMAL, UNBOUNDED,
+    LinearProgram, LPResult, solve_lp, to_standard_form,
+)
+
+MAX_PASSES = 20       # Batas putaran reduksi
+SCALING_PASSES = 4    # Putaran scaling rata-rata geometrik
+
+
+@dataclass
+class PresolveResult:
+    """Model tereduksi beserta informasi untuk memetakan solusinya kembali"""
+    original: LinearProgram
+    model: LinearProgram          # Model tereduksi dan ter-scaling (None jika sudah terselesaikan)
+    status: str = None            # INFEASIBLE/UNBOUNDED jika terdeteksi saat presolve
+    message: str = ""             # Diagnosis yang bisa dibaca pengguna
+    kept_rows: np.ndarray = None
+    kept_cols: np.ndarray = None
+    row_scale: np.ndarray = None
+    col_scale: np.ndarray = None
+    fixed_value: np.ndarray = None      # Nilai variabel yang ditetapkan (NaN = tidak ditetapkan)
+    fixing_rows: list = field(default_factory=list)  # (baris, kolom, baris_alternatif) urut penetapan
+    dropped_rows: np.ndarray = None
+    unbounded_cols: np.ndarray = None
+    seconds: float = 0.0
+
+    @property
+    def rows_removed(self) -> int:
+        return self.original.num_constraints - (self.model.num_constraints if self.model is not None else 0)
+
+    @property
+    def cols_removed(self) -> int:
+        return self.original.num_vars - (self.model.num_vars if self.model is not None else 0)
+
+    def summary(self) -> str:
+        """Ringkasan reduksi satu baris untuk UI/log"""
+        m, n = self.original.num_constraints, self.original.num_vars
+        return (f"Presolve: {self.rows_removed:,} dari {m:,} kendala dan {self.cols_removed:,} dari {n:,} "
+                f"variabel dihapus ({self.seconds * 1000:,.0f} ms)")
+
+    def failed_result(self) -> LPResult:
+        """LPResult model asli untuk status yang sudah diketahui dari presolve"""
+        n, m = self.original.num_vars, self.original.num_constraints
+        return LPResult(self.status, np.full(n, np.nan), np.nan, np.full(m, np.nan), np.full(n, np.nan),
+                        np.empty(0, dtype=int), 0, self.message)
+
+    def postsolve(self, result: LPResult) -> LPResult:
+        """Memetakan hasil solve model tereduksi ke model asli"""
+        original = self.original
+        n, m = original.num_vars, original.num_constraints
+        if not result.success:
+            return LPResult(result.status, np.full(n, np.nan), np.nan, np.full(m, np.nan), np.full(n, np.nan),
+                            np.empty(0, dtype=int), result.iterations, result.message, result.method)
+        if self.unbounded_cols.size:
+            failed = LPResult(UNBOUNDED, np.full(n, np.nan), np.nan, np.full(m, np.nan), np.full(n, np.nan),
+                              np.empty(0, dtype=int), result.iterations, self.message, result.method)
+            return failed
+
+        x = np.where(np.isnan(self.fixed_value), 0.0, self.fixed_value)
+        x[self.kept_cols] = result.x * self.col_scale
+        duals = np.zeros(m)
+        duals[self.kept_rows] = result.duals * self.row_scale
+
+        # Dual baris yang menetapkan variabel: reduced cost variabel tersebut menjadi 0.
+        # Diproses mundur karena baris yang ditetapkan belakangan bisa memuat kolom yang lebih awal.
+        # Jika variabel ditetapkan oleh batas atas = batas bawah, dual diletakkan pada batas yang
+        # tandanya benar; jika tidak ada, variabel nonbasis di batasnya dan slack baris menjadi basis.
+        A_csc = original.A.tocsc()
+        sign = 1.0 if original.maximize else -1.0
+        basic_rows, basic_cols = [], []
+        for row, col, alternative in reversed(self.fixing_rows):
+            start, end = A_csc.indptr[col], A_csc.indptr[col + 1]
+            rows, values = A_csc.indices[start:end], A_csc.data[start:end]
+            binding = -1
+            for candidate in (row, alternative):
+                if candidate < 0:
+                    continue
+                own = rows == candidate
+                dual = (original.c[col] - values[~own] @ duals[rows[~own]]) / values[own].sum()
+                sense = original.senses[candidate]
+                if not ((sense == LE and sign * dual < 0) or (sense == GE and sign * dual > 0)):
+                    duals[candidate] = dual
+                    binding = candidate
+                    break
+            if binding >= 0:
+                basic_cols.append(col)
+            basic_rows.extend(r for r in (row, alternative) if r >= 0 and r != binding)
+
+        reduced_costs = original.c - original.A.T @ duals
+        return LPResult(
+            status=OPTIMAL,
+            x=x,
+            objective=float(original.c @ x),
+            duals=duals + 0.0,
+            reduced_costs=reduced_costs + 0.0,
+            basis=self._original_basis(result.basis, basic_rows, basic_cols),
+            iterations=result.iterations,
+            message=result.message,
+            method=result.method,
+        )
+
+    def _original_basis(self, basis, basic_rows, basic_cols) -> np.ndarray:
+        """Basis model asli dari basis model tereduksi (kosong jika tidak bisa dipetakan)
+
+        Baris yang dibuang presolve dan ``basic_rows`` menyumbang slack-nya, ``basic_cols``
+        adalah variabel tetap yang tetap basis.
+        """
+        original = self.original
+        m = original.num_constraints
+        reduced_m = self.model.num_constraints if self.model is not None else 0
+        if basis is None or basis.size != reduced_m:
+            return np.empty(0, dtype=int)
+        std = to_standard_form(original)
+        art_of_row = np.full(m, -1)
+        art_of_row[_flipped_senses(original) != LE] = std.artificial
+
+        mapped = []
+        if reduced_m:
+            reduced = to_standard_form(self.model)
+            n_reduced = self.model.num_vars
+            slack_owner = np.full(reduced.A.shape[1], -1)
+            has_slack = reduced.slack_of_row >= 0
+            slack_owner[reduced.slack_of_row[has_slack]] = np.flatnonzero(has_slack)
+            art_owner = np.full(reduced.A.shape[1], -1)
+            art_owner[reduced.artificial] = np.flatnonzero(_flipped_senses(self.model) != LE)
+            for column in basis:
+                if column < n_reduced:
+                    mapped.append(self.kept_cols[column])
+                elif slack_owner[column] >= 0:
+                    mapped.append(std.slack_of_row[self.kept_rows[slack_owner[column]]])
+                else:
+                    mapped.append(art_of_row[self.kept_rows[art_owner[column]]])
+        for row in np.concatenate([self.dropped_rows, basic_rows]).astype(int):
+            mapped.append(std.slack_of_row[row] if std.slack_of_row[row] >= 0 else art_of_row[row])
+        mapped.extend(basic_cols)
+
+        mapped = np.asarray(mapped, dtype=int)
+        if mapped.size != m or (mapped < 0).any() or np.unique(mapped).size != m:
+            return np.empty(0, dtype=int)
+        return mapped
+
+
+def _flipped_senses(model: LinearProgram) -> np.ndarray:
+    """Jenis kendala setelah baris dengan b negatif dibalik (seperti ``to_standard_form``)"""
+    senses = model.senses.copy()
+    flip = model.b < 0
+    senses[flip & (model.senses == LE)] = GE
+    senses[flip & (model.senses == GE)] = LE
+    return senses
+
+
+def _scale(A: sp.csr_matrix):
+    """Faktor scaling baris dan kolom (pangkat 2) dengan rata-rata geometrik"""
+    m, n = A.shape
+    row_scale, col_scale = np.ones(m), np.ones(n)
+    if A.nnz == 0:
+        return row_scale, col_scale
+    coo = A.tocoo()
+    magnitude = np.abs(coo.data)
+    for _ in range(SCALING_PASSES):
+        scaled = magnitude * row_scale[coo.row] * col_scale[coo.col]
+        row_max = np.zeros(m)
+        np.maximum.at(row_max, coo.row, scaled)
+        row_min = np.full(m, np.inf)
+        np.minimum.at(row_min, coo.row, scaled)
+        ok = row_max > 0
+        row_scale[ok] /= np.sqrt(row_max[ok] * row_min[ok])
+
+        scaled = magnitude * row_scale[coo.row] * col_scale[coo.col]
+        col_max = np.zeros(n)
+        np.maximum.at(col_max, coo.col, scaled)
+        col_min = np.full(n, np.inf)
+        np.minimum.at(col_min, coo.col, scaled)
+        ok = col_max > 0
+        col_scale[ok] /= np.sqrt(col_max[ok] * col_min[ok])
+    return np.exp2(np.round(np.log2(row_scale))), np.exp2(np.round(np.log2(col_scale)))
+
+
+@timed("presolve")
+def presolve(model: LinearProgram, scale: bool = True, tol: float = 1e-9) -> PresolveResult:
+    """Mereduksi model; ``status`` terisi jika model sudah pasti infeasible/tidak terbatas"""
+    start = time.perf_counter()
+    m, n = model.A.shape
+    coo = model.A.tocoo()
+    keep = coo.data != 0
+    entry_row, entry_col, entry_val = coo.row[keep], coo.col[keep], coo.data[keep]
+    senses = model.senses
+    cost = -model.c if model.maximize else model.c  # Bentuk minimasi
+    b = model.b.copy()
+
+    row_alive = np.ones(m, dtype=bool)
+    col_alive = np.ones(n, dtype=bool)
+    bound_row = np.zeros(m, dtype=bool)   # Baris singleton yang dipertahankan sebagai batas
+    dropped = np.zeros(m, dtype=bool)
+    lower, upper = np.zeros(n), np.full(n, np.inf)
+    lower_row, upper_row = np.full(n, -1), np.full(n, -1)
+    fixed_value = np.full(n, np.nan)
+    fixing_rows, unbounded_cols = [], []
+
+    def result(status, message):
+        return PresolveResult(model, None, status, message, seconds=time.perf_counter() - start)
+
+    def row_name(i):
+        return model.con_names[i]
+
+    def var_name(j):
+        return model.var_names[j]
+
+    def drop(rows):
+        row_alive[rows] = False
+        bound_row[rows] = False
+        dropped[rows] = True
+
+    for _ in range(MAX_PASSES):
+        changed = False
+        alive = row_alive[entry_row] & col_alive[entry_col]
+        row_count = np.bincount(entry_row[alive], minlength=m)
+        col_count = np.bincount(entry_col[alive], minlength=n)
+
+        # Baris kosong: 0 (<=, >=, =) b
+        empty = np.flatnonzero(row_alive & (row_count == 0))
+        violated = empty[((senses[empty] == LE) & (b[empty] < -tol)) | ((senses[empty] == GE) & (b[empty] > tol))
+                         | ((senses[empty] == EQ) & (np.abs(b[empty]) > tol))]
+        if violated.size:
+            i = violated[0]
+            return result(INFEASIBLE, f"Kendala {row_name(i)} tidak dapat dipenuhi: semua koefisiennya nol "
+                                      f"(setelah variabel tetap disubstitusi) sehingga 0 {senses[i]} {b[i]:g} salah")
+        if empty.size:
+            drop(empty)
+            changed = True
+
+        # Kolom kosong: tetapkan 0, kecuali variabel menambah tujuan tanpa batas
+        empty = np.flatnonzero(col_alive & (col_count == 0))
+        if empty.size:
+            improving = empty[cost[empty] < -tol]
+            unbounded_cols.extend(improving.tolist())
+            fixed_value[empty] = 0.0
+            col_alive[empty] = False
+            changed = True
+
+        # Baris singleton menjadi batas variabel
+        singleton = row_alive & (row_count == 1) & ~bound_row
+        if singleton.any():
+            pick = alive & singleton[entry_row]
+            rows, cols, vals = entry_row[pick], entry_col[pick], entry_val[pick]
+            value = b[rows] / vals
+            sense = senses[rows]
+            is_upper = ((sense == LE) & (vals > 0)) | ((sense == GE) & (vals < 0))
+            is_lower = ((sense == GE) & (vals > 0)) | ((sense == LE) & (vals < 0))
+            is_fix = sense == EQ
+
+            bad = np.flatnonzero((is_upper | is_fix) & (value < -tol))
+            if bad.size:
+                k = bad[0]
+                return result(INFEASIBLE, f"Variabel {var_name(cols[k])} harus {'=' if is_fix[k] else '<='} "
+                                          f"{value[k]:g} (kendala {row_name(rows[k])}) padahal tidak boleh negatif")
+            # Batas bawah <= 0 sudah dijamin oleh x >= 0
+            redundant = is_lower & (value <= tol)
+            drop(rows[redundant])
+            is_lower &= ~redundant
+
+            for mask, bound, bound_rows, tighter in ((is_upper, upper, upper_row, np.less),
+                                                     (is_lower, lower, lower_row, np.greater)):
+                if not mask.any():
+                    continue
+                # Kandidat: batas baru dan batas lama pada kolom yang sama; yang terketat menang
+                new_cols, new_vals, new_rows = cols[mask], value[mask], rows[mask]
+                old = np.unique(new_cols[bound_rows[new_cols] >= 0])
+                cand_cols = np.concatenate([new_cols, old])
+                cand_vals = np.concatenate([new_vals, bound[old]])
+                cand_rows = np.concatenate([new_rows, bound_rows[old]])
+                order = np.lexsort((cand_vals if tighter is np.less else -cand_vals, cand_cols))
+                cand_cols, cand_vals, cand_rows = cand_cols[order], cand_vals[order], cand_rows[order]
+                first = np.ones(cand_cols.size, dtype=bool)
+                first[1:] = cand_cols[1:] != cand_cols[:-1]
+                drop(cand_rows[~first])
+                bound[cand_cols[first]] = cand_vals[first]
+                bound_rows[cand_cols[first]] = cand_rows[first]
+                bound_row[cand_rows[first]] = True
+
+            # Kendala '=' satu variabel: nilai variabel ditetapkan
+            for row, col, v in zip(rows[is_fix], cols[is_fix], value[is_fix]):
+                if not np.isnan(fixed_value[col]):
+                    if abs(fixed_value[col] - v) > tol * (1.0 + abs(v)):
+                        return result(INFEASIBLE, f"Variabel {var_name(col)} ditetapkan {fixed_value[col]:g} dan "
+                                                  f"{v:g} sekaligus (kendala {row_name(row)})")
+                    drop([row])
+                    continue
+                fixed_value[col] = v
+                fixing_rows.append((row, col, -1))
+                row_alive[row] = False
+            changed = True
+
+        # Batas yang bertentangan atau sama (variabel tetap)
+        conflict = np.flatnonzero(col_alive & (lower > upper + tol * (1.0 + np.abs(upper))))
+        if conflict.size:
+            j = conflict[0]
+            return result(INFEASIBLE, f"Variabel {var_name(j)} harus >= {lower[j]:g} (kendala "
+                                      f"{row_name(lower_row[j])}) dan <= {upper[j]:g} (kendala {row_name(upper_row[j])})")
+        fixing = col_alive & np.isnan(fixed_value) & np.isfinite(upper) & (upper <= lower + tol * (1.0 + np.abs(upper)))
+        for col in np.flatnonzero(fixing):
+            fixed_value[col] = upper[col]
+            fixing_rows.append((upper_row[col], col, lower_row[col]))
+            row_alive[upper_row[col]] = False
+            bound_row[upper_row[col]] = False
+            if lower_row[col] >= 0:
+                row_alive[lower_row[col]] = False
+                bound_row[lower_row[col]] = False
+
+        # Variabel tetap: substitusi ke ruas kanan, lalu kolomnya dihapus
+        newly_fixed = col_alive & ~np.isnan(fixed_value)
+        if newly_fixed.any():
+            for col in np.flatnonzero(newly_fixed):
+                v = fixed_value[col]
+                if v < lower[col] - tol * (1.0 + abs(v)) or v > upper[col] + tol * (1.0 + abs(v)):
+                    return result(INFEASIBLE, f"Nilai tetap {var_name(col)} = {v:g} di luar batasnya "
+                                              f"[{lower[col]:g}, {upper[col]:g}]")
+                for bound_rows in (lower_row, upper_row):
+                    if bound_rows[col] >= 0 and row_alive[bound_rows[col]]:
+                        drop([bound_rows[col]])
+            sub = alive & newly_fixed[entry_col]
+            np.subtract.at(b, entry_row[sub], entry_val[sub] * fixed_value[entry_col[sub]])
+            col_alive[newly_fixed] = False
+            changed = True
+
+        # Batas aktivitas baris (dengan batas variabel saat ini)
+        alive = row_alive[entry_row] & col_alive[entry_col]
+        check = row_alive & ~bound_row
+        if check.any():
+            rows, cols, vals = entry_row[alive], entry_col[alive], entry_val[alive]
+            low_part = np.where(vals > 0, vals * lower[cols], np.where(np.isinf(upper[cols]), 0.0, vals * upper[cols]))
+            high_part = np.where(vals > 0, np.where(np.isinf(upper[cols]), 0.0, vals * upper[cols]), vals * lower[cols])
+            low_inf = np.bincount(rows, weights=(vals < 0) & np.isinf(upper[cols]), minlength=m) > 0
+            high_inf = np.bincount(rows, weights=(vals > 0) & np.isinf(upper[cols]), minlength=m) > 0
+            min_activity = np.where(low_inf, -np.inf, np.bincount(rows, weights=low_part, minlength=m))
+            max_activity = np.where(high_inf, np.inf, np.bincount(rows, weights=high_part, minlength=m))
+            slack = tol * (1.0 + np.abs(b))
+
+            infeasible = check & (
+                ((senses != GE) & (min_activity > b + slack)) | ((senses != LE) & (max_activity < b - slack))
+            )
+            if infeasible.any():
+                i = np.flatnonzero(infeasible)[0]
+                low, high = min_activity[i], max_activity[i]
+                return result(INFEASIBLE, f"Kendala {row_name(i)} tidak dapat dipenuhi: dengan batas variabel "
+                                          f"ruas kirinya hanya bisa bernilai antara {low:g} dan {high:g}, "
+                                          f"sedangkan harus {senses[i]} {b[i]:g}")
+            redundant = check & (
+                ((senses == LE) & (max_activity <= b + slack)) | ((senses == GE) & (min_activity >= b - slack))
+            )
+            if redundant.any():
+                drop(np.flatnonzero(redundant))
+                changed = True
+
+        if not changed:
+            break
+
+    unbounded_cols = np.asarray(unbounded_cols, dtype=int)
+    kept_rows, kept_cols = np.flatnonzero(row_alive), np.flatnonzero(col_alive)
+    message = ""
+    if unbounded_cols.size:
+        message = (f"Fungsi tujuan tidak terbatas: variabel {var_name(unbounded_cols[0])} menambah nilai tujuan "
+                   f"dan tidak dibatasi kendala apa pun")
+        # Tanpa kendala aktif (titik nol feasible) model pasti tidak terbatas
+        rest = b[kept_rows]
+        origin_ok = np.all(np.where(senses[kept_rows] == LE, rest >= -tol,
+                                    np.where(senses[kept_rows] == GE, rest <= tol, np.abs(rest) <= tol)))
+        if origin_ok:
+            return result(UNBOUNDED, message)
+
+    A = model.A.tocsr()[kept_rows][:, kept_cols]
+    row_scale, col_scale = _scale(A) if scale else (np.ones(kept_rows.size), np.ones(kept_cols.size))
+    reduced = LinearProgram(
+        c=model.c[kept_cols] * col_scale,
+        A=sp.diags(row_scale) @ A @ sp.diags(col_scale),
+        senses=senses[kept_rows],
+        b=b[kept_rows] * row_scale,
+        maximize=model.maximize,
+        var_names=[model.var_names[j] for j in kept_cols],
+        con_names=[model.con_names[i] for i in kept_rows],
+    )
+    return PresolveResult(
+        original=model,
+        model=reduced,
+        message=message,
+        kept_rows=kept_rows,
+        kept_cols=kept_cols,
+        row_scale=row_scale,
+        col_scale=col_scale,
+        fixed_value=fixed_value,
+        fixing_rows=fixing_rows,
+        dropped_rows=np.flatnonzero(dropped & ~row_alive),
+        unbounded_cols=unbounded_cols,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def solve_presolved(model: LinearProgram, solve=solve_lp):
+    """Presolve, ``solve(model_tereduksi)``, lalu postsolve; mengembalikan (LPResult, PresolveResult)"""
+    reduction = presolve(model)
+    if reduction.status is not None:
+        return reduction.failed_result(), reduction
+    if reduction.model.num_vars == 0:
+        empty = LPResult(OPTIMAL, np.empty(0), 0.0, np.zeros(reduction.model.num_constraints), np.empty(0),
+                         np.arange(reduction.model.num_constraints), 0, "Semua variabel ditetapkan oleh presolve")
+        return reduction.postsolve(empty), reduction
+    return reduction.postsolve(solve(reduction.model)), reduction
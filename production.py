@@ -0,0 +1,124 @@
+"""Solve kasus produksi dua produk, dipakai bersama oleh UI Streamlit dan mode headless.
+
+Modul ini tidak bergantung pada Streamlit sehingga bisa dipanggil dari CLI,
+server HTTP lokal, maupun proses worker.
+"""
+import numpy as np  # Komputasi numerik
+
+from batch import CORNER_LABELS, solve_two_product_batch
+from cache import normalize_parameters
+from integer import solve_milp
+from metrics import timed
+from solver import (
+    LinearProgram, parametric_objective, resolve_lp, sensitivity_analysis, solve_lp, two_product_model,
+)
+
+
+@timed("solve.production")
+def solve_production(parameters, sensitivity: bool = True, integer: bool = False, workers: int = 1,
+                     time_limit: float = None, warm_start=None):
+    """Menghitung titik pojok dan solusi optimal untuk satu set parameter produksi
+
+    ``sensitivity=False`` melewati analisis sensitivitas (misal untuk mode headless).
+    ``integer=True`` mencari rencana produksi bulat dengan branch-and-bound;
+    solusi relaksasi LP tetap tersedia di ``relaxation_point``/``relaxation_value``.
+    ``warm_start=(parameter_sebelumnya, basis)`` memulai simplex dari basis optimal
+    solve sebelumnya (``solution['basis']``) bila hanya ruas kanan/keuntungan berubah.
+    """
+    args = normalize_parameters(parameters)
+    corner_result = solve_two_product_batch(*args)
+    model = two_product_model(*args)
+    if warm_start is not None:
+        previous_parameters, basis = warm_start
+        lp_result = resolve_lp(model, two_product_model(*normalize_parameters(previous_parameters)), basis)
+    else:
+        lp_result = solve_lp(model)
+
+    corners = [tuple(titik) for titik in corner_result.corners[0]]
+    optimal_point = tuple(lp_result.x)
+    # Cocokkan solusi simplex dengan titik pojok A-E untuk penjelasan
+    optimal_label = next(
+        (label for label, titik in zip(CORNER_LABELS, corners) if np.allclose(titik, optimal_point)),
+        f"({optimal_point[0]:.1f}, {optimal_point[1]:.1f})"
+    )
+    solution = {
+        'corners': corners,
+        'values': list(corner_result.values[0]),
+        'feasible': list(corner_result.feasible[0]),
+        'optimal_point': optimal_point,
+        'optimal_value': lp_result.objective,
+        'optimal_label': optimal_label,
+        'iterations': lp_result.iterations,
+        'method': lp_result.method,
+        'basis': lp_result.basis,
+        'status': lp_result.status,
+        'message': lp_result.message,
+        # Analisis sensitivitas dari basis optimal (tanpa solve ulang)
+        'sensitivity': sensitivity_analysis(model, lp_result) if sensitivity and lp_result.success else None,
+        'relaxation_point': optimal_point,
+        'relaxation_value': lp_result.objective,
+        'integer': None,
+    }
+    if integer and lp_result.success:
+        milp_result = solve_milp(model, workers=workers, time_limit=time_limit)
+        solution['integer'] = {
+            'status': milp_result.status,
+            'message': milp_result.message,
+            'bound': milp_result.bound,
+            'gap': milp_result.gap,
+            'nodes': milp_result.nodes,
+            'pruned': milp_result.pruned,
+            'iterations': milp_result.iterations,
+            'seconds': milp_result.seconds,
+        }
+        if milp_result.has_solution:
+            point = tuple(milp_result.x)
+            solution['optimal_point'] = point
+            solution['optimal_value'] = milp_result.objective
+            solution['optimal_label'] = next(
+                (label for label, titik in zip(CORNER_LABELS, corners) if np.allclose(titik, point)),
+                f"({point[0]:.0f}, {point[1]:.0f})"
+            )
+        else:
+            solution['status'] = milp_result.status
+            solution['message'] = milp_result.message
+    return solution
+
+
+@timed("solve.frontier")
+def profit_frontier(parameters):
+    """Rencana optimal untuk semua keuntungan/unit produk 1 (0 sampai tak hingga, p2 tetap) dalam satu pass
+
+    Mengembalikan ``(baris, ParametricResult)``; setiap baris adalah satu
+    rentang p1 (dan rasio p1/p2) dengan rencana produksi optimal yang sama.
+    Batas rentang adalah titik patah tempat rencana berpindah ke titik pojok
+    tetangga.
+    """
+    p1, t1, max1, p2, t2, max2, total_time = normalize_parameters(parameters)
+    result = parametric_objective(two_product_model(0.0, t1, max1, p2, t2, max2, total_time), [1.0, 0.0])
+    rows = []
+    for segment in result.segments:
+        rows.append({
+            'p1_from': segment.lower,
+            'p1_to': segment.upper,
+            'ratio_from': segment.lower / p2 if p2 > 0 else None,
+            'ratio_to': segment.upper / p2 if p2 > 0 else None,
+            'x1': float(segment.x[0]),
+            'x2': float(segment.x[1]),
+            'profit_from': segment.objective(segment.lower),
+            'current': segment.lower <= p1 <= segment.upper,
+        })
+    return rows, result
+
+
+def model_from_record(record) -> LinearProgram:
+    """Membuat LinearProgram dari record umum {c, A, senses, b, maximize}"""
+    return LinearProgram(
+        c=record['c'],
+        A=record['A'],
+        senses=record.get('senses', ['<='] * len(record['b'])),
+        b=record['b'],
+        maximize=record.get('maximize', True),
+        var_names=record.get('var_names'),
+        con_names=record.get('con_names'),
+    )
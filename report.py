@@ -0,0 +1,210 @@
+"""Pembuatan laporan PDF hasil optimasi sepenuhnya di memori.
+
+Gambar grafik diberikan ke reportlab langsung dari buffer ``BytesIO`` sehingga
+tidak ada file sementara yang tertinggal di disk. Mode batch menulis banyak
+laporan skenario ke satu PDF multi-halaman atau ke arsip ZIP secara bertahap:
+flowable skenario berikutnya baru dibuat saat reportlab hampir selesai
+menata skenario sebelumnya.
+"""
+from io import BytesIO
+import zipfile
+
+from reportlab.lib import colors  # Warna untuk PDF
+from reportlab.lib.pagesizes import letter  # Ukuran halaman standar PDF
+from reportlab.lib.styles import getSampleStyleSheet  # Style teks PDF
+from reportlab.lib.units import inch  # Konversi satuan inci untuk layout PDF
+from reportlab.lib.utils import ImageReader  # Membaca gambar dari buffer memori
+from reportlab.platypus import Flowable, PageBreak, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle, Image as RLImage
+
+from metrics import stage, timed
+
+PLOT_WIDTH = 5*inch
+PLOT_HEIGHT = 3*inch
+
+
+class LazyPlot(Flowable):
+    """Flowable grafik yang baru dirender saat halaman digambar
+
+    Dipakai pada PDF batch agar hanya satu gambar raster yang hidup di memori
+    pada satu waktu.
+    """
+
+    def __init__(self, render, width=PLOT_WIDTH, height=PLOT_HEIGHT):
+        super().__init__()
+        self.render = render
+        self.width = width
+        self.height = height
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        png = self.render()
+        self.canv.drawImage(ImageReader(BytesIO(png)), 0, 0, self.width, self.height)
+
+
+class _StoryFeed(list):
+    """Story reportlab yang diisi skenario demi skenario saat ``doc.build`` berjalan
+
+    ``doc.build`` memeriksa ``len(story)`` setiap kali menata satu flowable;
+    saat tersisa sedikit, flowable skenario berikutnya ditambahkan. Jadi hanya
+    flowable satu-dua skenario yang hidup bersamaan, bukan seluruh batch.
+    """
+    LOOKAHEAD = 2  # Cukup untuk judul keepWithNext + flowable sesudahnya
+
+    def __init__(self, chunks):
+        super().__init__()
+        self._chunks = iter(chunks)
+        self._started = False
+
+    def __len__(self):
+        while self._chunks is not None and super().__len__() < self.LOOKAHEAD:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._chunks = None
+                break
+            if self._started:
+                self.append(PageBreak())
+            self._started = True
+            self.extend(chunk)
+        return super().__len__()
+
+
+def _format_number(value) -> str:
+    """Format angka untuk tabel PDF (nilai tak hingga ditulis sebagai teks)"""
+    if value == float("inf"):
+        return "tak terbatas"
+    if value == float("-inf"):
+        return "-tak terbatas"
+    return f"{value:,.2f}"
+
+
+def _sensitivity_table(rows):
+    """Membuat tabel reportlab dari baris tabel sensitivitas"""
+    header = list(rows[0].keys())
+    data = [header] + [
+        [cell if isinstance(cell, str) else _format_number(cell) for cell in row.values()]
+        for row in rows
+    ]
+    table = Table(data, hAlign='LEFT')
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.lightsteelblue),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('FONTSIZE', (0, 0), (-1, -1), 8),
+        ('ALIGN', (1, 1), (-1, -1), 'RIGHT'),
+    ]))
+    return table
+
+
+def build_report_story(optimal_point, optimal_value, parameters, plot=None, sensitivity=None):
+    """Menyusun daftar flowable laporan untuk satu skenario
+
+    ``plot`` boleh berupa bytes PNG atau flowable gambar (misal ``LazyPlot``).
+    ``sensitivity`` adalah ``solver.SensitivityReport`` opsional.
+    """
+    styles = getSampleStyleSheet()
+    title_style = styles['Title']
+    heading_style = styles['Heading2']
+    body_style = styles['BodyText']
+
+    content = []
+
+    # Judul
+    content.append(Paragraph("Laporan Optimasi Produksi", title_style))
+    content.append(Spacer(1, 0.25*inch))
+
+    # Informasi Parameter
+    content.append(Paragraph("Parameter Produksi:", heading_style))
+    param_text = f"""
+    <b>Produk 1:</b><br/>
+    - Keuntungan/unit: Rp{parameters['p1']:,}<br/>
+    - Waktu produksi: {parameters['t1']} jam<br/>
+    - Maksimal permintaan: {parameters['max1']} unit<br/><br/>
+
+    <b>Produk 2:</b><br/>
+    - Keuntungan/unit: Rp{parameters['p2']:,}<br/>
+    - Waktu produksi: {parameters['t2']} jam<br/>
+    - Maksimal permintaan: {parameters['max2']} unit<br/><br/>
+
+    <b>Total waktu tersedia:</b> {parameters['total_time']} jam
+    """
+    content.append(Paragraph(param_text, body_style))
+    content.append(Spacer(1, 0.25*inch))
+
+    # Hasil Optimasi
+    content.append(Paragraph("Hasil Optimasi:", heading_style))
+    result_text = f"""
+    <b>Solusi Optimal:</b><br/>
+    - Produk 1 (x₁): {optimal_point[0]:.0f} unit<br/>
+    - Produk 2 (x₂): {optimal_point[1]:.0f} unit<br/>
+    - Keuntungan Maksimum: Rp{optimal_value:,.0f}
+    """
+    content.append(Paragraph(result_text, body_style))
+    content.append(Spacer(1, 0.25*inch))
+
+    # Analisis sensitivitas
+    if sensitivity is not None:
+        content.append(Paragraph("Analisis Sensitivitas:", heading_style))
+        content.append(_sensitivity_table(sensitivity.constraint_table()))
+        content.append(Spacer(1, 0.15*inch))
+        content.append(_sensitivity_table(sensitivity.variable_table()))
+        content.append(Spacer(1, 0.25*inch))
+
+    # Grafik langsung dari memori, tanpa file sementara
+    if plot:
+        if isinstance(plot, (bytes, bytearray)):
+            plot = RLImage(BytesIO(plot), width=PLOT_WIDTH, height=PLOT_HEIGHT)
+        content.append(Paragraph("Visualisasi Solusi:", heading_style))
+        content.append(plot)
+
+    return content
+
+
+@timed("pdf.report")
+def create_pdf_report(optimal_point, optimal_value, parameters, plot_png=None, sensitivity=None) -> bytes:
+    """Membuat laporan PDF satu skenario dan mengembalikan bytes PDF"""
+    pdf_buffer = BytesIO()
+    doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
+    with stage("pdf.story"):
+        story = build_report_story(optimal_point, optimal_value, parameters, plot_png, sensitivity)
+    with stage("pdf.doc_build"):
+        doc.build(story)
+    return pdf_buffer.getvalue()
+
+
+@timed("pdf.batch_pdf")
+def write_batch_pdf(scenarios, fileobj, plot_renderer=None):
+    """Menulis banyak skenario ke satu PDF multi-halaman
+
+    ``scenarios`` adalah iterable ``(parameters, optimal_point, optimal_value)``.
+    Jika ``plot_renderer(parameters, optimal_point) -> png_bytes`` diberikan,
+    grafik dirender satu per satu saat halamannya digambar. Skenario dibaca
+    dari iterable sambil dokumen ditata, jadi ``scenarios`` boleh berupa
+    generator yang panjang. Halaman yang sudah jadi tetap disimpan reportlab
+    (terkompresi) sampai PDF ditulis ke ``fileobj``.
+    """
+    def chunks():
+        for parameters, optimal_point, optimal_value in scenarios:
+            plot = None
+            if plot_renderer is not None:
+                plot = LazyPlot(lambda p=parameters, x=optimal_point: plot_renderer(p, x))
+            yield build_report_story(optimal_point, optimal_value, parameters, plot)
+
+    doc = SimpleDocTemplate(fileobj, pagesize=letter)
+    doc.build(_StoryFeed(chunks()))
+    return fileobj
+
+
+@timed("pdf.batch_zip")
+def write_batch_zip(scenarios, fileobj, plot_renderer=None, name_format="laporan_{index:05d}.pdf"):
+    """Menulis satu PDF per skenario ke arsip ZIP secara streaming
+
+    Setiap laporan dibuat, ditulis ke arsip, lalu dibuang sebelum skenario
+    berikutnya diproses sehingga memori tetap konstan.
+    """
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, (parameters, optimal_point, optimal_value) in enumerate(scenarios, start=1):
+            plot_png = plot_renderer(parameters, optimal_point) if plot_renderer is not None else None
+            with archive.open(name_format.format(index=index), "w") as entry:
+                entry.write(create_pdf_report(optimal_point, optimal_value, parameters, plot_png))
+    return fileobj
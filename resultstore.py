@@ -0,0 +1,282 @@
+"""Penyimpanan kolumnar hasil batch/sweep di file ``.npy`` yang di-memory-map.
+
+Satu result set adalah satu direktori berisi satu file ``.npy`` per kolom
+(tujuh parameter, ``x1``, ``x2``, ``Z``, dan indeks titik pojok optimal
+``titik``) ditambah ``meta.json``. Hasil ditambahkan per potongan (append):
+data ditulis di akhir file lalu header ``.npy`` (ukurannya tetap) diperbarui,
+tanpa membaca hasil sebelumnya. Pembacaan memakai ``np.load(mmap_mode="r")``
+sehingga paging, filter, agregasi, dan ekspor CSV berjalan per potongan dengan
+memori konstan, berapa pun jumlah barisnya.
+
+Jumlah baris yang sah dicatat di ``meta.json`` dan diperbarui paling akhir,
+jadi append yang terputus tidak merusak baris yang sudah ada. Waktu modifikasi
+``meta.json`` dipakai sebagai waktu akses terakhir (diperbarui saat dibuka,
+paging, agregasi, dan ekspor) sehingga ``prune`` menghapus result set yang
+paling lama tidak dipakai. Membaca result set yang sudah dihapus menghasilkan
+``ResultSetExpired``.
+
+Lokasi result set diatur dengan variabel lingkungan ``RESULTS_DIR``
+(default ``data/results``).
+"""
+from dataclasses import dataclass
+from pathlib import Path
+import json
+import os
+import shutil
+import struct
+import threading
+import time
+
+import numpy as np  # Kolom bertipe dan memory-map
+
+from batch import CORNER_LABELS, PARAMETER_NAMES
+
+DEFAULT_ROOT = Path(__file__).resolve().parent / "data" / "results"
+
+COLUMNS = PARAMETER_NAMES + ("x1", "x2", "Z", "titik")
+DTYPES = {**{name: np.dtype(np.float64) for name in COLUMNS}, "titik": np.dtype(np.int8)}
+HEADER_SIZE = 128       # Header .npy berukuran tetap agar bisa ditulis ulang saat append
+CHUNK_ROWS = 262144     # Baris per potongan saat filter/agregasi/ekspor
+
+
+def _npy_header(dtype: np.dtype, rows: int) -> bytes:
+    """Header ``.npy`` versi 1.0 dengan panjang tetap ``HEADER_SIZE`` byte"""
+    magic = np.lib.format.magic(1, 0)
+    size = HEADER_SIZE - len(magic) - 2
+    text = repr({"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (rows,)})
+    return magic + struct.pack("<H", size) + (text.ljust(size - 1) + "\n").encode("latin1")
+
+
+class ResultSetExpired(LookupError):
+    """Result set sudah dihapus (``prune``) saat masih dibaca; buat ulang dari data sumbernya"""
+
+    def __init__(self, path):
+        super().__init__(f"Result set kedaluwarsa (sudah dihapus): {path}")
+        self.path = Path(path)
+
+
+@dataclass(frozen=True)
+class ResultFilter:
+    """Filter baris: titik optimal tertentu dan/atau rentang keuntungan Z"""
+    corners: tuple = None   # Label titik ('A'-'E'); None = semua
+    z_min: float = None
+    z_max: float = None
+
+    @property
+    def active(self) -> bool:
+        return self.corners is not None or self.z_min is not None or self.z_max is not None
+
+    def mask(self, chunk: dict) -> np.ndarray:
+        keep = np.ones(chunk["Z"].shape[0], dtype=bool)
+        if self.corners is not None:
+            wanted = [CORNER_LABELS.index(label) for label in self.corners]
+            keep &= np.isin(chunk["titik"], wanted)
+        if self.z_min is not None:
+            keep &= chunk["Z"] >= self.z_min
+        if self.z_max is not None:
+            keep &= chunk["Z"] <= self.z_max
+        return keep
+
+
+class ResultStore:
+    """Satu result set kolumnar di direktori ``path`` (dibuat jika belum ada)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        meta_path = self.path / "meta.json"
+        try:
+            self.meta = json.loads(meta_path.read_text())
+            self.touch()
+            return
+        except (FileNotFoundError, ResultSetExpired):
+            pass  # Belum ada (atau baru saja dihapus prune): dibuat baru
+        self.path.mkdir(parents=True, exist_ok=True)
+        for name in COLUMNS:
+            with open(self._file(name), "wb") as f:
+                f.write(_npy_header(DTYPES[name], 0))
+        self.meta = {"rows": 0, "labels": list(CORNER_LABELS), "created_at": time.time(), "complete": False}
+        self._write_meta()
+
+    def _file(self, name) -> Path:
+        return self.path / f"{name}.npy"
+
+    def _write_meta(self):
+        tmp = self.path / "meta.json.tmp"
+        tmp.write_text(json.dumps(self.meta))
+        os.replace(tmp, self.path / "meta.json")
+
+    def __len__(self):
+        return self.meta["rows"]
+
+    def touch(self):
+        """Mencatat akses (mtime ``meta.json``) agar result set yang sedang dipakai tidak dipangkas"""
+        try:
+            os.utime(self.path / "meta.json")
+        except FileNotFoundError:
+            raise ResultSetExpired(self.path) from None
+
+    @property
+    def complete(self) -> bool:
+        """True setelah ``finish``; result set yang belum selesai sebaiknya dibuat ulang"""
+        return self.meta["complete"]
+
+    def append(self, columns: dict) -> int:
+        """Menambahkan satu potongan baris (dict nama kolom -> array); mengembalikan jumlah baris"""
+        missing = set(COLUMNS) - set(columns)
+        if missing:
+            raise ValueError(f"Kolom tidak lengkap: {', '.join(sorted(missing))}")
+        arrays = {name: np.ascontiguousarray(columns[name], dtype=DTYPES[name]).ravel() for name in COLUMNS}
+        sizes = {array.size for array in arrays.values()}
+        if len(sizes) != 1:
+            raise ValueError("Semua kolom harus sama panjang")
+        added = sizes.pop()
+        with self._lock:
+            rows = self.meta["rows"]
+            total = rows + added
+            for name, array in arrays.items():
+                with open(self._file(name), "r+b") as f:
+                    # Sisa append yang terputus (di atas jumlah baris di meta) ditimpa
+                    f.seek(HEADER_SIZE + rows * DTYPES[name].itemsize)
+                    f.write(array.tobytes())
+                    f.truncate()
+                    f.seek(0)
+                    f.write(_npy_header(DTYPES[name], total))
+            self.meta["rows"] = total
+            self._write_meta()
+        return total
+
+    def append_batch(self, parameters, result) -> int:
+        """Menambahkan hasil ``solve_two_product_batch`` beserta array parameternya (urutan ``PARAMETER_NAMES``)"""
+        columns = dict(zip(PARAMETER_NAMES, parameters))
+        columns.update(x1=result.optimal_point[:, 0], x2=result.optimal_point[:, 1],
+                       Z=result.optimal_value, titik=result.optimal_index)
+        return self.append(columns)
+
+    def finish(self):
+        with self._lock:
+            self.meta["complete"] = True
+            self._write_meta()
+
+    def column(self, name) -> np.ndarray:
+        """Kolom sebagai array read-only yang di-memory-map"""
+        rows = len(self)
+        if rows == 0:
+            return np.empty(0, dtype=DTYPES[name])
+        try:
+            return np.load(self._file(name), mmap_mode="r")[:rows]
+        except FileNotFoundError:
+            raise ResultSetExpired(self.path) from None
+
+    def chunks(self, chunk_rows: int = CHUNK_ROWS, columns=COLUMNS):
+        """Menghasilkan ``(awal, dict kolom)`` per potongan; kolom berupa view memory-map"""
+        mapped = {name: self.column(name) for name in columns}
+        for start in range(0, len(self), chunk_rows):
+            yield start, {name: array[start:start + chunk_rows] for name, array in mapped.items()}
+
+    def page(self, offset: int, limit: int, where: ResultFilter = None) -> dict:
+        """Baris ke ``offset`` .. ``offset + limit`` (setelah filter) sebagai dict kolom"""
+        self.touch()
+        if where is None or not where.active:
+            return {name: np.array(self.column(name)[offset:offset + limit]) for name in COLUMNS}
+        parts = {name: [] for name in COLUMNS}
+        skip, remaining = offset, limit
+        for _, chunk in self.chunks():
+            index = np.flatnonzero(where.mask(chunk))
+            if skip >= index.size:
+                skip -= index.size
+                continue
+            index = index[skip:skip + remaining]
+            skip = 0
+            for name in COLUMNS:
+                parts[name].append(np.asarray(chunk[name][index]))
+            remaining -= index.size
+            if remaining <= 0:
+                break
+        return {name: np.concatenate(values) if values else np.empty(0, DTYPES[name])
+                for name, values in parts.items()}
+
+    def aggregate(self, where: ResultFilter = None) -> dict:
+        """Jumlah baris, statistik keuntungan Z, dan frekuensi titik optimal (per potongan)"""
+        where = where or ResultFilter()
+        self.touch()
+        count, total, low, high = 0, 0.0, np.inf, -np.inf
+        corners = np.zeros(len(CORNER_LABELS), dtype=np.int64)
+        for _, chunk in self.chunks(columns=("Z", "titik")):
+            keep = where.mask(chunk)
+            values = chunk["Z"][keep]
+            finite = values[np.isfinite(values)]
+            count += int(keep.sum())
+            total += float(finite.sum())
+            if finite.size:
+                low, high = min(low, float(finite.min())), max(high, float(finite.max()))
+            corners += np.bincount(chunk["titik"][keep], minlength=len(CORNER_LABELS))
+        return {
+            "count": count,
+            "mean": total / count if count else np.nan,
+            "min": low if count else np.nan,
+            "max": high if count else np.nan,
+            "corners": dict(zip(CORNER_LABELS, corners.tolist())),
+        }
+
+    def iter_csv(self, where: ResultFilter = None, chunk_rows: int = CHUNK_ROWS):
+        """Teks CSV per potongan (baris pertama header); label titik ditulis sebagai 'A'-'E'"""
+        labels = np.array(CORNER_LABELS)
+        row_format = ",".join(["%.12g"] * (len(COLUMNS) - 1)) + ",%s"
+        self.touch()
+        yield ",".join(COLUMNS) + "\n"
+        for _, chunk in self.chunks(chunk_rows):
+            if where is not None and where.active:
+                keep = where.mask(chunk)
+                chunk = {name: array[keep] for name, array in chunk.items()}
+            if chunk["Z"].size == 0:
+                continue
+            # Kolom ke list lalu format per baris: beberapa kali lebih cepat daripada DataFrame.to_csv
+            values = [chunk[name].tolist() for name in COLUMNS[:-1]] + [labels[chunk["titik"]].tolist()]
+            yield "\n".join([row_format % row for row in zip(*values)]) + "\n"
+
+    def write_csv(self, target, where: ResultFilter = None):
+        """Menulis CSV (UTF-8) potongan demi potongan ke path atau file biner ``target``"""
+        if not hasattr(target, "write"):
+            self.touch()  # File tujuan tidak dibuat jika result set sudah kedaluwarsa
+            with open(target, "wb") as f:
+                self.write_csv(f, where)
+            return Path(target)
+        for text in self.iter_csv(where):
+            target.write(text.encode())
+        return target
+
+    def delete(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def results_root() -> Path:
+    """Direktori induk result set (``RESULTS_DIR`` atau ``data/results``)"""
+    return Path(os.environ.get("RESULTS_DIR") or DEFAULT_ROOT)
+
+
+def _last_access(path: Path) -> float:
+    try:
+        return (path / "meta.json").stat().st_mtime
+    except FileNotFoundError:
+        return -np.inf  # Dihapus sesi lain di tengah prune
+
+
+def prune(root, keep: int = 8, protect=()):
+    """Menghapus result set yang paling lama tidak diakses sehingga paling banyak ``keep`` yang tersisa
+
+    Result set di ``protect`` (misal yang dibuat sesi saat ini) tidak pernah
+    dihapus, tetapi tetap dihitung dalam ``keep``.
+    """
+    root = Path(root)
+    if not root.exists():
+        return
+    protect = {Path(p).resolve() for p in protect}
+    sets = sorted((p for p in root.iterdir() if (p / "meta.json").exists()), key=_last_access)
+    excess = len(sets) - keep
+    for old in sets:
+        if excess <= 0:
+            break
+        if old.resolve() not in protect:
+            shutil.rmtree(old, ignore_errors=True)
+            excess -= 1
@@ -0,0 +1,833 @@
+"""Mesin Linear Programming umum (revised simplex) untuk halaman Optimasi.
+
+Model yang diselesaikan berbentuk::
+
+    maks/min  c^T x
+    dengan    A x (<=, >=, =) b
+              x >= 0
+
+Matriks kendala disimpan sebagai matriks sparse (``scipy.sparse``) dan basis
+difaktorkan dengan LU sparse yang diperbarui memakai eta-file (product form),
+sehingga setiap iterasi tidak perlu membalik matriks basis dari awal.
+"""
+from dataclasses import dataclass, replace
+
+import numpy as np  # Komputasi numerik
+import scipy.sparse as sp  # Matriks kendala sparse
+from scipy.sparse.linalg import splu  # Faktorisasi LU sparse untuk basis
+
+# Jenis kendala
+LE = "<="
+GE = ">="
+EQ = "="
+
+# Status hasil solve
+OPTIMAL = "optimal"
+INFEASIBLE = "infeasible"
+UNBOUNDED = "unbounded"
+ITERATION_LIMIT = "iteration_limit"
+
+# Cara solve: dari awal (dua fase) atau dari basis optimal sebelumnya
+COLD_START = "cold"
+WARM_DUAL = "warm_dual"          # Hanya ruas kanan berubah
+WARM_PRIMAL = "warm_primal"      # Hanya fungsi tujuan berubah
+WARM_DUAL_PRIMAL = "warm_dual_primal"  # Keduanya berubah
+
+# Anti-degenerasi simplex
+PERTURBATION = 1e-7       # Gangguan relatif ruas kanan (primal) / biaya (dual)
+PERTURBATION_SEED = 0     # Gangguan deterministik: hasil solve yang sama bisa diulang
+DEGENERATE_PIVOTS = 50    # Tanpa gangguan: pivot degenerate beruntun sebelum aturan Bland
+
+_SENSE_ALIASES = {
+    "<=": LE, "<": LE, "L": LE, "=<": LE,
+    ">=": GE, ">": GE, "G": GE, "=>": GE,
+    "=": EQ, "==": EQ, "E": EQ,
+}
+
+
+def _normalize_sense(sense) -> str:
+    """Menyeragamkan penulisan jenis kendala menjadi '<=', '>=' atau '='"""
+    try:
+        return _SENSE_ALIASES[str(sense).strip().upper()]
+    except KeyError:
+        raise ValueError(f"Jenis kendala tidak dikenal: {sense!r}") from None
+
+
+@dataclass
+class LinearProgram:
+    """Model LP dengan n variabel non-negatif dan m kendala linear"""
+    c: np.ndarray
+    A: sp.csr_matrix
+    senses: np.ndarray
+    b: np.ndarray
+    maximize: bool = True
+    var_names: list = None
+    con_names: list = None
+
+    def __post_init__(self):
+        self.c = np.asarray(self.c, dtype=float).ravel()
+        self.A = sp.csr_matrix(self.A, dtype=float)
+        self.b = np.asarray(self.b, dtype=float).ravel()
+        senses = np.asarray(self.senses, dtype=str)
+        if not np.isin(senses, (LE, GE, EQ)).all():
+            senses = np.array([_normalize_sense(s) for s in senses.ravel()], dtype=str)
+        self.senses = senses.ravel().astype("<U2")
+
+        m, n = self.A.shape
+        if self.c.size != n:
+            raise ValueError(f"Panjang c ({self.c.size}) tidak sama dengan jumlah kolom A ({n})")
+        if self.b.size != m or self.senses.size != m:
+            raise ValueError("Panjang b dan senses harus sama dengan jumlah baris A")
+        if self.var_names is None:
+            self.var_names = [f"x{j + 1}" for j in range(n)]
+        if self.con_names is None:
+            self.con_names = [f"R{i + 1}" for i in range(m)]
+
+    @property
+    def num_vars(self) -> int:
+        return self.A.shape[1]
+
+    @property
+    def num_constraints(self) -> int:
+        return self.A.shape[0]
+
+
+@dataclass
+class StandardForm:
+    """Bentuk standar min c^T x, A x = b, x >= 0 dengan b >= 0
+
+    Kolom disusun sebagai [variabel asli | slack/surplus | artifisial].
+    """
+    A: sp.csc_matrix
+    b: np.ndarray
+    c: np.ndarray
+    row_sign: np.ndarray
+    num_orig: int
+    slack_of_row: np.ndarray
+    artificial: np.ndarray
+    initial_basis: np.ndarray
+
+
+@dataclass
+class LPResult:
+    """Hasil solve LP"""
+    status: str
+    x: np.ndarray
+    objective: float
+    duals: np.ndarray
+    reduced_costs: np.ndarray
+    basis: np.ndarray
+    iterations: int
+    message: str = ""
+    method: str = COLD_START
+
+    @property
+    def success(self) -> bool:
+        return self.status == OPTIMAL
+
+
+def to_standard_form(model: LinearProgram) -> StandardForm:
+    """Mengubah model menjadi bentuk standar dengan slack, surplus dan artifisial"""
+    m, n = model.A.shape
+    row_sign = np.where(model.b < 0, -1.0, 1.0)
+    senses = model.senses.copy()
+    flip = row_sign < 0
+    senses[flip & (model.senses == LE)] = GE
+    senses[flip & (model.senses == GE)] = LE
+
+    b = model.b * row_sign
+
+    # Slack (+1) untuk '<=', surplus (-1) untuk '>=', artifisial untuk '>=' dan '='
+    slack_rows = np.flatnonzero(senses != EQ)
+    slack_vals = np.where(senses[slack_rows] == LE, 1.0, -1.0)
+    art_rows = np.flatnonzero(senses != LE)
+    n_slack = slack_rows.size
+    slack_of_row = np.full(m, -1)
+    slack_of_row[slack_rows] = n + np.arange(n_slack)
+    artificial = n + n_slack + np.arange(art_rows.size)
+
+    # Matriks [A | S | R] dibangun sekali dari triplet (lebih murah dari hstack)
+    A_coo = model.A.tocoo()
+    rows = np.concatenate([A_coo.row, slack_rows, art_rows])
+    cols = np.concatenate([A_coo.col, slack_of_row[slack_rows], artificial])
+    data = np.concatenate([A_coo.data * row_sign[A_coo.row], slack_vals, np.ones(art_rows.size)])
+    A_std = sp.csc_matrix((data, (rows, cols)), shape=(m, n + n_slack + art_rows.size))
+
+    initial_basis = np.empty(m, dtype=int)
+    initial_basis[slack_rows] = slack_of_row[slack_rows]
+    initial_basis[art_rows] = artificial
+
+    c_std = np.zeros(A_std.shape[1])
+    c_std[:n] = -model.c if model.maximize else model.c
+
+    return StandardForm(A_std, b, c_std, row_sign, n, slack_of_row, artificial, initial_basis)
+
+
+class _BasisFactor:
+    """Faktorisasi LU basis dengan pembaruan eta (product form of the inverse)"""
+
+    def __init__(self, A: sp.csc_matrix, basis: np.ndarray, refactor_every: int = 64):
+        self.A = A
+        self.refactor_every = refactor_every
+        self.refactor(basis)
+
+    def refactor(self, basis):
+        self.lu = splu(self.A[:, basis].tocsc(), permc_spec="COLAMD")
+        self.etas = []
+
+    def ftran(self, a):
+        """Menyelesaikan B v = a"""
+        v = self.lu.solve(a)
+        for r, eta in self.etas:
+            vr = v[r]
+            if vr != 0.0:
+                v += eta * vr
+        return v
+
+    def btran(self, cb):
+        """Menyelesaikan B^T y = cb"""
+        v = np.array(cb, dtype=float)
+        for r, eta in reversed(self.etas):
+            v[r] += eta @ v
+        return self.lu.solve(v, trans="T")
+
+    def update(self, r, d, basis) -> bool:
+        """Mencatat pivot pada baris r; mengembalikan True jika basis difaktorkan ulang"""
+        if len(self.etas) >= self.refactor_every:
+            self.refactor(basis)
+            return True
+        eta = -d / d[r]
+        eta[r] = 1.0 / d[r] - 1.0
+        self.etas.append((r, eta))
+        return False
+
+
+def _column(A: sp.csc_matrix, j: int) -> np.ndarray:
+    """Mengambil kolom j dari matriks CSC sebagai vektor padat"""
+    col = np.zeros(A.shape[0])
+    start, end = A.indptr[j], A.indptr[j + 1]
+    col[A.indices[start:end]] = A.data[start:end]
+    return col
+
+
+def _perturbation(values, size) -> np.ndarray:
+    """Gangguan acak kecil (deterministik) sebanding dengan besar nilai"""
+    rng = np.random.default_rng(PERTURBATION_SEED)
+    return PERTURBATION * (1.0 + np.abs(values)) * rng.uniform(0.5, 1.0, size)
+
+
+def _reduced_costs(A_T, cost, basis, factor) -> np.ndarray:
+    d = cost - A_T @ factor.btran(cost[basis])
+    d[basis] = 0.0
+    return d
+
+
+def _pivot_row(A_T, factor, r, m) -> np.ndarray:
+    """Baris r dari B^-1 A (satu btran dan satu perkalian A^T)"""
+    unit = np.zeros(m)
+    unit[r] = 1.0
+    return A_T @ factor.btran(unit)
+
+
+def _primal_simplex(std, cost, basis, factor, allowed, max_iter, tol, perturb=True):
+    """Iterasi primal simplex dari basis feasible; mengembalikan (status, x_B, iterasi)
+
+    Kolom yang tidak ``allowed`` tidak boleh masuk basis; jika kolom itu masih
+    berada di basis dengan nilai 0 (artifisial), kolom tersebut dikeluarkan lebih
+    dulu, sedangkan yang masih positif keluar lewat uji rasio biasa.
+
+    Kolom masuk dipilih dengan pricing devex dan reduced cost diperbarui dari baris
+    pivot (tanpa btran fungsi tujuan setiap iterasi). Melawan degenerasi, ruas kanan
+    diganggu sedikit (``perturb``) sehingga setiap pivot maju; setelah optimal
+    gangguan dibuang dan sisa ketidaklayakan diselesaikan dengan dual simplex.
+    Tanpa gangguan, aturan Bland dipakai selama pivot degenerate beruntun.
+    """
+    A = std.A
+    A_T = A.T.tocsr()
+    m = A.shape[0]
+    blocked = ~allowed
+    b = std.b
+    zero = 1e-7 * (1.0 + np.abs(b).max(initial=0.0))  # Batas nilai "0" artifisial (sama dengan uji fase 1)
+    x_B = factor.ftran(b)
+    if perturb and m:
+        # x_B + delta = B^-1 (b + B delta); baris artifisial terlarang tetap bernilai 0
+        delta = _perturbation(x_B, m)
+        delta[blocked[basis]] = 0.0
+        b = b + A[:, basis] @ delta
+        x_B = x_B + delta
+    d = _reduced_costs(A_T, cost, basis, factor)
+    weights = np.ones(A.shape[1])  # Bobot referensi devex
+    degenerate = 0
+    iterations = 0
+    status = ITERATION_LIMIT
+
+    while iterations < max_iter:
+        candidates = np.flatnonzero((d < -tol) & allowed)
+        if candidates.size == 0:
+            # Reduced cost hasil pembaruan dicek ulang sebelum dinyatakan optimal
+            d = _reduced_costs(A_T, cost, basis, factor)
+            candidates = np.flatnonzero((d < -tol) & allowed)
+            if candidates.size == 0:
+                status = OPTIMAL
+                break
+
+        bland = not perturb and degenerate > DEGENERATE_PIVOTS
+        if bland:
+            q = candidates[0]
+        else:
+            q = candidates[np.argmax(d[candidates] ** 2 / weights[candidates])]
+
+        col = factor.ftran(_column(A, q))
+        ratios = np.full(col.size, np.inf)
+        pos = col > tol
+        ratios[pos] = np.maximum(x_B[pos], 0.0) / col[pos]
+        # Variabel terlarang yang masih basis dan bernilai 0 harus keluar lebih dulu
+        stuck = blocked[basis] & (np.abs(col) > tol) & (x_B <= zero)
+        ratios[stuck] = 0.0
+        theta = ratios.min()
+        if not np.isfinite(theta):
+            status = UNBOUNDED
+            break
+
+        ties = np.flatnonzero(ratios <= theta + tol)
+        r = ties[np.argmin(basis[ties])] if bland else ties[np.argmax(np.abs(col[ties]))]
+        theta = ratios[r]
+
+        # Reduced cost dan bobot devex dari baris pivot
+        alpha = _pivot_row(A_T, factor, r, m)
+        pivot = col[r]
+        leaving = basis[r]
+        d -= (d[q] / pivot) * alpha
+        weights = np.maximum(weights, (alpha / pivot) ** 2 * weights[q])
+        weights[leaving] = max(weights[q] / pivot ** 2, 1.0)
+
+        x_B -= theta * col
+        x_B[r] = theta
+        basis[r] = q
+        d[basis] = 0.0
+        if factor.update(r, col, basis):
+            x_B = factor.ftran(b)
+            d = _reduced_costs(A_T, cost, basis, factor)
+        degenerate = degenerate + 1 if theta <= tol else 0
+        iterations += 1
+
+    if b is not std.b:
+        x_B = factor.ftran(std.b)
+        if status == OPTIMAL and x_B.min(initial=0.0) < 0.0:
+            # Basis tetap optimal secara dual; ketidaklayakan kecil sisa gangguan dirapikan
+            status, x_B, it = _dual_simplex(std, cost, basis, factor, allowed, max_iter - iterations, tol,
+                                            perturb=False)
+            iterations += it
+    return status, x_B, iterations
+
+
+def _dual_simplex(std, cost, basis, factor, allowed, max_iter, tol, perturb=True):
+    """Iterasi dual simplex dari basis yang optimal secara dual (reduced cost >= 0)
+
+    Dipakai setelah ruas kanan berubah: basis lama tetap optimal secara dual,
+    hanya nilai x_B yang mungkin negatif. Mengembalikan (status, x_B, iterasi);
+    ``INFEASIBLE`` berarti tidak ada kolom yang bisa masuk (model tidak feasible).
+
+    Melawan degenerasi dual, biaya kolom nonbasis dinaikkan sedikit (``perturb``);
+    setelah optimal biaya asli dipulihkan dan sisanya diselesaikan dengan primal simplex.
+    """
+    A, b = std.A, std.b
+    A_T = A.T.tocsr()
+    m = b.size
+    x_B = factor.ftran(b)
+    work = cost
+    if perturb:
+        nonbasic = allowed.copy()
+        nonbasic[basis] = False
+        work = cost.copy()
+        work[nonbasic] += _perturbation(cost[nonbasic], np.count_nonzero(nonbasic))
+    d = _reduced_costs(A_T, work, basis, factor)
+    iterations = 0
+    status = ITERATION_LIMIT
+
+    while iterations < max_iter:
+        r = int(np.argmin(x_B))
+        if x_B[r] >= -tol * (1.0 + abs(b[r])):
+            status = OPTIMAL
+            break
+
+        # Baris r dari B^-1 A
+        alpha = _pivot_row(A_T, factor, r, m)
+        eligible = allowed & (alpha < -tol)
+        eligible[basis] = False
+        candidates = np.flatnonzero(eligible)
+        if candidates.size == 0:
+            status = INFEASIBLE
+            break
+
+        # Uji rasio dual: kolom masuk menjaga semua reduced cost tetap >= 0;
+        # di antara rasio yang sama dipilih |alpha| terbesar (pivot paling stabil)
+        ratios = np.maximum(d[candidates], 0.0) / -alpha[candidates]
+        ties = candidates[ratios <= ratios.min() + tol]
+        q = ties[np.argmax(-alpha[ties])]
+
+        col = factor.ftran(_column(A, q))
+        d -= (d[q] / alpha[q]) * alpha
+        theta = x_B[r] / col[r]
+        x_B -= theta * col
+        x_B[r] = theta
+        basis[r] = q
+        d[basis] = 0.0
+        if factor.update(r, col, basis):
+            x_B = factor.ftran(b)
+            d = _reduced_costs(A_T, work, basis, factor)
+        iterations += 1
+
+    if work is not cost and status == OPTIMAL:
+        d = _reduced_costs(A_T, cost, basis, factor)
+        if np.any((d < -tol) & allowed):
+            # Basis feasible secara primal; reduced cost negatif sisa gangguan dirapikan
+            status, x_B, it = _primal_simplex(std, cost, basis, factor, allowed, max_iter - iterations, tol,
+                                              perturb=False)
+            iterations += it
+    return status, x_B, iterations
+
+
+def solve_lp(model: LinearProgram, max_iter: int = None, tol: float = 1e-9,
+             refactor_every: int = 64) -> LPResult:
+    """Menyelesaikan model LP dengan revised simplex dua fase"""
+    std = to_standard_form(model)
+    m, n_total = std.A.shape
+    n = std.num_orig
+    if max_iter is None:
+        max_iter = 50 * (m + n_total) + 1000
+
+    basis = std.initial_basis.copy()
+    factor = _BasisFactor(std.A, basis, refactor_every)
+    iterations = 0
+
+    # Fase 1: minimalkan jumlah variabel artifisial
+    if std.artificial.size:
+        phase1_cost = np.zeros(n_total)
+        phase1_cost[std.artificial] = 1.0
+        # Artifisial yang sudah keluar basis tidak perlu masuk lagi
+        allowed = np.ones(n_total, dtype=bool)
+        allowed[std.artificial] = False
+        status, x_B, it = _primal_simplex(std, phase1_cost, basis, factor, allowed, max_iter, tol)
+        iterations += it
+        if status == ITERATION_LIMIT:
+            return _failed(model, ITERATION_LIMIT, basis, iterations, "Batas iterasi tercapai pada fase 1")
+        infeasibility = phase1_cost[basis] @ x_B
+        if infeasibility > 1e-7 * (1.0 + np.abs(std.b).max(initial=0.0)):
+            return _failed(model, INFEASIBLE, basis, iterations, "Tidak ada solusi yang memenuhi semua kendala")
+
+    # Fase 2: optimalkan fungsi tujuan asli, artifisial tidak boleh masuk basis
+    allowed = np.ones(n_total, dtype=bool)
+    allowed[std.artificial] = False
+    status, x_B, it = _primal_simplex(std, std.c, basis, factor, allowed, max_iter - iterations, tol)
+    iterations += it
+    if status == UNBOUNDED:
+        return _failed(model, UNBOUNDED, basis, iterations, "Fungsi tujuan tidak terbatas")
+    if status == ITERATION_LIMIT:
+        return _failed(model, ITERATION_LIMIT, basis, iterations, "Batas iterasi tercapai pada fase 2")
+
+    return _build_result(model, std, basis, factor, x_B, iterations)
+
+
+def _same_structure(old: LinearProgram, new: LinearProgram) -> bool:
+    """True jika bentuk standar kedua model sama kecuali c dan b
+
+    Matriks A dan jenis kendala harus sama persis, begitu juga tanda b (baris
+    dengan b negatif dibalik saat membentuk bentuk standar).
+    """
+    return (
+        old.A.shape == new.A.shape
+        and np.array_equal(old.senses, new.senses)
+        and np.array_equal(old.b < 0, new.b < 0)
+        and (old.A != new.A).nnz == 0
+    )
+
+
+def resolve_lp(model: LinearProgram, previous_model: LinearProgram, basis, max_iter: int = None,
+               tol: float = 1e-9, refactor_every: int = 64) -> LPResult:
+    """Menyelesaikan ulang model yang hanya berbeda c dan/atau b dari model sebelumnya
+
+    ``basis`` adalah basis optimal ``previous_model`` (``LPResult.basis``).
+
+    * hanya ruas kanan berubah: basis lama masih optimal secara dual -> dual simplex;
+    * hanya fungsi tujuan berubah: basis lama masih feasible -> primal simplex fase 2;
+    * keduanya berubah: dual simplex dengan fungsi tujuan lama, lalu primal simplex.
+
+    Jika struktur model berbeda (A, jenis kendala, tanda b) atau basis memuat
+    variabel artifisial, solve diulang dari awal dengan ``solve_lp``.
+    """
+    if basis is None or not _same_structure(previous_model, model):
+        return solve_lp(model, max_iter, tol, refactor_every)
+    std = to_standard_form(model)
+    basis = np.array(basis, dtype=int)
+    if basis.size != std.A.shape[0] or np.isin(basis, std.artificial).any():
+        return solve_lp(model, max_iter, tol, refactor_every)
+
+    m, n_total = std.A.shape
+    if max_iter is None:
+        max_iter = 50 * (m + n_total) + 1000
+    rhs_changed = not np.array_equal(previous_model.b, model.b)
+    cost_changed = not (np.array_equal(previous_model.c, model.c) and previous_model.maximize == model.maximize)
+
+    allowed = np.ones(n_total, dtype=bool)
+    allowed[std.artificial] = False
+    factor = _BasisFactor(std.A, basis, refactor_every)
+    iterations = 0
+
+    status, method = OPTIMAL, WARM_PRIMAL
+    if rhs_changed:
+        previous_cost = np.zeros(n_total)
+        previous_cost[:std.num_orig] = -previous_model.c if previous_model.maximize else previous_model.c
+        status, x_B, iterations = _dual_simplex(std, previous_cost, basis, factor, allowed, max_iter, tol)
+        if status == INFEASIBLE:
+            result = _failed(model, INFEASIBLE, basis, iterations, "Tidak ada solusi yang memenuhi semua kendala")
+        elif status == ITERATION_LIMIT:
+            result = _failed(model, ITERATION_LIMIT, basis, iterations, "Batas iterasi tercapai pada dual simplex")
+        elif status == UNBOUNDED:
+            # Basis lama ternyata tidak optimal secara dual (misal solve sebelumnya tidak terbatas)
+            return solve_lp(model, max_iter, tol, refactor_every)
+        method = WARM_DUAL_PRIMAL if cost_changed else WARM_DUAL
+
+    if status == OPTIMAL:
+        if cost_changed or not rhs_changed:
+            status, x_B, it = _primal_simplex(std, std.c, basis, factor, allowed, max_iter - iterations, tol)
+            iterations += it
+        if status == UNBOUNDED:
+            result = _failed(model, UNBOUNDED, basis, iterations, "Fungsi tujuan tidak terbatas")
+        elif status == ITERATION_LIMIT:
+            result = _failed(model, ITERATION_LIMIT, basis, iterations, "Batas iterasi tercapai pada primal simplex")
+        else:
+            result = _build_result(model, std, basis, factor, x_B, iterations)
+    result.method = method
+    return result
+
+
+def solve_from_basis(model: LinearProgram, basis, max_iter: int = None, tol: float = 1e-9,
+                     refactor_every: int = 64) -> LPResult:
+    """Menyelesaikan model mulai dari basis tebakan (misal hasil crossover interior-point)
+
+    Basis yang feasible secara primal dilanjutkan dengan primal simplex, yang
+    feasible secara dual dengan dual simplex. Basis yang singular, memuat
+    artifisial, atau tidak feasible keduanya diselesaikan dari awal.
+    """
+    std = to_standard_form(model)
+    basis = np.array(basis, dtype=int)
+    m, n_total = std.A.shape
+    if basis.size != m or np.unique(basis).size != m or np.isin(basis, std.artificial).any():
+        return solve_lp(model, max_iter, tol, refactor_every)
+    try:
+        factor = _BasisFactor(std.A, basis, refactor_every)
+    except RuntimeError:  # Basis singular
+        return solve_lp(model, max_iter, tol, refactor_every)
+    if max_iter is None:
+        max_iter = 50 * (m + n_total) + 1000
+
+    allowed = np.ones(n_total, dtype=bool)
+    allowed[std.artificial] = False
+    x_B = factor.ftran(std.b)
+    if x_B.min() >= -1e-7 * (1.0 + np.abs(std.b).max()):
+        method = WARM_PRIMAL
+        status, x_B, iterations = _primal_simplex(std, std.c, basis, factor, allowed, max_iter, tol)
+    else:
+        d = std.c - std.A.T @ factor.btran(std.c[basis])
+        d[basis] = 0.0
+        if d[allowed].min() < -1e-7 * (1.0 + np.abs(std.c).max()):
+            return solve_lp(model, max_iter, tol, refactor_every)
+        method = WARM_DUAL
+        status, x_B, iterations = _dual_simplex(std, std.c, basis, factor, allowed, max_iter, tol)
+
+    if status == OPTIMAL:
+        result = _build_result(model, std, basis, factor, x_B, iterations)
+    elif status == ITERATION_LIMIT:
+        result = _failed(model, ITERATION_LIMIT, basis, iterations, "Batas iterasi tercapai")
+    elif status == UNBOUNDED:
+        result = _failed(model, UNBOUNDED, basis, iterations, "Fungsi tujuan tidak terbatas")
+    else:
+        result = _failed(model, INFEASIBLE, basis, iterations, "Tidak ada solusi yang memenuhi semua kendala")
+    result.method = method
+    return result
+
+
+def _build_result(model, std, basis, factor, x_B, iterations) -> LPResult:
+    """Menyusun LPResult dari basis optimal"""
+    n = std.num_orig
+    x_std = np.zeros(std.A.shape[1])
+    x_std[basis] = np.maximum(x_B, 0.0)
+    x = x_std[:n]
+
+    y = factor.btran(std.c[basis])
+    d = std.c - std.A.T @ y
+    sign = -1.0 if model.maximize else 1.0
+    duals = sign * y * std.row_sign + 0.0  # + 0.0 menghilangkan -0.0
+    reduced_costs = sign * d[:n] + 0.0
+
+    return LPResult(
+        status=OPTIMAL,
+        x=x,
+        objective=float(model.c @ x),
+        duals=duals,
+        reduced_costs=reduced_costs,
+        basis=basis.copy(),
+        iterations=iterations,
+        message="Solusi optimal ditemukan",
+    )
+
+
+def _failed(model, status, basis, iterations, message) -> LPResult:
+    """Menyusun LPResult untuk solve yang tidak menghasilkan solusi optimal"""
+    n, m = model.num_vars, model.num_constraints
+    return LPResult(status, np.full(n, np.nan), np.nan, np.full(m, np.nan),
+                    np.full(n, np.nan), basis.copy(), iterations, message)
+
+
+def two_product_model(p1, t1, max1, p2, t2, max2, total_time) -> LinearProgram:
+    """Model dua produk dari halaman Optimasi sebagai kasus khusus LinearProgram"""
+    A = [[t1, t2],
+         [1, 0],
+         [0, 1]]
+    return LinearProgram(
+        c=[p1, p2],
+        A=A,
+        senses=[LE, LE, LE],
+        b=[total_time, max1, max2],
+        maximize=True,
+        var_names=["x1", "x2"],
+        con_names=["Waktu produksi", "Permintaan produk 1", "Permintaan produk 2"],
+    )
+
+
+@dataclass
+class SensitivityReport:
+    """Harga bayangan dan rentang yang diizinkan agar basis optimal tetap sama"""
+    con_names: list
+    rhs: np.ndarray
+    slack: np.ndarray
+    shadow_prices: np.ndarray
+    rhs_lower: np.ndarray
+    rhs_upper: np.ndarray
+    var_names: list
+    values: np.ndarray
+    objective_coefs: np.ndarray
+    reduced_costs: np.ndarray
+    objective_lower: np.ndarray
+    objective_upper: np.ndarray
+
+    def constraint_table(self) -> list:
+        """Baris tabel sensitivitas ruas kanan (satu dict per kendala)"""
+        return [
+            {"Kendala": name, "Ruas kanan": rhs, "Slack": slack, "Harga bayangan": price,
+             "Batas bawah": lower, "Batas atas": upper}
+            for name, rhs, slack, price, lower, upper in zip(
+                self.con_names, self.rhs, self.slack, self.shadow_prices, self.rhs_lower, self.rhs_upper)
+        ]
+
+    def variable_table(self) -> list:
+        """Baris tabel sensitivitas koefisien fungsi tujuan (satu dict per variabel)"""
+        return [
+            {"Variabel": name, "Nilai": value, "Koefisien": coef, "Reduced cost": rc,
+             "Batas bawah": lower, "Batas atas": upper}
+            for name, value, coef, rc, lower, upper in zip(
+                self.var_names, self.values, self.objective_coefs, self.reduced_costs,
+                self.objective_lower, self.objective_upper)
+        ]
+
+
+def _ratio_range(base, direction, tol):
+    """Rentang t sehingga base + t * direction >= 0; mengembalikan (t_min, t_max)"""
+    pos = direction > tol
+    neg = direction < -tol
+    t_min = np.max(-base[pos] / direction[pos], initial=-np.inf)
+    t_max = np.min(-base[neg] / direction[neg], initial=np.inf)
+    return t_min, t_max
+
+
+def sensitivity_analysis(model: LinearProgram, result: LPResult, tol: float = 1e-9) -> SensitivityReport:
+    """Analisis sensitivitas langsung dari basis optimal, tanpa solve ulang
+
+    * Harga bayangan: perubahan nilai tujuan per unit kenaikan ruas kanan.
+    * Rentang ruas kanan: nilai b_i yang masih membuat basis tetap feasible.
+    * Rentang koefisien tujuan: nilai c_j yang masih membuat basis tetap optimal.
+    """
+    if not result.success:
+        raise ValueError("Analisis sensitivitas membutuhkan solusi optimal")
+
+    std = to_standard_form(model)
+    m, n_total = std.A.shape
+    n = std.num_orig
+    basis = result.basis
+    factor = _BasisFactor(std.A, basis)
+    x_B = factor.ftran(std.b)
+    is_artificial = np.zeros(n_total, dtype=bool)
+    is_artificial[std.artificial] = True
+    position = np.full(n_total, -1)
+    position[basis] = np.arange(m)
+
+    # Rentang ruas kanan: x_B + delta * sign_i * B^-1 e_i >= 0
+    rhs_lower = np.empty(m)
+    rhs_upper = np.empty(m)
+    for i in range(m):
+        unit = np.zeros(m)
+        unit[i] = 1.0
+        direction = std.row_sign[i] * factor.ftran(unit)
+        d_min, d_max = _ratio_range(x_B, direction, tol)
+        # Artifisial basis (baris redundan) harus tetap bernilai 0
+        if np.any(is_artificial[basis] & (np.abs(direction) > tol)):
+            d_min, d_max = 0.0, 0.0
+        rhs_lower[i] = model.b[i] + d_min
+        rhs_upper[i] = model.b[i] + d_max
+
+    # Rentang koefisien tujuan (dalam bentuk min: c_std = sign * c)
+    sign = -1.0 if model.maximize else 1.0
+    y = factor.btran(std.c[basis])
+    d = std.c - std.A.T @ y
+    candidates = np.ones(n_total, dtype=bool)
+    candidates[basis] = False
+    candidates[is_artificial] = False
+    A_T = std.A.T.tocsr()
+
+    obj_lower = np.empty(n)
+    obj_upper = np.empty(n)
+    for j in range(n):
+        r = position[j]
+        if r < 0:
+            # Non-basis: reduced cost harus tetap >= 0
+            delta_min, delta_max = -d[j], np.inf
+        else:
+            # Basis: d_k - delta * alpha_rk >= 0 untuk semua non-basis k
+            unit = np.zeros(m)
+            unit[r] = 1.0
+            alpha = A_T @ factor.btran(unit)
+            delta_min, delta_max = _ratio_range(d[candidates], -alpha[candidates], tol)
+        if sign < 0:
+            delta_min, delta_max = -delta_max, -delta_min
+        obj_lower[j] = model.c[j] + delta_min
+        obj_upper[j] = model.c[j] + delta_max
+
+    return SensitivityReport(
+        con_names=list(model.con_names),
+        rhs=model.b.copy(),
+        slack=model.b - model.A @ result.x,
+        shadow_prices=result.duals.copy(),
+        rhs_lower=rhs_lower,
+        rhs_upper=rhs_upper,
+        var_names=list(model.var_names),
+        values=result.x.copy(),
+        objective_coefs=model.c.copy(),
+        reduced_costs=result.reduced_costs.copy(),
+        objective_lower=obj_lower,
+        objective_upper=obj_upper,
+    )
+
+
+@dataclass
+class ParametricSegment:
+    """Rentang parameter dengan rencana optimal yang sama
+
+    Untuk ``lower <= t <= upper`` solusi optimalnya ``x`` dan nilai tujuannya
+    ``value + slope * t``.
+    """
+    lower: float
+    upper: float
+    x: np.ndarray
+    basis: np.ndarray
+    value: float
+    slope: float
+
+    def objective(self, t: float) -> float:
+        return self.value + self.slope * t
+
+
+@dataclass
+class ParametricResult:
+    """Hasil ``parametric_objective``: segmen berurutan menurut parameter t"""
+    status: str
+    segments: list
+    pivots: int
+    message: str = ""
+
+    @property
+    def breakpoints(self) -> list:
+        """Nilai t tempat rencana optimal berpindah ke titik pojok tetangga"""
+        return [segment.lower for segment in self.segments[1:]]
+
+
+def parametric_objective(model: LinearProgram, direction, start: float = 0.0, stop: float = np.inf,
+                         max_pivots: int = 10000, tol: float = 1e-9) -> ParametricResult:
+    """Solusi optimal untuk fungsi tujuan ``c + t * direction`` di seluruh rentang ``start <= t <= stop``
+
+    Satu solve di ``t = start``, lalu parametric simplex: rentang t tempat basis
+    tetap optimal dihitung dari reduced cost ``d0 + t * dd``; di ujung rentang
+    variabel yang reduced cost-nya menjadi 0 masuk basis (satu pivot ke titik
+    pojok tetangga) dan perhitungan diulang. Status ``UNBOUNDED`` berarti
+    fungsi tujuan tidak terbatas untuk t di atas ujung segmen terakhir.
+    """
+    direction = np.asarray(direction, dtype=float).ravel()
+    if direction.size != model.num_vars:
+        raise ValueError(f"Panjang direction ({direction.size}) tidak sama dengan jumlah variabel ({model.num_vars})")
+    first = solve_lp(replace(model, c=model.c + start * direction), tol=tol)
+    if not first.success:
+        return ParametricResult(first.status, [], 0, first.message)
+
+    std = to_standard_form(model)
+    m, n_total = std.A.shape
+    n = std.num_orig
+    sign = -1.0 if model.maximize else 1.0
+    cost_base = std.c.copy()
+    cost_dir = np.zeros(n_total)
+    cost_dir[:n] = sign * direction
+    A_T = std.A.T.tocsr()
+    allowed = np.ones(n_total, dtype=bool)
+    allowed[std.artificial] = False
+
+    basis = first.basis.copy()
+    factor = _BasisFactor(std.A, basis)
+    x_B = factor.ftran(std.b)
+    segments, pivots, t = [], 0, float(start)
+    status, message = OPTIMAL, "Seluruh rentang parameter selesai"
+    while True:
+        # Reduced cost d(t) = d0 + t * dd untuk basis saat ini
+        d0 = cost_base - A_T @ factor.btran(cost_base[basis])
+        dd = cost_dir - A_T @ factor.btran(cost_dir[basis])
+        nonbasic = allowed.copy()
+        nonbasic[basis] = False
+        falling = nonbasic & (dd < -tol)
+        limits = np.full(n_total, np.inf)
+        limits[falling] = -d0[falling] / dd[falling]
+        q = int(np.argmin(limits))
+        upper = float(min(max(limits[q], t), stop)) + 0.0
+
+        x_std = np.zeros(n_total)
+        x_std[basis] = np.maximum(x_B, 0.0)
+        x = x_std[:n] + 0.0
+        if segments and np.allclose(segments[-1].x, x, rtol=1e-9, atol=1e-9):
+            segments[-1].upper = upper  # Pivot degenerate: titik pojok sama
+        elif upper > t or not segments:
+            if segments and segments[-1].upper <= segments[-1].lower:
+                segments.pop()  # Optimal hanya tepat di satu nilai t (ikatan di ujung rentang)
+            segments.append(ParametricSegment(t, upper, x, basis.copy(), float(model.c @ x), float(direction @ x)))
+        if upper >= stop:
+            break
+        if pivots >= max_pivots:
+            status, message = ITERATION_LIMIT, "Batas pivot tercapai"
+            break
+
+        # Kolom q masuk basis; uji rasio menjaga feasibility primal
+        t = upper
+        col = factor.ftran(_column(std.A, q))
+        pos = col > tol
+        if not pos.any():
+            status, message = UNBOUNDED, f"Fungsi tujuan tidak terbatas untuk parameter di atas {t:g}"
+            break
+        ratios = np.full(m, np.inf)
+        ratios[pos] = np.maximum(x_B[pos], 0.0) / col[pos]
+        theta = ratios.min()
+        ties = np.flatnonzero(ratios <= theta + tol)
+        r = ties[np.argmax(np.abs(col[ties]))]
+        theta = ratios[r]
+        x_B -= theta * col
+        x_B[r] = theta
+        basis[r] = q
+        if factor.update(r, col, basis):
+            x_B = factor.ftran(std.b)
+        pivots += 1
+    return ParametricResult(status, segments, pivots, message)
@@ -0,0 +1,209 @@
+"""Penyimpanan skenario yang sudah diselesaikan di SQLite lokal.
+
+Setiap skenario diindeks dengan tuple parameter (ditambah mode bilangan bulat)
+dan waktu penyimpanan, sehingga hasil lama bisa dibuka lagi tanpa menghitung
+ulang, juga setelah aplikasi di-restart. Solusi disimpan utuh sebagai JSON
+(termasuk analisis sensitivitas) beserta pratinjau grafik (SVG; riwayat versi
+lama menyimpan PNG). Baris lama yang solusinya masih berupa pickle dihapus saat
+database dibuka dan akan dihitung ulang bila dibutuhkan.
+
+Lokasi database diatur dengan variabel lingkungan ``SCENARIO_DB``
+(default ``data/scenarios.sqlite3``).
+"""
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np  # Mengembalikan array solusi dari JSON
+
+from batch import PARAMETER_NAMES
+from cache import normalize_parameters
+from solver import SensitivityReport
+
+DEFAULT_PATH = Path(__file__).resolve().parent / "data" / "scenarios.sqlite3"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY,
+    {", ".join(f"{name} REAL NOT NULL" for name in PARAMETER_NAMES)},
+    integer_mode INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    optimal_x1 REAL,
+    optimal_x2 REAL,
+    optimal_value REAL,
+    optimal_label TEXT,
+    solution TEXT NOT NULL,
+    preview_png BLOB
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_scenarios_parameters
+    ON scenarios ({", ".join(PARAMETER_NAMES)}, integer_mode);
+CREATE INDEX IF NOT EXISTS idx_scenarios_created_at ON scenarios (created_at DESC);
+"""
+SCHEMA_VERSION = 1  # 1: kolom solution berisi JSON (versi 0: pickle)
+
+_SENSITIVITY_KEY = "__sensitivity__"
+_NAME_FIELDS = ("con_names", "var_names")
+
+
+def _to_json(value):
+    """``default`` untuk json.dumps: nilai NumPy dan SensitivityReport"""
+    if isinstance(value, SensitivityReport):
+        return {_SENSITIVITY_KEY: asdict(value)}
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Nilai solusi tidak bisa disimpan: {type(value).__name__}")
+
+
+def _from_json(obj: dict):
+    """``object_hook`` untuk json.loads: membangun ulang SensitivityReport"""
+    if _SENSITIVITY_KEY in obj:
+        fields = obj[_SENSITIVITY_KEY]
+        return SensitivityReport(**{name: value if name in _NAME_FIELDS else np.asarray(value, dtype=float)
+                                    for name, value in fields.items()})
+    return obj
+
+
+def dump_solution(solution: dict) -> str:
+    """Solusi ``production.solve_production`` sebagai teks JSON (inf/NaN ikut tersimpan)"""
+    return json.dumps(solution, default=_to_json)
+
+
+def load_solution(text: str) -> dict:
+    """Kebalikan ``dump_solution``: titik kembali berupa tuple dan basis berupa array"""
+    solution = json.loads(text, object_hook=_from_json)
+    solution['corners'] = [tuple(point) for point in solution['corners']]
+    for name in ('optimal_point', 'relaxation_point'):
+        if solution.get(name) is not None:
+            solution[name] = tuple(solution[name])
+    if solution.get('basis') is not None:
+        solution['basis'] = np.asarray(solution['basis'], dtype=int)
+    return solution
+
+
+@dataclass
+class StoredScenario:
+    """Satu skenario dari database"""
+    id: int
+    parameters: dict
+    integer_mode: bool
+    created_at: float
+    optimal_point: tuple
+    optimal_value: float
+    optimal_label: str
+    solution: dict = None
+    preview_png: bytes = None
+
+
+class ScenarioStore:
+    """Akses thread-safe ke tabel skenario (satu koneksi, mode WAL)"""
+
+    def __init__(self, path=None):
+        self.path = Path(path or os.environ.get("SCENARIO_DB") or DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self._lock = threading.Lock()
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # Solusi pickle tidak dibaca (pickle.loads dari file bisa menjalankan kode)
+            with self._conn:
+                self._conn.execute("DELETE FROM scenarios WHERE typeof(solution) = 'blob'")
+        if version != SCHEMA_VERSION:
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _key(parameters, integer_mode) -> tuple:
+        return normalize_parameters(parameters) + (int(bool(integer_mode)),)
+
+    def save(self, parameters, integer_mode: bool, solution: dict, preview_png: bytes = None) -> int:
+        """Menyimpan (atau memperbarui) skenario; mengembalikan id-nya"""
+        x1, x2 = (float(v) for v in solution['optimal_point'])
+        columns = PARAMETER_NAMES + ("integer_mode",)
+        values = self._key(parameters, integer_mode) + (
+            time.time(), x1, x2, float(solution['optimal_value']), str(solution['optimal_label']),
+            dump_solution(solution), preview_png,
+        )
+        sql = f"""
+            INSERT INTO scenarios ({", ".join(columns)}, created_at, optimal_x1, optimal_x2,
+                                   optimal_value, optimal_label, solution, preview_png)
+            VALUES ({", ".join("?" * (len(columns) + 7))})
+            ON CONFLICT ({", ".join(columns)}) DO UPDATE SET
+                created_at = excluded.created_at,
+                optimal_x1 = excluded.optimal_x1,
+                optimal_x2 = excluded.optimal_x2,
+                optimal_value = excluded.optimal_value,
+                optimal_label = excluded.optimal_label,
+                solution = excluded.solution,
+                preview_png = COALESCE(excluded.preview_png, scenarios.preview_png)
+            RETURNING id
+        """
+        with self._lock, self._conn:
+            return self._conn.execute(sql, values).fetchone()[0]
+
+    def get(self, parameters, integer_mode: bool):
+        """Skenario dengan parameter persis sama, atau None"""
+        where = " AND ".join(f"{name} = ?" for name in PARAMETER_NAMES + ("integer_mode",))
+        return self._fetch_one(f"SELECT * FROM scenarios WHERE {where}", self._key(parameters, integer_mode))
+
+    def load(self, scenario_id: int):
+        """Skenario berdasarkan id, atau None"""
+        return self._fetch_one("SELECT * FROM scenarios WHERE id = ?", (scenario_id,))
+
+    def recent(self, limit: int = 20) -> list:
+        """Skenario terbaru (tanpa solusi lengkap) untuk daftar riwayat"""
+        columns = ", ".join(("id",) + PARAMETER_NAMES + ("integer_mode", "created_at", "optimal_x1",
+                                                         "optimal_x2", "optimal_value", "optimal_label"))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {columns} FROM scenarios ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._scenario(row) for row in rows]
+
+    def delete(self, scenario_id: int):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM scenarios WHERE id = ?", (scenario_id,))
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM scenarios")
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scenarios").fetchone()[0]
+
+    def _fetch_one(self, sql, params):
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        if row is None:
+            return None
+        scenario = self._scenario(row[:-2])
+        scenario.solution = load_solution(row[-2])
+        scenario.preview_png = row[-1]
+        return scenario
+
+    @staticmethod
+    def _scenario(row) -> StoredScenario:
+        n = len(PARAMETER_NAMES)
+        scenario_id, values = row[0], row[1:n + 1]
+        integer_mode, created_at, x1, x2, value, label = row[n + 1:n + 7]
+        return StoredScenario(
+            id=scenario_id,
+            parameters=dict(zip(PARAMETER_NAMES, values)),
+            integer_mode=bool(integer_mode),
+            created_at=created_at,
+            optimal_point=(x1, x2),
+            optimal_value=value,
+            optimal_label=label,
+        )
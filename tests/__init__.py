@@ -0,0 +1 @@
+"""Tes perilaku modul optimasi (pytest, dijalankan dari root repo: ``python -m pytest``)."""
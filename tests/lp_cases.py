@@ -0,0 +1,57 @@
+"""Model LP acak kecil dan solusi pembanding dari ``scipy.optimize.linprog`` (HiGHS)."""
+import numpy as np
+from scipy.optimize import linprog
+
+from solver import EQ, GE, INFEASIBLE, LE, OPTIMAL, UNBOUNDED, LinearProgram
+
+_LINPROG_STATUS = {0: OPTIMAL, 2: INFEASIBLE, 3: UNBOUNDED}
+
+
+def random_lp(rng, m, n, maximize=True, senses=(LE, GE, EQ), density=0.6, bounded=True):
+    """Model acak yang pasti feasible (ruas kanan dibangun dari titik x0 >= 0)
+
+    Sebagian x0 bernilai nol dan sebagian kendala ketat di x0 sehingga model
+    sering degenerate. ``bounded=True`` menambahkan kendala sum(x) <= batas.
+    """
+    A = rng.integers(-3, 8, (m, n)) * (rng.random((m, n)) < density)
+    x0 = rng.integers(0, 6, n) * (rng.random(n) < 0.7)
+    chosen = np.asarray(senses)[rng.integers(0, len(senses), m)]
+    slack = rng.integers(0, 5, m)
+    b = A @ x0 + np.where(chosen == LE, slack, np.where(chosen == GE, -slack, 0))
+    if bounded:
+        A = np.vstack([A, np.ones(n, dtype=int)])
+        b = np.append(b, x0.sum() + 10)
+        chosen = np.append(chosen, LE)
+    c = rng.integers(-5, 10, n)
+    return LinearProgram(c=c, A=A, senses=chosen, b=b, maximize=maximize)
+
+
+def reference(model: LinearProgram, integrality=None):
+    """``(status, objektif, x)`` dari linprog/milp untuk model yang sama"""
+    A = model.A.toarray()
+    sign = -1.0 if model.maximize else 1.0
+    le, ge, eq = model.senses == LE, model.senses == GE, model.senses == EQ
+    A_ub = np.vstack([A[le], -A[ge]])
+    b_ub = np.concatenate([model.b[le], -model.b[ge]])
+    options = dict(A_ub=A_ub if A_ub.size else None, b_ub=b_ub if A_ub.size else None,
+                   A_eq=A[eq] if eq.any() else None, b_eq=model.b[eq] if eq.any() else None,
+                   bounds=(0, None), method="highs")
+    if integrality is not None:
+        options["integrality"] = integrality
+    result = linprog(sign * model.c, **options)
+    status = _LINPROG_STATUS.get(result.status, result.message)
+    if status != OPTIMAL:
+        return status, None, None
+    return status, sign * result.fun, result.x
+
+
+def assert_feasible(model: LinearProgram, x, tol=1e-6):
+    """x >= 0 dan setiap kendala dipenuhi (toleransi relatif terhadap ruas kanan)"""
+    x = np.asarray(x, dtype=float)
+    assert np.all(x >= -tol)
+    lhs = model.A @ x
+    scale = tol * (1.0 + np.abs(model.b))
+    le, ge, eq = model.senses == LE, model.senses == GE, model.senses == EQ
+    assert np.all(lhs[le] <= model.b[le] + scale[le])
+    assert np.all(lhs[ge] >= model.b[ge] - scale[ge])
+    assert np.all(np.abs(lhs[eq] - model.b[eq]) <= scale[eq])
@@ -0,0 +1,93 @@
+"""Halaman Optimasi lewat AppTest: form parameter, fragment, dan riwayat."""
+import os
+import re
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INPUTS = {"p1": 120000, "t1": 3, "max1": 30, "p2": 80000, "t2": 2, "max2": 40, "total": 120}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def isolated_storage(tmp_path_factory):
+    """Database riwayat dan result store di direktori sementara"""
+    directory = tmp_path_factory.mktemp("app")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("SCENARIO_DB", str(directory / "skenario.sqlite3"))
+        patch.setenv("RESULTS_DIR", str(directory / "results"))
+        yield directory
+
+
+def optimasi_page():
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.session_state.current_page = "Optimasi"
+    return at.run()
+
+
+def submit(at, **inputs):
+    for key, value in inputs.items():
+        at.number_input(key=key).set_value(value)
+    return next(b for b in at.button if "HITUNG" in b.label).click().run()
+
+
+def markdown_text(at) -> str:
+    return "\n".join(m.value for m in at.markdown)
+
+
+def test_submit_solves_and_edits_wait_for_next_submit():
+    at = optimasi_page()
+    assert "active_scenario" not in at.session_state
+    submit(at, **INPUTS)
+    assert not at.exception
+    assert at.session_state.active_scenario[0]["total_time"] == 120
+    assert "Rp4,800,000" in markdown_text(at)
+
+    # Mengubah input tanpa menekan HITUNG tidak mengganti skenario aktif maupun hasilnya
+    at.number_input(key="total").set_value(60).run()
+    assert at.session_state.active_scenario[0]["total_time"] == 120
+    assert "Rp4,800,000" in markdown_text(at)
+
+    submit(at, **dict(INPUTS, total=60))
+    assert at.session_state.active_scenario[0]["total_time"] == 60
+    assert "Rp4,800,000" not in markdown_text(at)
+
+
+def test_calculation_steps_list_the_real_vertices():
+    # Permintaan produk 1 tidak mengikat: daerah feasible hanya punya empat titik pojok
+    at = submit(optimasi_page(), **dict(INPUTS, max1=100))
+    assert not at.exception
+    text = markdown_text(at)
+    steps = [m.value for m in at.markdown if re.match(r"\*\*Titik \d", m.value)]
+    assert len(steps) == 4 and "Titik C" not in text
+    formulas = " ".join(l.value for l in at.latex)
+    assert "x_1 = 40.0, x_2 = 0.0" in formulas
+    assert "Z_{4}" in formulas and "Z_{5}" not in formulas
+    assert "Titik Optimal**: Titik 2 (40.0, 0.0)" in text
+
+
+def test_invalid_form_shows_error_without_solving():
+    at = submit(optimasi_page(), **dict(INPUTS, p1=0, p2=0))
+    assert [e.value for e in at.error] == ["Keuntungan produk tidak boleh 0 semua"]
+    assert "active_scenario" not in at.session_state
+
+
+def test_solved_scenario_is_saved_to_history(isolated_storage):
+    from store import ScenarioStore
+    submit(optimasi_page(), **dict(INPUTS, total=100))
+    scenarios = ScenarioStore(isolated_storage / "skenario.sqlite3")
+    stored = scenarios.get(dict(zip(("p1", "t1", "max1", "p2", "t2", "max2", "total_time"), INPUTS.values()), total_time=100), False)
+    assert stored is not None and stored.optimal_point == (30, 5)
+    scenarios.close()
+
+
+def test_warm_start_method_is_shown_only_to_the_solving_session():
+    first = optimasi_page()
+    submit(first, **dict(INPUTS, total=110))
+    submit(first, **dict(INPUTS, total=111))
+    assert "dual simplex dari basis sebelumnya" in markdown_text(first)
+
+    # Sesi lain memakai entri cache yang sama tetapi tidak ikut menampilkan cara solve sesi pertama
+    second = submit(optimasi_page(), **dict(INPUTS, total=111))
+    assert "dual simplex" not in markdown_text(second)
+    assert "tidak dihitung ulang" in markdown_text(second)
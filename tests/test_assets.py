@@ -0,0 +1,48 @@
+"""Aset statis siap pakai dan impor ringan saat aplikasi mulai."""
+import base64
+import subprocess
+import sys
+from io import BytesIO
+from pathlib import Path
+
+from PIL import Image
+
+import assets
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_startup_imports_stay_light():
+    # Modul yang diimpor app.py di awal tidak boleh menarik library berat
+    code = ("import sys, assets, metrics; "
+            "print(','.join(m for m in ('PIL', 'matplotlib', 'numpy', 'pandas', 'reportlab', 'scipy') if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == ""
+
+
+def test_shipped_assets_are_served_as_is():
+    assert base64.b64decode(assets.logo_base64()) == assets.LOGO_PATH.read_bytes()
+    assert base64.b64decode(assets.header_base64()) == assets.HEADER_PATH.read_bytes()
+    assert Image.open(BytesIO(assets.logo_png())).size == (200, 80)
+    assert Image.open(BytesIO(assets.header_jpeg())).size == (1000, 200)
+
+
+def test_load_or_build_builds_once(tmp_path):
+    path = tmp_path / "sub" / "logo.png"
+    calls = []
+
+    def build():
+        calls.append(1)
+        return assets.render_logo()
+
+    first = assets.load_or_build(path, build)
+    second = assets.load_or_build(path, build)
+    assert first == second == path.read_bytes()
+    assert len(calls) == 1
+    assert not list(path.parent.glob("*.tmp"))
+
+
+def test_render_header_embeds_logo():
+    header = Image.open(BytesIO(assets.render_header(assets.render_logo()))).convert("RGB")
+    plain = Image.open(BytesIO(assets.render_header())).convert("RGB")
+    assert header.getpixel((875, 50)) != plain.getpixel((875, 50))
@@ -0,0 +1,58 @@
+"""Solver titik pojok tervektorisasi (``batch.solve_two_product_batch``)."""
+import numpy as np
+import pytest
+
+from batch import CORNER_LABELS, corner_points, solve_two_product_batch
+from solver import two_product_model
+from tests.lp_cases import reference
+
+
+def _random_parameters(rng, size):
+    return (rng.uniform(1, 100, size), rng.integers(1, 7, size).astype(float), rng.integers(0, 60, size).astype(float),
+            rng.uniform(1, 100, size), rng.integers(1, 7, size).astype(float), rng.integers(0, 60, size).astype(float),
+            rng.integers(0, 300, size).astype(float))
+
+
+def test_matches_linprog_per_scenario():
+    rng = np.random.default_rng(0)
+    parameters = _random_parameters(rng, 300)
+    result = solve_two_product_batch(*parameters)
+    assert len(result) == 300
+    for i in range(300):
+        status, objective, _ = reference(two_product_model(*(p[i] for p in parameters)))
+        assert result.optimal_value[i] == pytest.approx(objective, rel=1e-9, abs=1e-9)
+        assert result.feasible[i, result.optimal_index[i]]
+
+
+def test_optimal_point_is_feasible_corner():
+    rng = np.random.default_rng(1)
+    p1, t1, max1, p2, t2, max2, total_time = _random_parameters(rng, 1000)
+    result = solve_two_product_batch(p1, t1, max1, p2, t2, max2, total_time)
+    x1, x2 = result.optimal_point.T
+    assert np.all(x1 >= 0) and np.all(x2 >= 0)
+    assert np.all(x1 <= max1 + 1e-9) and np.all(x2 <= max2 + 1e-9)
+    assert np.all(t1 * x1 + t2 * x2 <= total_time + 1e-7)
+    assert np.allclose(result.optimal_value, p1 * x1 + p2 * x2)
+    assert set(result.optimal_label) <= set(CORNER_LABELS)
+
+
+def test_example_scenario():
+    result = solve_two_product_batch(120000, 3, 30, 80000, 2, 40, 120)
+    assert result.optimal_label.tolist() == ["C"]
+    assert result.optimal_point[0].tolist() == [30, 15]
+    assert result.optimal_value[0] == 4_800_000
+
+
+def test_zero_production_time_is_not_nan():
+    # t1 = 0: titik B/D tidak terdefinisi (pembagian dengan 0) dan bernilai -inf, bukan NaN
+    result = solve_two_product_batch(10, 0, 5, 1, 1, 4, 3)
+    assert not np.isnan(result.values).any()
+    assert result.optimal_value[0] == pytest.approx(10 * 5 + 1 * 3)
+
+
+def test_broadcasting_scalar_parameters():
+    total_time = np.array([0.0, 60.0, 120.0, 1000.0])
+    result = solve_two_product_batch(120000, 3, 30, 80000, 2, 40, total_time)
+    assert result.corners.shape == (4, 5, 2)
+    assert corner_points(120000, 3, 30, 80000, 2, 40, 120).tolist() == [[0, 0], [30, 0], [30, 15], [40 / 3, 40], [0, 40]]
+    assert np.all(np.diff(result.optimal_value) >= 0)  # Lebih banyak waktu tidak menurunkan keuntungan
@@ -0,0 +1,52 @@
+"""Skrip benchmark per tahap dijalankan dengan ukuran kecil sebagai smoke test."""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "benchmarks", "bench_stages.py")
+SMALL = ["--repeat", "1", "--batch-sizes", "1,50", "--lp-sizes", "6x4", "--integer-sizes", "4x4", "--model-sizes", "40"]
+
+
+@pytest.fixture(scope="module")
+def bench_stages():
+    spec = importlib.util.spec_from_file_location("bench_stages", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(*args):
+    return subprocess.run([sys.executable, SCRIPT, *SMALL, *args], cwd=ROOT,
+                          capture_output=True, text=True, check=True, timeout=300)
+
+
+def test_summary_uses_milliseconds(bench_stages):
+    assert bench_stages._summary([0.002, 0.001, 0.004]) == {"median_ms": 2.0, "min_ms": 1.0, "max_ms": 4.0}
+
+
+def test_stages_write_json_and_compare(tmp_path):
+    output = tmp_path / "hasil.json"
+    stages = "corner,results,lp,warmstart,frontier,integer,modelfile"
+    first = _run("--stages", stages, "--output", str(output))
+    results = json.loads(output.read_text())
+    assert json.loads(first.stdout) == results
+    assert list(results["stages"]) == stages.split(",")
+    assert {"batch_1", "batch_50", "solve_production"} <= set(results["stages"]["corner"])
+    assert {"append_50", "aggregate_50", "page_50", "csv_50"} <= set(results["stages"]["results"])
+    warm = results["stages"]["warmstart"]["6x4_rhs_warm"]
+    assert warm["median_ms"] >= 0 and "iterations" in warm and "method" in warm
+    assert {"mps_40_impor", "lp_40_impor"} <= set(results["stages"]["modelfile"])
+
+    second = _run("--stages", "corner", "--compare", str(output))
+    assert "batch_50" in second.stderr and " x" in second.stderr
+
+
+def test_unknown_stage_is_rejected():
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        _run("--stages", "corner,tidak-ada")
+    assert "tahap tidak dikenal" in error.value.stderr
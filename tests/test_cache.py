@@ -0,0 +1,71 @@
+"""Cache LRU hasil solve (``cache.LRUCache``)."""
+import threading
+
+import pytest
+
+from cache import LRUCache, normalize_parameters
+
+PARAMETERS = {'p1': 120000, 't1': 3, 'max1': 30, 'p2': 80000, 't2': 2, 'max2': 40, 'total_time': 120}
+
+
+def test_normalized_key_ignores_int_float_and_order():
+    shuffled = dict(reversed(list(PARAMETERS.items())))
+    as_float = {name: float(value) for name, value in PARAMETERS.items()}
+    assert normalize_parameters(PARAMETERS) == normalize_parameters(shuffled) == normalize_parameters(as_float)
+    assert normalize_parameters(PARAMETERS) == (120000.0, 3.0, 30.0, 80000.0, 2.0, 40.0, 120.0)
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" jadi yang terakhir dipakai
+    cache.put("c", 3)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_get_or_compute_counts_hits_and_misses():
+    cache = LRUCache(maxsize=4)
+    calls = []
+    for _ in range(3):
+        assert cache.get_or_compute("k", lambda: calls.append(1) or "v") == "v"
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_none_is_a_cached_value():
+    cache = LRUCache(maxsize=1)
+    calls = []
+    cache.get_or_compute("k", lambda: calls.append(1))
+    cache.get_or_compute("k", lambda: calls.append(1))
+    assert len(calls) == 1
+
+
+def test_invalid_size_and_clear():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+    cache = LRUCache(maxsize=1)
+    cache.put("a", 1)
+    cache.clear()
+    assert len(cache) == 0 and cache.get("a") is None
+
+
+def test_concurrent_puts_keep_size_bound():
+    cache = LRUCache(maxsize=16)
+
+    def worker(offset):
+        for i in range(500):
+            cache.put((offset, i), i)
+            cache.get((offset, i - 1))
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 16
+    assert cache.stats()["evictions"] == 8 * 500 - 16
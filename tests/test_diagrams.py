@@ -0,0 +1,74 @@
+"""Render Mermaid flowchart ke SVG di server (``diagrams``)."""
+from pathlib import Path
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from diagrams import DIAGRAM_DIR, UnsupportedDiagram, mermaid_svg, parse_flowchart, render_flowchart_svg, source_hash
+
+APP_SOURCE = (Path(__file__).resolve().parent.parent / "app.py").read_text(encoding="utf-8")
+APP_DIAGRAMS = re.findall(r'mermaid\("""(.*?)"""\)', APP_SOURCE, re.DOTALL)
+
+
+def test_parse_nodes_edges_and_shapes():
+    chart = parse_flowchart("""
+    graph TD
+        A[Mulai] --> B{Cek?}
+        B -->|ya| C(Selesai)
+        B -.-> D((Ulang)) ==> A
+        %% komentar
+        E([Stadion]) --- A
+    """)
+    assert chart.direction == "TB"
+    assert chart.nodes["A"] == ("Mulai", "rect")
+    assert chart.nodes["B"] == ("Cek?", "diamond")
+    assert chart.nodes["C"] == ("Selesai", "round")
+    assert chart.nodes["D"] == ("Ulang", "circle")
+    assert chart.nodes["E"] == ("Stadion", "stadium")
+    assert ("B", "C", "ya", "-->") in chart.edges
+    assert ("D", "A", "", "==>") in chart.edges
+    assert ("E", "A", "", "---") in chart.edges
+
+
+@pytest.mark.parametrize("code", [
+    "",
+    "sequenceDiagram\n A->>B: halo",
+    "graph TD\n A --> ",
+    "graph TD\n A -> B",
+])
+def test_unsupported_syntax_raises(code):
+    with pytest.raises(UnsupportedDiagram):
+        render_flowchart_svg(code)
+
+
+def test_svg_is_well_formed_and_escaped():
+    svg = render_flowchart_svg("graph LR\n A[x < y & z] --> B[Hasil]")
+    root = ET.fromstring(svg)
+    texts = [element.text for element in root.iter("{http://www.w3.org/2000/svg}text")]
+    assert "x < y & z" in texts and "Hasil" in texts
+
+
+def test_direction_controls_layout():
+    def centers(code):
+        root = ET.fromstring(render_flowchart_svg(code))
+        return [(float(t.get("x")), float(t.get("y"))) for t in root.iter("{http://www.w3.org/2000/svg}text")]
+
+    (ax, ay), (bx, by) = centers("graph LR\n A --> B")
+    assert bx > ax and by == ay
+    (ax, ay), (bx, by) = centers("graph TD\n A --> B")
+    assert by > ay and bx == ax
+
+
+def test_source_hash_ignores_indentation():
+    assert source_hash("graph TD\n  A --> B\n") == source_hash("   graph TD\nA --> B")
+
+
+@pytest.mark.parametrize("code", APP_DIAGRAMS)
+def test_app_diagrams_render_on_server_and_are_shipped(code):
+    assert (DIAGRAM_DIR / f"{source_hash(code)}.svg").exists()
+    assert mermaid_svg(code) == render_flowchart_svg(code)
+
+
+def test_app_has_diagrams():
+    assert APP_DIAGRAMS
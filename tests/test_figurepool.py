@@ -0,0 +1,51 @@
+"""FigurePool: render bersamaan dari banyak thread tidak saling tercampur."""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from plotting import FigurePool
+
+PARAMETERS = {'p1': 120000, 't1': 3, 'max1': 30, 'p2': 80000, 't2': 2, 'max2': 40, 'total_time': 120}
+JOBS = [(dict(PARAMETERS, total_time=100 + 5 * k), (30, 5 + 2.5 * k)) for k in range(6)]
+
+
+def _serial(jobs, dpi=40):
+    pool = FigurePool(size=1)
+    return [pool.render(parameters, point, dpi)[0] for parameters, point in jobs]
+
+
+def test_concurrent_renders_match_serial_renders():
+    expected = _serial(JOBS)
+    assert len(set(expected)) == len(JOBS)
+    pool = FigurePool(size=2)
+    jobs = JOBS * 4
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        results = list(executor.map(lambda job: pool.render(job[0], job[1], 40)[0], jobs))
+    assert results == expected * 4
+    stats = pool.stats()
+    assert stats["created"] <= 2 and stats["idle"] == stats["created"]
+    assert stats["renders"] == len(jobs)
+
+
+def test_borrowed_figure_is_cleared_and_bounded():
+    pool = FigurePool(size=1)
+    with pool.figure() as fig:
+        fig.add_subplot()
+        borrowed = fig
+        waiting = threading.Thread(target=lambda: pool.figure().__enter__())
+        waiting.start()
+        waiting.join(0.2)
+        assert waiting.is_alive()  # Figure kedua menunggu karena size=1
+    waiting.join(5)
+    assert not waiting.is_alive()
+    assert pool.stats()["waits"] == 1 and pool.stats()["created"] == 1
+    assert borrowed.axes == []
+
+
+def test_process_pool_renders_identical_png():
+    expected = _serial(JOBS[:2])
+    pool = FigurePool(size=1, processes=2)
+    try:
+        assert [pool.render(parameters, point, 40)[0] for parameters, point in JOBS[:2]] == expected
+        assert pool.stats()["processes"] == 2
+    finally:
+        pool.shutdown()
@@ -0,0 +1,91 @@
+"""Geometri daerah feasible dua variabel dibandingkan dengan linprog."""
+import numpy as np
+import pytest
+from scipy.spatial import ConvexHull
+
+from geometry import clip_lines, constraint_label, feasible_region, model_region, svg_path
+from solver import EQ, GE, LE, OPTIMAL, UNBOUNDED, LinearProgram, two_product_model
+from tests.lp_cases import random_lp, reference
+
+
+def _random_region_model(seed, bounded):
+    rng = np.random.default_rng(2000 + seed)
+    return random_lp(rng, rng.integers(1, 6), 2, bounded=bounded)
+
+
+@pytest.mark.parametrize("bounded", [True, False])
+@pytest.mark.parametrize("seed", range(40))
+def test_vertices_give_linprog_optimum_in_every_direction(seed, bounded):
+    model = _random_region_model(seed, bounded)
+    region = model_region(model)
+    assert not region.empty  # random_lp selalu feasible
+    G, h = region.G, region.h
+    assert np.all(G @ region.vertices.T <= h[:, None] + 1e-7 * (1 + np.abs(h).max()))
+
+    for angle in np.linspace(0, 2 * np.pi, 16, endpoint=False):
+        direction = LinearProgram(c=[np.cos(angle), np.sin(angle)], A=model.A, senses=model.senses, b=model.b)
+        status, objective, _ = reference(direction)
+        if status == OPTIMAL:
+            best = (region.vertices @ direction.c).max()
+            assert best == pytest.approx(objective, rel=1e-7, abs=1e-7)
+        else:
+            assert status == UNBOUNDED and not region.bounded
+    if region.bounded:
+        assert region.area == (0.0 if len(region.vertices) < 3 else pytest.approx(ConvexHull(region.vertices).volume))
+    else:
+        assert region.area == np.inf
+
+
+def test_two_product_region_and_names():
+    region = model_region(two_product_model(120000, 3, 30, 80000, 2, 40, 120))
+    assert region.bounded
+    expected = np.array([(0, 0), (0, 40), (40 / 3, 40), (30, 0), (30, 15)])
+    assert np.allclose(sorted(map(tuple, region.vertices)), expected)
+    # Berlawanan arah jarum jam: luas bertanda positif
+    x, y = region.vertices.T
+    assert x @ np.roll(y, -1) - y @ np.roll(x, -1) > 0
+    assert region.area == pytest.approx(ConvexHull(region.vertices).volume)
+    assert "Waktu produksi ∩ Permintaan produk 1" in region.vertex_names()
+
+
+def test_empty_and_degenerate_regions():
+    assert feasible_region([[1, 1], [1, 1]], [1, 2], [LE, GE]).empty
+    always = feasible_region([[0, 0]], [-1], [GE])  # 0 >= -1: hanya kuadran x >= 0
+    assert not always.bounded and always.vertices.tolist() == [[0.0, 0.0]]
+    assert feasible_region([[0, 0]], [-1], [LE]).empty
+    segment = feasible_region([[1, 1]], [4], [EQ])
+    assert segment.bounded and segment.area == 0.0 and len(segment.vertices) == 2
+
+
+def test_clip_makes_unbounded_region_drawable():
+    region = feasible_region([[1, -1]], [2], [LE])
+    assert not region.bounded and region.area == np.inf
+    clipped = region.clip(10, 10)
+    assert clipped.bounded
+    assert clipped.area == pytest.approx(100 - 0.5 * 8 * 8)
+
+
+def test_clip_lines_end_on_box_and_line():
+    A, b = np.array([[3.0, 2.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]]), np.array([120.0, 30.0, 40.0, 500.0])
+    segments = clip_lines(A, b, 50, 60)
+    for row in range(3):
+        assert np.allclose(segments[row] @ A[row], b[row])
+        assert np.all((segments[row] >= -1e-9) & (segments[row] <= [50 + 1e-9, 60 + 1e-9]))
+    assert np.allclose(sorted(map(tuple, segments[0])), [(0, 60), (40, 0)])
+    assert np.isnan(segments[3]).all()
+
+
+@pytest.mark.parametrize("coefs, sense, rhs, text", [
+    ((3, 2), LE, 120, "3x₁ + 2x₂ ≤ 120"),
+    ((1, -1), GE, 0, "x₁ - x₂ ≥ 0"),
+    ((0, -2.5), EQ, 5, "-2.5x₂ = 5"),
+    ((0, 0), LE, 1, "0 ≤ 1"),
+])
+def test_constraint_label(coefs, sense, rhs, text):
+    assert constraint_label(coefs, sense, rhs) == text
+
+
+def test_svg_path():
+    assert svg_path(np.empty((0, 2)), lambda p: p) == ""
+    path = svg_path([(0, 0), (1, 0), (1, 1)], lambda p: p * [10, -10] + [0, 100])
+    assert path == "M0.00,100.00 L10.00,100.00 L10.00,90.00 Z"
@@ -0,0 +1,125 @@
+"""Mode headless: solve per baris JSON, CLI, dan server HTTP JSON-lines."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import StringIO
+import json
+
+import pytest
+
+import headless
+
+SCENARIO = {"id": 1, "p1": 120000, "t1": 3, "max1": 30, "p2": 80000, "t2": 2, "max2": 40, "total_time": 120}
+MODEL = {"id": "m", "c": [3, 2], "A": [[1, 1], [1, 3]], "senses": ["<=", "<="], "b": [4, 6], "maximize": True}
+
+
+def test_solve_record_two_product_and_model():
+    assert headless.solve_record(SCENARIO) | {"message": ""} == {
+        "id": 1, "status": "optimal", "x": [30.0, 15.0], "objective": 4800000.0, "label": "C",
+        "iterations": 2, "message": ""}
+    output = headless.solve_record(MODEL)
+    assert output["id"] == "m" and output["objective"] == pytest.approx(12)
+    assert headless.solve_record({**MODEL, "integer": True})["gap"] == 0
+
+
+@pytest.mark.parametrize("line, has_id", [
+    ('{"id": 7, "p1": 1}', True),
+    ("bukan json", False),
+    ("[1, 2]", False),
+    (b'{"id": 8, "p1": "\xff"}', True),
+])
+def test_invalid_lines_become_error_records(line, has_id):
+    output = json.loads(headless.solve_line(line))
+    assert output["status"] == "error" and output["message"]
+    assert ("id" in output) == has_id
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cli_keeps_input_order(workers):
+    records = [dict(SCENARIO, id=i, total_time=60 + i) for i in range(20)]
+    source = StringIO("\n".join(json.dumps(record) for record in records) + "\n\n")
+    target = StringIO()
+    headless.run_cli(source, target, workers=workers, chunksize=3)
+    outputs = [json.loads(line) for line in target.getvalue().splitlines()]
+    assert [output["id"] for output in outputs] == list(range(20))
+    assert all(output["status"] == "optimal" for output in outputs)
+
+
+class _BrokenExecutor(ThreadPoolExecutor):
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker mati")
+
+
+def _request(executor, body: bytes, headers: bytes = None, path=b"/solve", method=b"POST") -> bytes:
+    """Mengirim satu request ke server di port acak dan mengembalikan seluruh respons"""
+    async def run():
+        server = await asyncio.start_server(lambda r, w: headless._handle_connection(r, w, executor), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(method + b" " + path + b" HTTP/1.1\r\n"
+                     + (headers if headers is not None else b"Content-Length: %d\r\n" % len(body)) + b"\r\n" + body)
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 30)
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return response
+    return asyncio.run(run())
+
+
+def _ndjson(response: bytes) -> list:
+    """Isi respons chunked sebagai daftar record"""
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200") and b"chunked" in head
+    data, rest = b"", body
+    while True:
+        size, _, rest = rest.partition(b"\r\n")
+        size = int(size, 16)
+        if size == 0:
+            assert rest == b"\r\n"
+            break
+        data, rest = data + rest[:size], rest[size + 2:]
+    return [json.loads(line) for line in data.splitlines()]
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def test_server_streams_every_record(executor):
+    lines = [json.dumps(dict(SCENARIO, id=i)).encode() for i in range(300)]
+    records = _ndjson(_request(executor, b"\n".join(lines)))
+    assert sorted(record["id"] for record in records) == list(range(300))
+
+
+def test_server_reports_invalid_utf8_per_record(executor):
+    body = json.dumps(SCENARIO).encode() + b"\n\xfe\xff\n" + json.dumps(dict(SCENARIO, id=2)).encode()
+    records = _ndjson(_request(executor, body))
+    assert sorted(str(record.get("id")) for record in records) == ["1", "2", "None"]
+    assert [record["status"] for record in records].count("error") == 1
+
+
+def test_server_answers_every_record_when_workers_fail():
+    body = b"\n".join(json.dumps(dict(SCENARIO, id=i)).encode() for i in range(5))
+    records = _ndjson(_request(_BrokenExecutor(max_workers=1), body))
+    assert sorted(record["id"] for record in records) == list(range(5))
+    assert all(record["status"] == "error" and "BrokenProcessPool" in record["message"] for record in records)
+
+
+def test_server_closes_stream_on_malformed_chunked_body(executor):
+    body = b"5\r\n{\"id\"\r\nzz\r\n"
+    records = _ndjson(_request(executor, body, b"Transfer-Encoding: chunked\r\n"))
+    assert records[-1]["status"] == "error"
+
+
+def test_server_rejects_bad_content_length_before_streaming(executor):
+    response = _request(executor, b"", b"Content-Length: abc\r\n")
+    assert response.startswith(b"HTTP/1.1 400")
+
+
+def test_server_health_and_metrics(executor):
+    assert _request(executor, b"", b"", b"/health", b"GET").endswith(b"ok\n")
+    assert _request(executor, b"", b"", b"/metrics", b"GET").startswith(b"HTTP/1.1 200")
+    assert _request(executor, b"", b"", b"/tidak-ada", b"GET").startswith(b"HTTP/1.1 404")
@@ -0,0 +1,69 @@
+"""Branch-and-bound (``integer.solve_milp``) dibandingkan dengan milp HiGHS."""
+import numpy as np
+import pytest
+
+from integer import NODE_LIMIT, solve_milp
+from solver import GE, INFEASIBLE, LE, OPTIMAL, LinearProgram, two_product_model
+from tests.lp_cases import assert_feasible, random_lp, reference
+
+
+def _assert_matches_reference(model, integer=None):
+    integrality = np.ones(model.num_vars, dtype=int)
+    if integer is not None:
+        integrality[:] = 0
+        integrality[integer] = 1
+    status, objective, _ = reference(model, integrality=integrality)
+    result = solve_milp(model, integer=integer)
+    assert result.status == status
+    if status == OPTIMAL:
+        assert result.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+        assert_feasible(model, result.x)
+        assert np.allclose(result.x[integrality == 1], np.round(result.x[integrality == 1]), atol=1e-6)
+        assert result.gap <= 1e-9
+    return result
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_models_match_milp(seed):
+    rng = np.random.default_rng(500 + seed)
+    model = random_lp(rng, rng.integers(1, 6), rng.integers(1, 6), maximize=bool(seed % 2), senses=(LE, LE, GE))
+    _assert_matches_reference(model)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_mixed_integer_subset(seed):
+    rng = np.random.default_rng(700 + seed)
+    model = random_lp(rng, 4, 5, senses=(LE,))
+    _assert_matches_reference(model, integer=[0, 2])
+
+
+def test_fractional_relaxation_is_rounded_to_best_integer():
+    # Relaksasi di (30, 16.5); optimum bulat tidak sekadar pembulatan ke bawah
+    model = two_product_model(120000, 3, 30, 80000, 2, 40, 123)
+    result = _assert_matches_reference(model)
+    assert result.relaxation_objective >= result.objective
+    assert result.nodes >= 1
+
+
+def test_infeasible_integer_model():
+    # 2x = 1 tidak punya solusi bulat walau relaksasinya feasible
+    model = LinearProgram(c=[1], A=[[2]], senses=["="], b=[1], maximize=True)
+    result = solve_milp(model)
+    assert result.status == INFEASIBLE and not result.has_solution
+
+
+def test_parallel_workers_give_same_objective():
+    rng = np.random.default_rng(11)
+    model = random_lp(rng, 6, 8, senses=(LE,))
+    serial, parallel = solve_milp(model), solve_milp(model, workers=2)
+    assert parallel.status == serial.status == OPTIMAL
+    assert parallel.objective == pytest.approx(serial.objective)
+
+
+def test_node_limit_reports_gap():
+    rng = np.random.default_rng(3)
+    model = random_lp(rng, 8, 10, senses=(LE,))
+    result = solve_milp(model, max_nodes=1)
+    assert result.status in (NODE_LIMIT, OPTIMAL)
+    if result.status == NODE_LIMIT and result.has_solution:
+        assert result.gap >= 0 and result.bound >= result.objective - 1e-9
@@ -0,0 +1,73 @@
+"""Interior-point (dengan/tanpa crossover) dibandingkan dengan linprog."""
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+import interior
+from interior import INTERIOR, INTERIOR_CROSSOVER, choose_solver, solve, solve_interior
+from solver import INFEASIBLE, LE, OPTIMAL, UNBOUNDED, LinearProgram
+from tests.lp_cases import assert_feasible, random_lp, reference
+
+
+def _dense_model(rng, m, n):
+    A = rng.uniform(0, 10, (m, n)) * (rng.random((m, n)) < 0.5)
+    return LinearProgram(c=rng.uniform(1, 20, n), A=A, senses=[LE] * m, b=rng.uniform(50, 200, m))
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_crossover_matches_linprog(seed):
+    rng = np.random.default_rng(1500 + seed)
+    model = random_lp(rng, rng.integers(2, 10), rng.integers(2, 10), maximize=bool(seed % 2))
+    result = solve_interior(model)
+    status, objective, _ = reference(model)
+    assert result.status == status == OPTIMAL
+    assert result.objective == pytest.approx(objective, rel=1e-7, abs=1e-6)
+    assert_feasible(model, result.x)
+    if result.method == INTERIOR_CROSSOVER:
+        # Titik pojok dengan basis lengkap, sama seperti hasil simplex
+        assert result.basis.size == model.num_constraints
+
+
+@pytest.mark.parametrize("sparse_normal", [False, True])
+def test_interior_point_without_crossover(sparse_normal, monkeypatch):
+    if sparse_normal:
+        monkeypatch.setattr(interior, "DENSE_MAX_ROWS", 0)
+    model = _dense_model(np.random.default_rng(7), 60, 40)
+    result = solve_interior(model, crossover=False)
+    _, objective, _ = reference(model)
+    assert result.method == INTERIOR and result.basis.size == 0
+    assert result.objective == pytest.approx(objective, rel=1e-6)
+    assert_feasible(model, result.x, tol=1e-6)
+
+
+@pytest.mark.parametrize("model, status", [
+    (LinearProgram(c=[1], A=[[1], [1]], senses=["<=", ">="], b=[1, 2]), INFEASIBLE),
+    (LinearProgram(c=[1, 1], A=[[1, -1]], senses=["<="], b=[1]), UNBOUNDED),
+])
+def test_non_optimal_models_fall_back_to_simplex(model, status):
+    assert solve_interior(model).status == status
+
+
+def test_choose_solver_and_solve_dispatch():
+    rng = np.random.default_rng(0)
+    small = _dense_model(rng, 20, 10)
+    assert choose_solver(small) == "simplex"
+    large = LinearProgram(c=np.ones(300), A=sp.random(300, 300, density=0.05, random_state=0, format="csr"),
+                          senses=[LE] * 300, b=np.ones(300))
+    assert choose_solver(large) == "interior"
+
+    _, objective, _ = reference(small)
+    for choice in ("auto", "simplex", "interior"):
+        assert solve(small, choice).objective == pytest.approx(objective)
+    assert solve(small, "interior").method in (INTERIOR_CROSSOVER, "cold")
+    assert solve(small, "interior", crossover=False).method == INTERIOR
+    with pytest.raises(ValueError):
+        solve(small, "barrier")
+
+
+def test_solve_with_presolve_reports_reductions():
+    rng = np.random.default_rng(5)
+    model = random_lp(rng, 6, 5)
+    result = solve(model, "interior", presolve=True)
+    assert result.objective == pytest.approx(reference(model)[1], rel=1e-7, abs=1e-6)
+    assert result.x.size == model.num_vars
@@ -0,0 +1,101 @@
+"""Registry metrik, trace per rerun, dan endpoint /metrics."""
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+import metrics
+from metrics import MetricsRegistry, stage, start_trace, timed
+
+
+def test_counter_and_histogram_in_prometheus_text():
+    registry = MetricsRegistry(prefix="uji", buckets=(0.1, 1.0))
+    registry.describe("permintaan_total", "Jumlah permintaan")
+    registry.inc("permintaan_total", mode="lp")
+    registry.inc("permintaan_total", 2, mode="lp")
+    registry.inc("permintaan_total", mode='a"b')
+    for value in (0.05, 0.5, 5.0):
+        registry.observe("durasi", value, stage="x")
+    registry.gauge("ukuran", lambda: {(("pool", "p"),): 3})
+    registry.gauge("rusak", lambda: 1 / 0)
+
+    lines = registry.to_prometheus().splitlines()
+    assert "# HELP uji_permintaan_total Jumlah permintaan" in lines
+    assert "# TYPE uji_permintaan_total counter" in lines
+    assert 'uji_permintaan_total{mode="lp"} 3.0' in lines
+    assert 'uji_permintaan_total{mode="a\\"b"} 1.0' in lines
+    assert 'uji_durasi_bucket{stage="x",le="0.1"} 1' in lines
+    assert 'uji_durasi_bucket{stage="x",le="1.0"} 2' in lines
+    assert 'uji_durasi_bucket{stage="x",le="+Inf"} 3' in lines
+    assert 'uji_durasi_sum{stage="x"} 5.55' in lines
+    assert 'uji_durasi_count{stage="x"} 3' in lines
+    assert 'uji_ukuran{pool="p"} 3.0' in lines
+    assert not any("rusak" in line for line in lines)
+
+
+def test_json_export_matches_counts():
+    registry = MetricsRegistry(buckets=(1.0,))
+    registry.observe("stage_seconds", 0.5, stage="a")
+    registry.observe("stage_seconds", 2.0, stage="a")
+    registry.inc("n")
+    exported = json.loads(json.dumps(registry.to_json()))
+    histogram, = exported["histograms"]
+    assert histogram == {"name": "lp_stage_seconds", "labels": {"stage": "a"}, "buckets": {"1.0": 1},
+                         "sum": 2.5, "count": 2, "max": 2.0}
+    assert exported["counters"] == [{"name": "lp_n", "labels": {}, "value": 1.0}]
+    summary, = registry.stage_summary()
+    assert summary["stage"] == "a" and summary["count"] == 2 and summary["mean_ms"] == pytest.approx(1250)
+    registry.clear()
+    assert registry.to_json()["histograms"] == []
+
+
+def test_concurrent_increments_are_not_lost():
+    registry = MetricsRegistry()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: [registry.inc("n") for _ in range(1000)], range(8)))
+    assert registry.to_json()["counters"][0]["value"] == 8000
+
+
+def test_trace_collects_laps_stages_and_timed_calls():
+    @timed("uji.fungsi")
+    def work():
+        return 42
+
+    trace = start_trace("uji")
+    trace.lap("validasi")
+    with stage("uji.blok"):
+        pass
+    assert work() == 42
+    assert [row["tahap"] for row in trace.rows()] == ["uji.validasi", "uji.blok", "uji.fungsi"]
+    assert trace.total >= sum(seconds for _, seconds in trace.stages)
+    assert {"uji.validasi", "uji.blok", "uji.fungsi"} <= {row["stage"] for row in metrics.REGISTRY.stage_summary()}
+
+
+def test_trace_is_scoped_to_thread():
+    trace = start_trace("utama")
+    thread = threading.Thread(target=lambda: start_trace("lain").lap("x"))
+    thread.start()
+    thread.join()
+    assert metrics.current_trace() is trace and trace.stages == []
+
+
+def test_http_endpoint():
+    with stage("uji.http"):
+        pass
+    server = metrics.start_http_server(0)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urlopen(base + "/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert b"# TYPE lp_stage_seconds histogram" in response.read()
+        with urlopen(base + "/metrics.json") as response:
+            assert "histograms" in json.load(response)
+        with pytest.raises(HTTPError) as error:
+            urlopen(base + "/lain")
+        assert error.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
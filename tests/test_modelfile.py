@@ -0,0 +1,182 @@
+"""Impor MPS/LP: round trip model acak dan kasus format yang khas."""
+import numpy as np
+import pytest
+
+from integer import solve_milp
+from modelfile import detect_format, parse_lp, parse_model, parse_mps, read_model
+from solver import EQ, GE, LE, OPTIMAL, solve_lp
+from tests.lp_cases import random_lp, reference
+
+_MPS_TYPE = {LE: "L", GE: "G", EQ: "E"}
+
+
+def to_mps(model) -> bytes:
+    A = model.A.toarray()
+    lines = ["NAME ACAK", "OBJSENSE", "    MAX" if model.maximize else "    MIN", "ROWS", " N obj"]
+    lines += [f" {_MPS_TYPE[sense]} R{i}" for i, sense in enumerate(model.senses)]
+    lines.append("COLUMNS")
+    for j in range(model.num_vars):
+        lines.append(f"    X{j} obj {model.c[j]:g}")
+        lines += [f"    X{j} R{i} {A[i, j]:g}" for i in np.flatnonzero(A[:, j])]
+    lines.append("RHS")
+    lines += [f"    RHS R{i} {value:g}" for i, value in enumerate(model.b)]
+    lines.append("ENDATA")
+    return "\n".join(lines).encode()
+
+
+def to_lp(model) -> bytes:
+    A = model.A.toarray()
+
+    def expression(row):
+        return " ".join(f"{value:+g} X{j}" for j, value in enumerate(row))
+    lines = ["Maximize" if model.maximize else "Minimize", " obj: " + expression(model.c), "Subject To"]
+    lines += [f" R{i}: {expression(row)} {sense} {value:g}" for i, (row, sense, value) in enumerate(zip(A, model.senses, model.b))]
+    lines.append("End")
+    return "\n".join(lines).encode()
+
+
+@pytest.mark.parametrize("write, parse", [(to_mps, parse_mps), (to_lp, parse_lp)])
+@pytest.mark.parametrize("seed", range(15))
+def test_random_model_round_trip(seed, write, parse):
+    rng = np.random.default_rng(900 + seed)
+    model = random_lp(rng, rng.integers(1, 7), rng.integers(1, 7), maximize=bool(seed % 2))
+    parsed = parse(write(model)).model
+    order = [parsed.var_names.index(f"X{j}") for j in range(model.num_vars)]
+    assert parsed.maximize == model.maximize
+    assert np.array_equal(parsed.c[order], model.c)
+    assert np.array_equal(parsed.A.toarray()[:, order], model.A.toarray())
+    assert np.array_equal(parsed.b, model.b) and list(parsed.senses) == list(model.senses)
+
+    status, objective, _ = reference(model)
+    result = solve_lp(parsed)
+    assert result.status == status == OPTIMAL
+    assert result.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+
+
+LP_TEXT = b"""\\ Model produksi kecil
+Maximize obj: 3 x + 2y - 1.5e+0 z + 10
+Subject To c1: x + y + z <= 10
+ c2: x - y >= -2
+ -x + 3*z = 3
+ st + x <= 8
+Bounds
+ x <= 6
+ 1 <= y <= 5
+ st = 1
+General
+ x
+Binary
+ z
+End
+"""
+
+
+def test_lp_inline_sections_bounds_and_offset():
+    result = parse_lp(LP_TEXT)
+    model = result.model
+    assert model.var_names == ["x", "y", "z", "st"]
+    assert result.objective_offset == 10
+    assert list(model.c) == [3, 2, -1.5, 0]
+    assert model.con_names[:4] == ["c1", "c2", "R3", "R4"]
+    assert list(model.senses[:4]) == [LE, GE, EQ, LE]
+    assert sorted(result.integer.tolist()) == [0, 2]
+
+    integrality = np.zeros(model.num_vars, dtype=int)
+    integrality[result.integer] = 1
+    status, objective, _ = reference(model, integrality=integrality)
+    milp = solve_milp(model, integer=result.integer)
+    assert milp.status == status == OPTIMAL
+    assert milp.objective == pytest.approx(objective)
+    assert milp.x[3] == pytest.approx(1)  # st = 1: nama variabel, bukan section Subject To
+    assert 1 <= milp.x[1] <= 5 and milp.x[0] <= 6 and milp.x[2] in (0, 1)
+
+
+@pytest.mark.parametrize("text, message", [
+    (b"Subject To\n x <= 1\nEnd\n", "Maximize atau Minimize"),
+    (b"Maximize\n obj: x\nSubject To\n c: x <=\nEnd\n", "Ruas kanan"),
+    (b"Maximize\n obj: x\nBounds\n x free\nEnd\n", "bebas"),
+    (b"Maximize\n obj: x <= 3\nEnd\n", "pembanding"),
+    (b"Maximize\n obj: x\nSemi-continuous\n x\nEnd\n", "belum didukung"),
+])
+def test_lp_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_lp(text)
+
+
+MPS_TEXT = b"""* Model dengan range, marker dan batas
+NAME          CONTOH
+OBJSENSE
+    MAX
+ROWS
+ N  obj
+ L  waktu
+ G  minimum
+ E  campur
+COLUMNS
+    x  obj 3 waktu 2
+    x  minimum 1
+    MARKER 'MARKER' 'INTORG'
+    y  obj 2 waktu 1
+    y  campur 1
+    MARKER 'MARKER' 'INTEND'
+    z  obj 1 campur -1
+RHS
+    RHS waktu 12 minimum 1
+    RHS campur 0 obj -4
+RANGES
+    RNG campur 3
+BOUNDS
+ UP BND x 4
+ BV BND z
+ENDATA
+"""
+
+
+def test_mps_ranges_markers_bounds_and_offset():
+    result = parse_mps(MPS_TEXT)
+    model = result.model
+    assert result.name == "CONTOH" and model.maximize
+    assert result.objective_offset == 4
+    assert model.var_names == ["x", "y", "z"]
+    assert sorted(result.integer.tolist()) == [1, 2]
+    # campur: 0 <= y - z <= 3 (range positif pada baris E)
+    assert model.con_names[:4] == ["waktu", "minimum", "campur", "range campur"]
+    assert list(model.senses[2:4]) == [GE, LE] and list(model.b[2:4]) == [0, 3]
+
+    integrality = np.zeros(3, dtype=int)
+    integrality[result.integer] = 1
+    status, objective, _ = reference(model, integrality=integrality)
+    milp = solve_milp(model, integer=result.integer)
+    assert milp.status == status == OPTIMAL and milp.objective == pytest.approx(objective)
+
+
+@pytest.mark.parametrize("text, message", [
+    (b"NAME X\nROWS\n N obj\nENDATA\n", "COLUMNS"),
+    (b"ROWS\n L c\nCOLUMNS\n x c 1\nENDATA\n", "fungsi tujuan"),
+    (b"ROWS\n N obj\nCOLUMNS\n x c 1\nENDATA\n", "tidak dikenal"),
+    (b"ROWS\n N obj\nCOLUMNS\n x obj 1\nBOUNDS\n MI BND x\nENDATA\n", "bebas"),
+    (b"ROWS\n N obj\nCOLUMNS\n x obj 1\nSOS\nENDATA\n", "SOS"),
+])
+def test_mps_errors(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_mps(text)
+
+
+def test_read_model_from_file(tmp_path):
+    rng = np.random.default_rng(4)
+    model = random_lp(rng, 5, 4)
+    for name, write in (("acak.mps", to_mps), ("acak.LP", to_lp)):
+        path = tmp_path / name
+        path.write_bytes(write(model))
+        result = read_model(path)
+        assert result.format == detect_format(name)
+        assert result.name == ("ACAK" if result.format == "mps" else "acak")
+        assert np.array_equal(result.model.A.toarray(), model.A.toarray())
+    empty = tmp_path / "kosong.lp"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError, match="kosong"):
+        read_model(empty)
+    with pytest.raises(ValueError):
+        detect_format("model.txt")
+    with pytest.raises(ValueError):
+        parse_model(b"", "json")
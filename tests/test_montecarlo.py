@@ -0,0 +1,85 @@
+"""Simulasi Monte Carlo: sampel, hasil per sampel, dan jalur memori bersama."""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import montecarlo
+from batch import PARAMETER_NAMES
+from montecarlo import Distribution, run_monte_carlo, sample_inputs
+from solver import two_product_model
+from tests.lp_cases import reference
+
+PARAMETERS = {"p1": 120000, "t1": 3, "max1": 30, "p2": 80000, "t2": 2, "max2": 40, "total_time": 120}
+DISTRIBUTIONS = {
+    "p1": Distribution.relative("normal", 120000, 20),
+    "t1": Distribution.relative("uniform", 3, 30),
+    "p2": Distribution.relative("segitiga", 80000, 25),
+    "t2": Distribution("normal", 2, 5),  # Sebagian sampel terpotong ke 0
+}
+
+
+def test_distribution_validation_and_clipping():
+    with pytest.raises(ValueError):
+        Distribution("lognormal", 1, 1)
+    with pytest.raises(ValueError):
+        Distribution("normal", 1, -1)
+    samples = Distribution("normal", 0, 1).sample(np.random.default_rng(0), 1000)
+    assert samples.min() == 0 and samples.max() > 0
+
+
+def test_samples_are_reproducible_and_keep_fixed_parameters():
+    first = sample_inputs(PARAMETERS, DISTRIBUTIONS, 1000, seed=5)
+    assert np.array_equal(first, sample_inputs(PARAMETERS, DISTRIBUTIONS, 1000, seed=5))
+    assert not np.array_equal(first, sample_inputs(PARAMETERS, DISTRIBUTIONS, 1000, seed=6))
+    for row, name in enumerate(PARAMETER_NAMES):
+        if name not in DISTRIBUTIONS:
+            assert np.all(first[row] == PARAMETERS[name])
+
+
+def test_each_sample_matches_linprog():
+    result = run_monte_carlo(PARAMETERS, DISTRIBUTIONS, draws=40, seed=1, workers=1)
+    inputs = sample_inputs(PARAMETERS, DISTRIBUTIONS, 40, seed=1)
+    for k in range(40):
+        status, objective, _ = reference(two_product_model(*inputs[:, k]))
+        assert result.optimal_value[k] == pytest.approx(objective, rel=1e-9, abs=1e-6)
+    assert sum(result.corner_frequency().values()) == pytest.approx(1)
+    summary = result.summary()
+    assert summary["min"] <= summary["p5"] <= summary["median"] <= summary["p95"] <= summary["max"]
+
+
+@pytest.fixture
+def small_parallel(monkeypatch):
+    monkeypatch.setattr(montecarlo, "MIN_PARALLEL_DRAWS", 1000)
+    yield
+    with montecarlo._pool_lock:
+        pools = list(montecarlo._pools.values())
+        montecarlo._pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+def test_process_pool_matches_serial(small_parallel):
+    serial = run_monte_carlo(PARAMETERS, DISTRIBUTIONS, draws=20000, seed=3, workers=1)
+    parallel = run_monte_carlo(PARAMETERS, DISTRIBUTIONS, draws=20000, seed=3, workers=2)
+    assert parallel.workers == 2 and serial.workers == 1
+    assert np.array_equal(parallel.optimal_value, serial.optimal_value)
+    assert np.array_equal(parallel.optimal_index, serial.optimal_index)
+    assert np.array_equal(parallel.optimal_point, serial.optimal_point)
+
+
+def test_concurrent_runs_with_different_worker_counts(small_parallel):
+    serial = run_monte_carlo(PARAMETERS, DISTRIBUTIONS, draws=20000, seed=4, workers=1)
+    # Mengganti jumlah worker tidak boleh mematikan pool yang sedang dipakai thread lain
+    with ThreadPoolExecutor(4) as threads:
+        runs = list(threads.map(lambda w: run_monte_carlo(PARAMETERS, DISTRIBUTIONS, draws=20000, seed=4, workers=w),
+                                (2, 3, 2, 3)))
+    for run in runs:
+        assert np.array_equal(run.optimal_value, serial.optimal_value)
+    assert montecarlo.get_pool(2) is montecarlo.get_pool(2)
+    assert montecarlo.get_pool(2) is not montecarlo.get_pool(3)
+
+
+def test_rejects_empty_simulation():
+    with pytest.raises(ValueError):
+        run_monte_carlo(PARAMETERS, DISTRIBUTIONS, draws=0)
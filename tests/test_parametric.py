@@ -0,0 +1,81 @@
+"""Frontier fungsi tujuan parametrik dibandingkan dengan linprog per nilai t."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from production import profit_frontier, solve_production
+from solver import LE, OPTIMAL, UNBOUNDED, LinearProgram, parametric_objective
+from tests.lp_cases import random_lp, reference
+
+PARAMETERS = {"p1": 120000, "t1": 3, "max1": 30, "p2": 80000, "t2": 2, "max2": 40, "total_time": 120}
+
+
+def _segment_at(result, t):
+    return next(segment for segment in result.segments if segment.lower <= t <= segment.upper)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_segments_match_linprog_on_sampled_parameters(seed):
+    rng = np.random.default_rng(2200 + seed)
+    model = random_lp(rng, rng.integers(1, 7), rng.integers(2, 7), maximize=bool(seed % 2))
+    direction = rng.integers(-5, 6, model.num_vars).astype(float)
+    result = parametric_objective(model, direction, 0.0, 3.0)
+    assert result.status == OPTIMAL  # random_lp terbatas untuk fungsi tujuan apa pun
+    assert result.segments[0].lower == 0.0 and result.segments[-1].upper == 3.0
+    for previous, segment in zip(result.segments, result.segments[1:]):
+        assert previous.upper == pytest.approx(segment.lower)
+    assert result.breakpoints == [segment.lower for segment in result.segments[1:]]
+
+    for t in np.append(rng.uniform(0, 3, 8), result.breakpoints):
+        edited = replace(model, c=model.c + t * direction)
+        status, objective, _ = reference(edited)
+        segment = _segment_at(result, t)
+        assert status == OPTIMAL
+        assert segment.objective(t) == pytest.approx(objective, rel=1e-7, abs=1e-6)
+        assert edited.c @ segment.x == pytest.approx(objective, rel=1e-7, abs=1e-6)
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_unbounded_tail_matches_linprog(seed):
+    rng = np.random.default_rng(2300 + seed)
+    model = random_lp(rng, 3, 3, senses=(LE,), bounded=False)
+    direction = rng.integers(-3, 4, 3).astype(float)
+    result = parametric_objective(model, direction)
+    if result.status == UNBOUNDED:
+        beyond = result.segments[-1].upper + 1.0 if result.segments else 0.0
+        assert reference(replace(model, c=model.c + beyond * direction))[0] == UNBOUNDED
+    elif result.status == OPTIMAL:
+        assert result.segments[-1].upper == np.inf
+        assert reference(replace(model, c=model.c + 1e6 * direction))[0] == OPTIMAL
+    else:
+        # Tidak terbatas sejak t = start
+        assert reference(model)[0] == UNBOUNDED and result.segments == []
+
+
+def test_becomes_unbounded_after_breakpoint():
+    # max (t - 1) x1 + x2, x2 <= 1: terbatas hanya untuk t <= 1
+    model = LinearProgram(c=[-1.0, 1.0], A=[[0.0, 1.0]], senses=[LE], b=[1.0], maximize=True)
+    result = parametric_objective(model, [1.0, 0.0])
+    assert result.status == UNBOUNDED
+    assert result.segments[-1].upper == pytest.approx(1.0)
+    assert np.allclose(result.segments[-1].x, [0, 1])
+
+
+def test_direction_must_match_variables():
+    model = random_lp(np.random.default_rng(0), 2, 3)
+    with pytest.raises(ValueError):
+        parametric_objective(model, [1.0, 0.0])
+
+
+def test_profit_frontier_rows_cover_all_p1():
+    rows, result = profit_frontier(PARAMETERS)
+    assert result.status == OPTIMAL
+    assert rows[0]["p1_from"] == 0 and rows[-1]["p1_to"] == np.inf
+    assert any(row["current"] for row in rows)
+    for row in rows:
+        assert row["ratio_from"] == pytest.approx(row["p1_from"] / PARAMETERS["p2"])
+        p1 = row["p1_from"] + 1.0 if row["p1_to"] == np.inf else (row["p1_from"] + row["p1_to"]) / 2
+        solution = solve_production(dict(PARAMETERS, p1=p1), sensitivity=False)
+        assert np.allclose((row["x1"], row["x2"]), solution["optimal_point"])
+        assert row["profit_from"] == pytest.approx(row["p1_from"] * row["x1"] + PARAMETERS["p2"] * row["x2"])
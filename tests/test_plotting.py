@@ -0,0 +1,39 @@
+"""Render grafik dua tingkat: pratinjau SVG dan ekspor PNG 300 dpi."""
+from io import BytesIO
+import xml.etree.ElementTree as ET
+
+from PIL import Image
+import pytest
+
+from plotting import EXPORT_DPI, FIGSIZE, render_export, render_preview
+from production import solve_production
+
+PARAMETERS = {'p1': 120000, 't1': 3, 'max1': 30, 'p2': 80000, 't2': 2, 'max2': 40, 'total_time': 120}
+
+
+@pytest.fixture(scope="module")
+def optimal_point():
+    return solve_production(PARAMETERS, sensitivity=False)['optimal_point']
+
+
+def test_preview_is_valid_svg(optimal_point):
+    svg, seconds = render_preview(PARAMETERS, optimal_point)
+    assert isinstance(svg, str) and seconds >= 0
+    root = ET.fromstring(svg)
+    assert root.tag.endswith("svg")
+    assert "3x₁ + 2x₂ ≤ 120" in svg  # Label kendala ikut digambar
+
+
+def test_export_png_is_high_resolution(optimal_point):
+    png, seconds = render_export(PARAMETERS, optimal_point)
+    assert png.startswith(b"\x89PNG") and seconds > 0
+    image = Image.open(BytesIO(png))
+    assert image.info["dpi"][0] == pytest.approx(EXPORT_DPI, abs=1)
+    # bbox_inches="tight" memangkas tepi, tetapi ukurannya tetap mendekati figsize x dpi
+    assert image.width > 0.8 * FIGSIZE[0] * EXPORT_DPI
+
+
+def test_degenerate_parameters_still_render():
+    parameters = dict(PARAMETERS, max1=0, max2=0)
+    svg, _ = render_preview(parameters, (0.0, 0.0))
+    ET.fromstring(svg)
@@ -0,0 +1,77 @@
+"""Presolve + postsolve dibandingkan dengan solve langsung dan linprog."""
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from presolve import presolve, solve_presolved
+from solver import COLD_START, EQ, GE, INFEASIBLE, LE, OPTIMAL, UNBOUNDED, LinearProgram, solve_from_basis, solve_lp
+from tests.lp_cases import assert_feasible, random_lp, reference
+
+
+def _reducible(rng, m, n):
+    """Model acak ditambah baris singleton, baris kosong, dan kolom kosong"""
+    model = random_lp(rng, m, n, maximize=bool(rng.integers(2)))
+    A = model.A.toarray()
+    k = rng.integers(1, n + 1)
+    columns = rng.choice(n, k)
+    singletons = np.zeros((k, n))
+    singletons[np.arange(k), columns] = rng.integers(1, 4, k)
+    singleton_b = singletons.sum(axis=1) * rng.integers(3, 9, k)  # x_j <= 3..8, longgar untuk x0
+    A = np.vstack([A, singletons, np.zeros((1, n))])
+    A = np.hstack([A, np.zeros((A.shape[0], 1))])
+    A[-1, -1] = 0
+    senses = np.concatenate([model.senses, [LE] * k, [GE]])
+    b = np.concatenate([model.b, singleton_b + 10, [0]])
+    c = np.append(model.c, -1 if model.maximize else 1)  # Kolom kosong yang tidak menguntungkan
+    return LinearProgram(c=c, A=A, senses=senses, b=b, maximize=model.maximize)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_presolved_solution_matches_direct_solve(seed):
+    rng = np.random.default_rng(1700 + seed)
+    model = _reducible(rng, rng.integers(1, 7), rng.integers(1, 7))
+    result, reduction = solve_presolved(model)
+    assert reduction.rows_removed >= 1 and reduction.cols_removed >= 1
+    status, objective, _ = reference(model)
+    assert result.status == status == OPTIMAL
+    assert result.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+    assert_feasible(model, result.x)
+    # Dual hasil postsolve memenuhi dualitas kuat pada model asli
+    assert model.b @ result.duals == pytest.approx(objective, rel=1e-6, abs=1e-6)
+    if result.basis.size:
+        # Basis hasil postsolve sudah optimal (basis berisi artifisial baris = diselesaikan dari awal)
+        warm = solve_from_basis(model, result.basis)
+        assert warm.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+        assert warm.method == COLD_START or warm.iterations == 0
+
+
+@pytest.mark.parametrize("model, status", [
+    (LinearProgram(c=[1, 1], A=[[1, 0], [1, 0], [1, 1]], senses=[LE, GE, LE], b=[1, 2, 5]), INFEASIBLE),
+    (LinearProgram(c=[1], A=[[0]], senses=[GE], b=[1]), INFEASIBLE),
+    (LinearProgram(c=[1, 2], A=[[1, 0]], senses=[LE], b=[3]), UNBOUNDED),
+])
+def test_status_detected_before_solving(model, status):
+    reduction = presolve(model)
+    assert reduction.status == status and reduction.message
+    result, _ = solve_presolved(model, solve=lambda reduced: pytest.fail("model tidak perlu diselesaikan"))
+    assert result.status == status == reference(model)[0]
+
+
+def test_fixed_variables_are_substituted():
+    model = LinearProgram(c=[2, 3, 1], A=[[1, 0, 0], [1, 1, 1], [0, 1, 0]], senses=[EQ, LE, LE], b=[2, 10, 4],
+                          maximize=True)
+    result, reduction = solve_presolved(model)
+    assert result.x[0] == 2 and result.objective == pytest.approx(reference(model)[1])
+    assert reduction.cols_removed >= 1
+    assert "dihapus" in reduction.summary()
+
+
+def test_scaling_keeps_badly_scaled_models_exact():
+    rng = np.random.default_rng(9)
+    model = random_lp(rng, 6, 5, senses=(LE, GE))
+    scale = 10.0 ** rng.integers(-4, 5, model.num_constraints)
+    scaled = LinearProgram(c=model.c, A=sp.diags(scale) @ model.A, senses=model.senses, b=model.b * scale,
+                           maximize=model.maximize)
+    result, reduction = solve_presolved(scaled)
+    assert reduction.row_scale is not None
+    assert result.objective == pytest.approx(solve_lp(model).objective, rel=1e-9, abs=1e-9)
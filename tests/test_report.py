@@ -0,0 +1,60 @@
+"""Laporan PDF di memori dan ekspor batch (PDF multi-halaman, ZIP)."""
+from io import BytesIO
+from pathlib import Path
+import re
+import zipfile
+
+import pytest
+
+from production import solve_production
+from report import create_pdf_report, write_batch_pdf, write_batch_zip
+
+PARAMETERS = {'p1': 120000, 't1': 3, 'max1': 30, 'p2': 80000, 't2': 2, 'max2': 40, 'total_time': 120}
+PNG = (Path(__file__).resolve().parent.parent / "assets" / "logo.png").read_bytes()
+
+
+def _pages(pdf: bytes) -> int:
+    return len(re.findall(rb"/Type /Page\b", pdf))
+
+
+def test_single_report_with_plot_and_sensitivity():
+    solution = solve_production(PARAMETERS)
+    pdf = create_pdf_report(solution['optimal_point'], solution['optimal_value'], PARAMETERS, PNG,
+                            solution['sensitivity'])
+    assert pdf.startswith(b"%PDF") and pdf.rstrip().endswith(b"%%EOF")
+    assert _pages(pdf) >= 1
+
+
+@pytest.mark.parametrize("count", [0, 1, 7])
+def test_batch_pdf_has_one_page_per_scenario(count):
+    scenarios = ((dict(PARAMETERS, p1=1000 + i), (1.0, 2.0), 3.0) for i in range(count))
+    pdf = write_batch_pdf(scenarios, BytesIO()).getvalue()
+    assert pdf.startswith(b"%PDF")
+    assert _pages(pdf) == count
+
+
+def test_batch_pdf_reads_scenarios_while_building():
+    # Skenario diambil dari generator sambil dokumen ditata, bukan dikumpulkan dulu
+    events = []
+
+    def scenarios():
+        for i in range(6):
+            events.append(("baca", i))
+            yield dict(PARAMETERS, p1=i), (1.0, 2.0), 3.0
+
+    def render(parameters, optimal_point):
+        events.append(("grafik", parameters['p1']))
+        return PNG
+
+    write_batch_pdf(scenarios(), BytesIO(), render)
+    assert events.index(("grafik", 0)) < events.index(("baca", 3))
+    assert sorted(events) == sorted([("baca", i) for i in range(6)] + [("grafik", i) for i in range(6)])
+
+
+def test_batch_zip_contains_one_pdf_per_scenario():
+    scenarios = [(dict(PARAMETERS, p1=1000 + i), (1.0, 2.0), 3.0) for i in range(3)]
+    buffer = write_batch_zip(iter(scenarios), BytesIO(), lambda parameters, point: PNG)
+    with zipfile.ZipFile(buffer) as archive:
+        names = archive.namelist()
+        assert names == ["laporan_00001.pdf", "laporan_00002.pdf", "laporan_00003.pdf"]
+        assert all(archive.read(name).startswith(b"%PDF") for name in names)
@@ -0,0 +1,181 @@
+"""Result store kolumnar: append, memory-map, filter, agregasi, dan ekspor CSV."""
+from io import BytesIO
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import resultstore
+from batch import CORNER_LABELS, PARAMETER_NAMES, solve_two_product_batch
+from resultstore import COLUMNS, HEADER_SIZE, ResultFilter, ResultSetExpired, ResultStore, prune, results_root
+
+
+def _scenarios(rng, size):
+    return (rng.uniform(1e4, 2e5, size), rng.uniform(1, 6, size), rng.uniform(5, 60, size),
+            rng.uniform(1e4, 2e5, size), rng.uniform(1, 6, size), rng.uniform(5, 60, size),
+            rng.uniform(50, 300, size))
+
+
+def _synthetic(rng, size):
+    """Kolom acak tanpa solve (untuk data yang melewati beberapa potongan CHUNK_ROWS)"""
+    columns = {name: rng.uniform(0, 100, size) for name in COLUMNS}
+    columns["titik"] = rng.integers(0, len(CORNER_LABELS), size)
+    return columns
+
+
+@pytest.fixture
+def solved(tmp_path):
+    rng = np.random.default_rng(0)
+    store = ResultStore(tmp_path / "sweep")
+    parts = []
+    for size in (100, 1, 250):
+        parameters = _scenarios(rng, size)
+        result = solve_two_product_batch(*parameters)
+        store.append_batch(parameters, result)
+        parts.append((parameters, result))
+    expected = {name: np.concatenate([p[0][k] for p in parts]) for k, name in enumerate(PARAMETER_NAMES)}
+    expected["x1"] = np.concatenate([r.optimal_point[:, 0] for _, r in parts])
+    expected["x2"] = np.concatenate([r.optimal_point[:, 1] for _, r in parts])
+    expected["Z"] = np.concatenate([r.optimal_value for _, r in parts])
+    expected["titik"] = np.concatenate([r.optimal_index for _, r in parts])
+    return store, expected
+
+
+def test_columns_round_trip_through_npy_files(solved):
+    store, expected = solved
+    assert len(store) == 351 and not store.complete
+    for name in COLUMNS:
+        assert np.array_equal(store.column(name), expected[name])
+        # File .npy biasa: terbaca tanpa result store dan tanpa memory-map
+        assert np.array_equal(np.load(store.path / f"{name}.npy"), expected[name])
+    store.finish()
+    reopened = ResultStore(store.path)
+    assert len(reopened) == 351 and reopened.complete
+    assert isinstance(reopened.column("Z"), np.memmap)
+
+
+def test_interrupted_append_is_overwritten(solved):
+    store, expected = solved
+    with open(store.path / "Z.npy", "ab") as f:
+        f.write(b"\x00" * 80)  # Sisa append yang terputus sebelum meta.json diperbarui
+    assert np.array_equal(ResultStore(store.path).column("Z"), expected["Z"])
+    extra = {name: expected[name][:3] for name in COLUMNS}
+    assert store.append(extra) == 354
+    assert os.path.getsize(store.path / "Z.npy") == HEADER_SIZE + 354 * 8
+    assert np.array_equal(np.load(store.path / "Z.npy"), np.concatenate([expected["Z"], expected["Z"][:3]]))
+
+
+def test_append_validates_columns(tmp_path):
+    store = ResultStore(tmp_path / "x")
+    columns = _synthetic(np.random.default_rng(0), 4)
+    with pytest.raises(ValueError, match="tidak lengkap"):
+        store.append({name: columns[name] for name in COLUMNS[:-1]})
+    with pytest.raises(ValueError, match="sama panjang"):
+        store.append(dict(columns, Z=columns["Z"][:2]))
+    assert len(store) == 0 and store.page(0, 10)["Z"].size == 0
+
+
+@pytest.mark.parametrize("where", [None, ResultFilter(), ResultFilter(("B", "E")),
+                                   ResultFilter(z_min=30.0, z_max=60.0), ResultFilter(("A",), z_min=90.0)])
+def test_page_and_aggregate_across_chunks(tmp_path, where):
+    rng = np.random.default_rng(1)
+    store = ResultStore(tmp_path / "besar")
+    columns = _synthetic(rng, resultstore.CHUNK_ROWS + 5000)
+    columns["Z"][:10] = np.nan
+    store.append(columns)
+
+    keep = np.ones(len(store), dtype=bool) if where is None else where.mask(columns)
+    for offset, limit in ((0, 7), (resultstore.CHUNK_ROWS // 3, 5000), (int(keep.sum()) - 3, 10)):
+        page = store.page(offset, limit, where)
+        for name in COLUMNS:
+            assert np.array_equal(page[name], columns[name][keep][offset:offset + limit], equal_nan=True)
+
+    summary = store.aggregate(where)
+    values = columns["Z"][keep]
+    assert summary["count"] == keep.sum()
+    assert summary["min"] == np.nanmin(values) and summary["max"] == np.nanmax(values)
+    assert summary["mean"] == pytest.approx(np.nansum(values) / keep.sum())
+    assert summary["corners"] == dict(zip(CORNER_LABELS, np.bincount(columns["titik"][keep], minlength=5).tolist()))
+
+
+def test_csv_export_to_path_and_file_object(solved, tmp_path):
+    store, expected = solved
+    where = ResultFilter(("C",))
+    path = store.write_csv(tmp_path / "hasil.csv", where)
+    buffer = BytesIO()
+    assert store.write_csv(buffer, where) is buffer
+    assert path.read_bytes() == buffer.getvalue()
+
+    table = pd.read_csv(path)
+    keep = expected["titik"] == CORNER_LABELS.index("C")
+    assert list(table.columns) == list(COLUMNS)
+    assert (table["titik"] == "C").all() and len(table) == keep.sum()
+    for name in COLUMNS[:-1]:
+        assert np.allclose(table[name], expected[name][keep], rtol=1e-11)
+    chunked = "".join(store.iter_csv(where, chunk_rows=7))
+    assert chunked.encode() == buffer.getvalue()
+
+
+def test_prune_and_results_root(tmp_path, monkeypatch):
+    for k in range(5):
+        store = ResultStore(tmp_path / f"set{k}")
+        os.utime(store.path / "meta.json", (k, k))
+    (tmp_path / "lain").mkdir()
+    prune(tmp_path, keep=2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["lain", "set3", "set4"]
+    prune(tmp_path / "tidak-ada")
+
+    ResultStore(tmp_path / "set3")  # Membuka = akses: set4 kini yang paling lama tidak dipakai
+    prune(tmp_path, keep=1)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["lain", "set3"]
+
+    monkeypatch.setenv("RESULTS_DIR", str(tmp_path))
+    assert results_root() == tmp_path
+    monkeypatch.delenv("RESULTS_DIR")
+    assert results_root() == resultstore.DEFAULT_ROOT
+
+
+def _filled(path, rng):
+    store = ResultStore(path)
+    store.append(_synthetic(rng, 20))
+    store.finish()
+    return store
+
+
+def test_prune_while_reading(tmp_path):
+    rng = np.random.default_rng(2)
+    a = _filled(tmp_path / "a", rng)
+    os.utime(a.path / "meta.json", (1, 1))
+    for k in range(8):
+        _filled(tmp_path / f"baru{k}", rng)
+    prune(tmp_path, keep=8)
+    assert not a.path.exists()
+    with pytest.raises(ResultSetExpired, match="kedaluwarsa"):
+        a.page(0, 10)
+    with pytest.raises(ResultSetExpired):
+        a.write_csv(BytesIO())
+    with pytest.raises(ResultSetExpired):
+        a.write_csv(tmp_path / "hasil.csv")
+    assert not (tmp_path / "hasil.csv").exists()
+    with pytest.raises(ResultSetExpired):
+        a.aggregate()
+    # Dibuka ulang: result set baru yang kosong dan belum selesai (pemanggil menghitung ulang)
+    assert not ResultStore(a.path).complete
+
+
+def test_prune_by_last_access_and_protect(tmp_path):
+    rng = np.random.default_rng(3)
+    sets = [_filled(tmp_path / f"set{k}", rng) for k in range(4)]
+    for k, store in enumerate(sets):
+        os.utime(store.path / "meta.json", (k, k))
+    sets[0].page(0, 5)          # Paging memperbarui akses terakhir
+    sets[1].write_csv(BytesIO())  # Ekspor juga
+    prune(tmp_path, keep=2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["set0", "set1"]
+
+    os.utime(sets[0].path / "meta.json", (1, 1))
+    prune(tmp_path, keep=1, protect=[sets[0].path])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["set0"]
+    prune(tmp_path, keep=0, protect=[tmp_path / "set0"])
+    assert sets[0].page(0, 5)["Z"].size == 5
@@ -0,0 +1,88 @@
+"""Harga bayangan dan rentang sensitivitas dari basis optimal."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from solver import GE, LE, LinearProgram, sensitivity_analysis, solve_lp, two_product_model
+
+
+def _nondegenerate_lp(rng, m, n, maximize):
+    """Model dengan data kontinu acak (praktis tidak pernah degenerate)"""
+    A = rng.uniform(0.5, 5, (m, n))
+    x0 = rng.uniform(0, 3, n)
+    senses = np.where(rng.random(m) < 0.3, GE, LE)
+    b = np.where(senses == GE, A @ x0 * rng.uniform(0.3, 0.9, m), A @ x0 * rng.uniform(1.1, 2, m))
+    A = np.vstack([A, np.ones(n)])
+    b = np.append(b, 4 * n)
+    return LinearProgram(c=rng.uniform(1, 10, n), A=A, senses=np.append(senses, LE), b=b, maximize=maximize)
+
+
+def _cases(count):
+    for seed in range(count):
+        rng = np.random.default_rng(seed)
+        model = _nondegenerate_lp(rng, rng.integers(2, 7), rng.integers(2, 7), maximize=bool(seed % 2))
+        result = solve_lp(model)
+        assert result.success
+        yield model, result, sensitivity_analysis(model, result)
+
+
+def test_shadow_prices_match_linprog_marginals():
+    for model, result, report in _cases(40):
+        sign = -1.0 if model.maximize else 1.0
+        A = model.A.toarray()
+        le = np.where(model.senses == LE, 1.0, -1.0)
+        reference = linprog(sign * model.c, A_ub=A * le[:, None], b_ub=model.b * le, bounds=(0, None), method="highs")
+        assert np.allclose(report.shadow_prices, sign * reference.ineqlin.marginals * le, atol=1e-7)
+
+
+def test_objective_is_linear_inside_rhs_range():
+    for model, result, report in _cases(40):
+        for i in range(model.num_constraints):
+            lower, upper = report.rhs_lower[i], report.rhs_upper[i]
+            assert lower <= model.b[i] <= upper
+            for target in (lower, upper):
+                if not np.isfinite(target):
+                    target = model.b[i] + np.sign(target) * 5.0
+                b = model.b.copy()
+                b[i] = model.b[i] + 0.9 * (target - model.b[i])
+                moved = solve_lp(replace(model, b=b))
+                expected = result.objective + report.shadow_prices[i] * (b[i] - model.b[i])
+                assert moved.objective == pytest.approx(expected, rel=1e-7, abs=1e-7)
+
+
+def test_solution_unchanged_inside_objective_range_and_changes_outside():
+    for model, result, report in _cases(40):
+        for j in range(model.num_vars):
+            lower, upper = report.objective_lower[j], report.objective_upper[j]
+            assert lower <= model.c[j] <= upper
+            for bound in (lower, upper):
+                if np.isfinite(bound):
+                    c = model.c.copy()
+                    c[j] = model.c[j] + 0.9 * (bound - model.c[j])
+                    inside = solve_lp(replace(model, c=c))
+                    assert inside.objective == pytest.approx(c @ result.x, rel=1e-7, abs=1e-7)
+                    # Sedikit di luar rentang basis lama tidak lagi optimal
+                    c[j] = bound + 0.1 * (bound - model.c[j]) + np.sign(bound - model.c[j]) * 1e-3
+                    outside = solve_lp(replace(model, c=c))
+                    better = outside.objective - c @ result.x
+                    assert (better if model.maximize else -better) > 1e-9
+
+
+def test_two_product_report():
+    model = two_product_model(120000, 3, 30, 80000, 2, 40, 120)
+    result = solve_lp(model)
+    report = sensitivity_analysis(model, result)
+    rows = {row["Kendala"]: row for row in report.constraint_table()}
+    assert rows["Waktu produksi"]["Harga bayangan"] == pytest.approx(40000)
+    assert rows["Permintaan produk 2"]["Harga bayangan"] == pytest.approx(0)
+    assert rows["Permintaan produk 2"]["Slack"] == pytest.approx(25)
+    assert rows["Permintaan produk 2"]["Batas atas"] == np.inf
+    assert [row["Variabel"] for row in report.variable_table()] == ["x1", "x2"]
+
+
+def test_requires_optimal_result():
+    model = LinearProgram(c=[1, 1], A=[[1, 1], [1, 1]], senses=[LE, GE], b=[1, 3])
+    with pytest.raises(ValueError):
+        sensitivity_analysis(model, solve_lp(model))
@@ -0,0 +1,119 @@
+"""Revised simplex (``solver.solve_lp``) dibandingkan dengan linprog."""
+from dataclasses import replace
+import time
+
+import numpy as np
+import pytest
+
+from solver import (
+    EQ, GE, INFEASIBLE, ITERATION_LIMIT, LE, OPTIMAL, UNBOUNDED, WARM_DUAL,
+    LinearProgram, resolve_lp, solve_lp, two_product_model,
+)
+from tests.lp_cases import assert_feasible, random_lp, reference
+
+
+def test_two_product_model():
+    result = solve_lp(two_product_model(120000, 3, 30, 80000, 2, 40, 120))
+    assert result.status == OPTIMAL
+    assert np.allclose(result.x, [30, 15])
+    assert result.objective == pytest.approx(4_800_000)
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_random_models_match_linprog(seed):
+    rng = np.random.default_rng(seed)
+    m, n = rng.integers(1, 9), rng.integers(1, 9)
+    model = random_lp(rng, m, n, maximize=bool(seed % 2))
+    result = solve_lp(model)
+    status, objective, _ = reference(model)
+    assert result.status == status == OPTIMAL
+    assert result.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+    assert_feasible(model, result.x)
+    # Basis berisi m kolom berbeda
+    assert len(set(result.basis.tolist())) == model.num_constraints
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_unbounded_or_optimal_without_bound_row(seed):
+    rng = np.random.default_rng(100 + seed)
+    model = random_lp(rng, 4, 5, maximize=True, bounded=False)
+    result = solve_lp(model)
+    status, objective, _ = reference(model)
+    assert result.status == status
+    if status == OPTIMAL:
+        assert result.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+
+
+def test_infeasible():
+    model = LinearProgram(c=[1, 1], A=[[1, 1], [1, 1]], senses=[LE, GE], b=[1, 3])
+    result = solve_lp(model)
+    assert result.status == INFEASIBLE
+    assert not result.success
+    assert np.isnan(result.objective)
+
+
+def test_unbounded():
+    model = LinearProgram(c=[1, 0], A=[[1, -1]], senses=[LE], b=[1])
+    assert solve_lp(model).status == UNBOUNDED
+
+
+def test_negative_rhs_and_equality():
+    # x1 - x2 = -2 (ruas kanan negatif dibalik di bentuk standar), x1 + x2 <= 6
+    model = LinearProgram(c=[1, 1], A=[[1, -1], [1, 1]], senses=[EQ, LE], b=[-2, 6])
+    result = solve_lp(model)
+    assert result.status == OPTIMAL
+    assert result.objective == pytest.approx(6)
+    assert result.x[1] - result.x[0] == pytest.approx(2)
+
+
+def test_refactor_interval_does_not_change_solution():
+    # Eta-file panjang (refaktor jarang) dan refaktor setiap pivot harus sama hasilnya
+    rng = np.random.default_rng(7)
+    model = random_lp(rng, 40, 30)
+    every = solve_lp(model, refactor_every=1)
+    rarely = solve_lp(model, refactor_every=1000)
+    assert every.status == rarely.status == OPTIMAL
+    assert every.objective == pytest.approx(rarely.objective, rel=1e-9)
+    assert every.objective == pytest.approx(reference(model)[1], rel=1e-7)
+
+
+def test_sense_aliases_and_shape_checks():
+    model = LinearProgram(c=[1, 2], A=[[1, 1], [1, 0]], senses=["L", ">"], b=[4, 1])
+    assert model.senses.tolist() == [LE, GE]
+    with pytest.raises(ValueError):
+        LinearProgram(c=[1], A=[[1, 1]], senses=[LE], b=[1])
+    with pytest.raises(ValueError):
+        LinearProgram(c=[1, 1], A=[[1, 1]], senses=[LE, LE], b=[1])
+    with pytest.raises(ValueError):
+        LinearProgram(c=[1, 1], A=[[1, 1]], senses=["<>"], b=[1])
+
+
+def test_iteration_limit():
+    result = solve_lp(two_product_model(120000, 3, 30, 80000, 2, 40, 120), max_iter=1)
+    assert result.status == ITERATION_LIMIT
+
+
+@pytest.mark.parametrize("seed", range(2))
+def test_degenerate_500x200_is_solved_in_few_pivots(seed):
+    # Banyak kendala = dan kendala ketat di x0: sangat degenerate (dulu ribuan pivot, beberapa detik)
+    model = random_lp(np.random.default_rng(seed), 500, 200, density=0.3)
+    start = time.perf_counter()
+    result = solve_lp(model)
+    seconds = time.perf_counter() - start
+    assert result.status == OPTIMAL
+    assert result.objective == pytest.approx(reference(model)[1], rel=1e-7)
+    assert result.iterations <= 2 * (model.num_constraints + model.num_vars)
+    assert seconds < 5.0
+
+
+def test_degenerate_dual_simplex_after_rhs_change():
+    rng = np.random.default_rng(0)
+    model = random_lp(rng, 500, 200, density=0.3)
+    base = solve_lp(model)
+    # Kendala dilonggarkan tanpa mengubah tanda b: basis lama tetap optimal secara dual
+    relax = rng.uniform(0, 0.5, model.b.size) * np.abs(model.b)
+    edited = replace(model, b=model.b + np.where(model.senses == LE, relax, np.where(model.senses == GE, -relax, 0)))
+    result = resolve_lp(edited, model, base.basis)
+    assert result.method == WARM_DUAL
+    assert result.objective == pytest.approx(reference(edited)[1], rel=1e-7)
+    assert result.iterations <= model.num_constraints
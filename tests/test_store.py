@@ -0,0 +1,104 @@
+"""Round trip ScenarioStore: solusi lengkap sebagai JSON di SQLite."""
+from dataclasses import fields
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+import store
+from production import solve_production
+from solver import SensitivityReport
+from store import ScenarioStore, dump_solution, load_solution
+
+PARAMETERS = {"p1": 120000, "t1": 3, "max1": 30, "p2": 80000, "t2": 2, "max2": 40, "total_time": 120}
+
+
+def _assert_same(expected, actual):
+    """Perbandingan rekursif yang juga menjaga tipe tuple/array/SensitivityReport"""
+    if isinstance(expected, SensitivityReport):
+        assert isinstance(actual, SensitivityReport)
+        for field in fields(expected):
+            _assert_same(getattr(expected, field.name), getattr(actual, field.name))
+    elif isinstance(expected, np.ndarray):
+        assert isinstance(actual, np.ndarray)
+        assert np.array_equal(expected, actual, equal_nan=expected.dtype.kind == "f")
+    elif isinstance(expected, dict):
+        assert expected.keys() == actual.keys()
+        for key in expected:
+            _assert_same(expected[key], actual[key])
+    elif isinstance(expected, (list, tuple)):
+        assert type(actual) is type(expected) and len(actual) == len(expected)
+        for a, b in zip(expected, actual):
+            _assert_same(a, b)
+    else:
+        assert expected == actual or (expected != expected and actual != actual)
+
+
+@pytest.fixture
+def scenario_store(tmp_path):
+    scenarios = ScenarioStore(tmp_path / "skenario.sqlite3")
+    yield scenarios
+    scenarios.close()
+
+
+@pytest.mark.parametrize("integer", [False, True])
+def test_solution_json_round_trip(integer):
+    solution = solve_production(dict(PARAMETERS, total_time=123), integer=integer)
+    text = dump_solution(solution)
+    json.loads(text)  # Teks JSON biasa, bukan pickle
+    _assert_same(solution, load_solution(text))
+
+
+def test_unknown_values_are_rejected():
+    with pytest.raises(TypeError):
+        dump_solution({"corners": [], "x": object()})
+
+
+def test_save_get_load_and_upsert(scenario_store):
+    solution = solve_production(PARAMETERS)
+    first = scenario_store.save(PARAMETERS, False, solution, b"png")
+    stored = scenario_store.get(dict(PARAMETERS, p1=120000.0), False)
+    assert stored.id == first and stored.preview_png == b"png"
+    assert stored.optimal_point == (30, 15) and stored.optimal_label == "C"
+    _assert_same(solution, stored.solution)
+    assert scenario_store.get(PARAMETERS, True) is None
+
+    # Simpan ulang parameter yang sama: baris sama, pratinjau lama dipertahankan
+    assert scenario_store.save(PARAMETERS, False, solution) == first
+    assert len(scenario_store) == 1 and scenario_store.load(first).preview_png == b"png"
+
+    other = scenario_store.save(dict(PARAMETERS, total_time=90), True, solve_production(dict(PARAMETERS, total_time=90), integer=True))
+    assert [s.id for s in scenario_store.recent()] == [other, first]
+    assert scenario_store.recent(limit=1)[0].solution is None
+    scenario_store.delete(other)
+    assert scenario_store.load(other) is None and len(scenario_store) == 1
+    scenario_store.clear()
+    assert len(scenario_store) == 0
+
+
+def test_persists_across_connections(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCENARIO_DB", str(tmp_path / "env.sqlite3"))
+    first = ScenarioStore()
+    first.save(PARAMETERS, False, solve_production(PARAMETERS))
+    first.close()
+    second = ScenarioStore()
+    assert second.path == tmp_path / "env.sqlite3"
+    assert second.get(PARAMETERS, False).optimal_value == 4_800_000
+    second.close()
+
+
+def test_legacy_pickle_rows_are_dropped(tmp_path):
+    path = tmp_path / "lama.sqlite3"
+    scenarios = ScenarioStore(path)
+    scenarios.save(PARAMETERS, False, solve_production(PARAMETERS))
+    scenarios.close()
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE scenarios SET solution = ?", (b"\x80\x04blob-pickle",))
+        conn.execute("PRAGMA user_version = 0")
+
+    reopened = ScenarioStore(path)
+    assert len(reopened) == 0 and reopened.get(PARAMETERS, False) is None
+    reopened.close()
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == store.SCHEMA_VERSION
@@ -0,0 +1,89 @@
+"""Solve ulang dari basis sebelumnya dibandingkan dengan linprog."""
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from production import solve_production
+from solver import (
+    COLD_START, OPTIMAL, WARM_DUAL, WARM_DUAL_PRIMAL, WARM_PRIMAL,
+    resolve_lp, solve_from_basis, solve_lp,
+)
+from tests.lp_cases import assert_feasible, random_lp, reference
+
+PARAMETERS = {"p1": 120000, "t1": 3, "max1": 30, "p2": 80000, "t2": 2, "max2": 40, "total_time": 120}
+
+
+def _edits(model, rng):
+    b = model.b * rng.uniform(0.7, 1.3, model.b.size)
+    c = model.c + rng.integers(-3, 4, model.c.size)
+    return {
+        WARM_DUAL: replace(model, b=b),
+        WARM_PRIMAL: replace(model, c=c),
+        WARM_DUAL_PRIMAL: replace(model, b=b, c=c),
+    }
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_resolve_matches_linprog(seed):
+    rng = np.random.default_rng(1200 + seed)
+    model = random_lp(rng, rng.integers(2, 8), rng.integers(2, 8), maximize=bool(seed % 2))
+    base = solve_lp(model)
+    assert base.status == OPTIMAL
+    for method, edited in _edits(model, rng).items():
+        result = resolve_lp(edited, model, base.basis)
+        status, objective, _ = reference(edited)
+        assert result.status == status
+        if status != OPTIMAL:
+            continue
+        assert result.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+        assert_feasible(edited, result.x)
+        # Basis artifisial (kendala = atau >= yang aktif) memaksa solve dari awal
+        assert result.method in (method, COLD_START)
+
+
+def test_unchanged_model_needs_no_pivots():
+    model = random_lp(np.random.default_rng(1), 5, 6, senses=("<=",))
+    base = solve_lp(model)
+    again = resolve_lp(model, model, base.basis)
+    assert again.iterations == 0 and again.objective == pytest.approx(base.objective)
+    assert solve_from_basis(model, base.basis).iterations == 0
+
+
+def test_structure_change_falls_back_to_cold_start():
+    model = random_lp(np.random.default_rng(2), 4, 4, senses=("<=",))
+    base = solve_lp(model)
+    edited = replace(model, A=model.A * 2)
+    result = resolve_lp(edited, model, base.basis)
+    assert result.method == COLD_START
+    assert result.objective == pytest.approx(reference(edited)[1])
+    assert resolve_lp(model, model, None).method == COLD_START
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_solve_from_neighbouring_basis(seed):
+    rng = np.random.default_rng(1300 + seed)
+    model = random_lp(rng, 5, 5, senses=("<=",))
+    other = replace(model, c=model.c + rng.integers(-4, 5, model.c.size))
+    result = solve_from_basis(model, solve_lp(other).basis)
+    status, objective, _ = reference(model)
+    assert result.status == status == OPTIMAL
+    assert result.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+
+
+def test_invalid_basis_is_solved_from_scratch():
+    model = random_lp(np.random.default_rng(3), 4, 4, senses=("<=",))
+    result = solve_from_basis(model, [0, 0, 1, 2])
+    assert result.method == COLD_START and result.status == OPTIMAL
+
+
+def test_production_warm_start_uses_previous_basis():
+    first = solve_production(PARAMETERS)
+    for edit, method in (({"total_time": 100}, WARM_DUAL), ({"p1": 50000}, WARM_PRIMAL),
+                         ({"total_time": 100, "p1": 50000}, WARM_DUAL_PRIMAL)):
+        parameters = dict(PARAMETERS, **edit)
+        warm = solve_production(parameters, warm_start=(PARAMETERS, first["basis"]))
+        cold = solve_production(parameters)
+        assert warm["method"] == method and cold["method"] == COLD_START
+        assert warm["optimal_value"] == pytest.approx(cold["optimal_value"])
+        assert np.allclose(warm["optimal_point"], cold["optimal_point"])